@@ -18,7 +18,8 @@ from core.services.logging_setup import setup_logging  # noqa: E402
 setup_logging("basic")
 
 try:
-    from ui.state import init_state
+    from core.services.cache_warmer import start_cache_warmer
+    from ui.state import init_state, ui_session_state
     from ui.sidebar import render_sidebar
     from ui.tabs import about, market_sector_overview, ai_desk
 except ImportError as e:
@@ -46,6 +47,13 @@ st.set_page_config(
 
 try:
     init_state()
+    start_cache_warmer(
+        tuple(
+            ui_session_state()
+            .market_analysis_config["core_indicators"]
+            .get("indicators", [])
+        )
+    )
     with st.sidebar:
         render_sidebar(INDEX_PATH)
 
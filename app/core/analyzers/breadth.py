@@ -0,0 +1,325 @@
+"""
+Market breadth over large stock universes.
+
+This module measures how broadly a move is shared across a universe of
+stocks rather than how far a handful of ETFs moved. Prices are held in a
+compact float32 (sessions x symbols) matrix; the full history is computed
+once with vectorized NumPy, and each new bar afterwards only touches the
+trailing window needed for the longest moving average or high/low
+lookback, so updates stay well below a millisecond for 500+ names.
+
+Breadth measures per session:
+- pct_above_<n>: percent of names trading above their n-day moving average
+- advances / declines: names closing up / down on the session
+- ad_line: cumulative advances minus declines
+- new_highs / new_lows: names at a high_low_window-session high / low
+
+Names are eligible for a measure only once they have enough history for
+it, so late listings do not distort the percentages.
+"""
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+MA_WINDOWS = (50, 200)
+HIGH_LOW_WINDOW = 252
+
+
+def _percent(count: np.ndarray, eligible: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(eligible > 0, 100.0 * count / eligible, np.nan)
+
+
+class BreadthEngine:
+    """
+    Incrementally updated breadth measures for a fixed symbol universe.
+    """
+
+    def __init__(
+        self,
+        close: pd.DataFrame,
+        ma_windows: tuple[int, ...] = MA_WINDOWS,
+        high_low_window: int = HIGH_LOW_WINDOW,
+    ) -> None:
+        """
+        Build breadth history from a close-price panel.
+
+        Parameters
+        ----------
+        close : pd.DataFrame
+            Close prices indexed by date, one column per symbol
+        ma_windows : tuple[int, ...], default (50, 200)
+            Moving-average lengths for the percent-above measures
+        high_low_window : int, default 252
+            Sessions defining new highs and new lows
+        """
+        close = close.sort_index().ffill()
+        self.symbols = tuple(close.columns)
+        self.ma_windows = tuple(ma_windows)
+        self.high_low_window = high_low_window
+        self.lookback = max(max(self.ma_windows), high_low_window)
+
+        prices = close.to_numpy(dtype=np.float32)
+        self._dates = close.index.to_numpy(dtype="datetime64[ns]")
+        self._history = self._compute(prices)
+        self._tail = prices[-self.lookback :].copy()
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of the breadth measures, in history column order."""
+        return [f"pct_above_{w}" for w in self.ma_windows] + [
+            "advances",
+            "declines",
+            "ad_line",
+            "new_highs",
+            "new_lows",
+        ]
+
+    @property
+    def last_date(self) -> pd.Timestamp | None:
+        """Date of the latest processed bar."""
+        return pd.Timestamp(self._dates[-1]) if len(self._dates) else None
+
+    def _compute(self, prices: np.ndarray) -> dict[str, np.ndarray]:
+        sessions = len(prices)
+        valid = ~np.isnan(prices)
+        zeros = np.zeros((1, prices.shape[1]))
+        sums = np.vstack([zeros, np.cumsum(np.where(valid, prices, 0), 0, np.float64)])
+        counts = np.vstack([zeros, np.cumsum(valid, 0)])
+
+        history = {}
+        for w in self.ma_windows:
+            pct = np.full(sessions, np.nan)
+            if sessions >= w:
+                full = (counts[w:] - counts[:-w]) == w
+                ma = (sums[w:] - sums[:-w]) / w
+                above = full & (prices[w - 1 :] > ma)
+                pct[w - 1 :] = _percent(above.sum(1), full.sum(1))
+            history[f"pct_above_{w}"] = pct
+
+        change = np.diff(prices, axis=0)
+        advances = np.concatenate([[0], (change > 0).sum(1)])
+        declines = np.concatenate([[0], (change < 0).sum(1)])
+        history["advances"] = advances.astype(np.int32)
+        history["declines"] = declines.astype(np.int32)
+        history["ad_line"] = np.cumsum(advances - declines).astype(np.int64)
+
+        new_highs = np.zeros(sessions, dtype=np.int32)
+        new_lows = np.zeros(sessions, dtype=np.int32)
+        w = self.high_low_window
+        if sessions >= w:
+            # Windows containing NaN yield NaN extremes and never compare true.
+            windows = sliding_window_view(prices, w, axis=0)
+            current = prices[w - 1 :]
+            with np.errstate(invalid="ignore"):
+                new_highs[w - 1 :] = (current >= windows.max(-1)).sum(1)
+                new_lows[w - 1 :] = (current <= windows.min(-1)).sum(1)
+        history["new_highs"] = new_highs
+        history["new_lows"] = new_lows
+        return history
+
+    def _latest(self, tail: np.ndarray, previous_ad: int) -> dict[str, float]:
+        row = tail[-1]
+        latest = {}
+        for w in self.ma_windows:
+            pct = np.nan
+            if len(tail) >= w:
+                window = tail[-w:]
+                full = ~np.isnan(window).any(0)
+                with np.errstate(invalid="ignore"):
+                    above = full & (row > window.mean(0, dtype=np.float64))
+                pct = float(_percent(above.sum(), full.sum()))
+            latest[f"pct_above_{w}"] = pct
+
+        advances = declines = 0
+        if len(tail) > 1:
+            with np.errstate(invalid="ignore"):
+                change = row - tail[-2]
+            advances, declines = int((change > 0).sum()), int((change < 0).sum())
+        latest["advances"] = advances
+        latest["declines"] = declines
+        latest["ad_line"] = previous_ad + advances - declines
+
+        new_highs = new_lows = 0
+        if len(tail) >= self.high_low_window:
+            window = tail[-self.high_low_window :]
+            full = ~np.isnan(window).any(0)
+            with np.errstate(invalid="ignore"):
+                new_highs = int((full & (row >= window.max(0))).sum())
+                new_lows = int((full & (row <= window.min(0))).sum())
+        latest["new_highs"] = new_highs
+        latest["new_lows"] = new_lows
+        return latest
+
+    def update(self, day, closes) -> dict[str, float]:
+        """
+        Add one session's closes, or revise the latest session in place.
+
+        Parameters
+        ----------
+        day : date-like
+            Session date; equal to ``last_date`` to replace an intraday bar
+        closes : pd.Series or array-like
+            Closes keyed by symbol, or aligned with ``symbols``; missing
+            values carry the previous close forward
+
+        Returns
+        -------
+        dict[str, float]
+            Breadth measures for the session
+        """
+        day = np.datetime64(pd.Timestamp(day), "ns")
+        if isinstance(closes, pd.Series):
+            closes = closes.reindex(list(self.symbols))
+        row = np.asarray(closes, dtype=np.float32)
+
+        revise = len(self._dates) > 0 and day == self._dates[-1]
+        if len(self._dates) and day < self._dates[-1]:
+            raise ValueError(f"Bar for {day} is older than {self._dates[-1]}")
+        if revise:
+            self._tail = self._tail[:-1]
+            self._dates = self._dates[:-1]
+            self._history = {k: v[:-1] for k, v in self._history.items()}
+        if len(self._tail):
+            row = np.where(np.isnan(row), self._tail[-1], row)
+
+        self._tail = np.vstack([self._tail, row[None, :]])[-self.lookback :]
+        previous_ad = int(self._history["ad_line"][-1]) if len(self._dates) else 0
+        latest = self._latest(self._tail, previous_ad)
+
+        self._dates = np.append(self._dates, day)
+        self._history = {
+            k: np.append(v, np.asarray(latest[k], dtype=v.dtype))
+            for k, v in self._history.items()
+        }
+        return latest
+
+    def extend(self, close: pd.DataFrame) -> int:
+        """
+        Apply every bar of a panel at or after ``last_date``.
+
+        The bar on ``last_date`` itself is re-applied because it may have
+        been captured intraday. History older than the panel is dropped.
+
+        Parameters
+        ----------
+        close : pd.DataFrame
+            Close prices with the engine's symbols as columns
+
+        Returns
+        -------
+        int
+            Number of bars applied
+        """
+        close = close.sort_index().reindex(columns=list(self.symbols))
+        last = self.last_date
+        new = close if last is None else close[close.index >= last]
+        for day, closes in zip(new.index, new.to_numpy(dtype=np.float32)):
+            self.update(day, closes)
+        if len(close.index):
+            keep = self._dates >= np.datetime64(close.index[0], "ns")
+            self._dates = self._dates[keep]
+            self._history = {k: v[keep] for k, v in self._history.items()}
+        return len(new)
+
+    def history(self) -> pd.DataFrame:
+        """
+        Get breadth measures for every processed session.
+
+        Returns
+        -------
+        pd.DataFrame
+            Indexed by date with the columns listed in ``columns``
+        """
+        return pd.DataFrame(
+            self._history, index=pd.DatetimeIndex(self._dates, name="Date")
+        )[self.columns]
+
+    def summary(self, lookback: int = 5) -> dict:
+        """
+        Get the latest breadth reading with short-term changes.
+
+        Parameters
+        ----------
+        lookback : int, default 5
+            Sessions over which A/D line and percent-above changes are taken
+
+        Returns
+        -------
+        dict
+            as_of, universe size, lookback, latest value of every measure,
+            net_new_highs, and ``<measure>_change`` for the percent-above
+            measures and the A/D line
+        """
+        if not len(self._dates):
+            return {"as_of": None, "universe": len(self.symbols)}
+        summary = {
+            "as_of": pd.Timestamp(self._dates[-1]).strftime("%Y-%m-%d"),
+            "universe": len(self.symbols),
+            "lookback": lookback,
+        }
+        past = max(len(self._dates) - 1 - lookback, 0)
+        for name in self.columns:
+            values = self._history[name]
+            latest = values[-1]
+            summary[name] = None if pd.isna(latest) else latest.item()
+            if name.startswith("pct_above_") or name == "ad_line":
+                change = values[-1] - values[past]
+                summary[f"{name}_change"] = None if pd.isna(change) else change.item()
+        summary["net_new_highs"] = summary["new_highs"] - summary["new_lows"]
+        return summary
+
+    def regime_signals(self) -> dict[str, float | None]:
+        """
+        Get breadth signals named for the regime rules.
+
+        Returns
+        -------
+        dict[str, float | None]
+            ``breadth<n>_pct`` (percent of names above the n-day average)
+            and ``net_highs_pct`` (net new highs as percent of the universe)
+        """
+        summary = self.summary()
+        signals = {
+            f"breadth{w}_pct": summary.get(f"pct_above_{w}") for w in self.ma_windows
+        }
+        net = summary.get("net_new_highs")
+        signals["net_highs_pct"] = (
+            None if net is None or not self.symbols else 100.0 * net / len(self.symbols)
+        )
+        return signals
+
+
+def describe_breadth(summary: dict) -> str:
+    """
+    Describe a breadth summary in one line.
+
+    Parameters
+    ----------
+    summary : dict
+        Output of ``BreadthEngine.summary``
+
+    Returns
+    -------
+    str
+        E.g. "540 names: 62% above 50-day MA, 55% above 200-day MA, A/D
+        line +120 over 5 sessions, 18 new highs / 4 new lows", or "n/a"
+        without data
+    """
+    if not summary.get("as_of"):
+        return "n/a"
+    parts = [
+        f"{value:.0f}% above {name.removeprefix('pct_above_')}-day MA"
+        for name, value in summary.items()
+        if name.startswith("pct_above_")
+        and not name.endswith("_change")
+        and value is not None
+    ]
+    if summary.get("ad_line_change") is not None:
+        parts.append(
+            f"A/D line {summary['ad_line_change']:+d} over "
+            f"{summary['lookback']} sessions"
+        )
+    parts.append(f"{summary['new_highs']} new highs / {summary['new_lows']} new lows")
+    return f"{summary['universe']} names: " + ", ".join(parts)
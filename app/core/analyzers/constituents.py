@@ -0,0 +1,122 @@
+"""
+Sector constituent scanning over aligned price panels.
+
+This module ranks every stock listed under every sector ETF in
+sector_representatives.json from a single close-price panel. Period
+returns for all symbols come from one vectorized division; relative
+strength against the sector ETF and the S&P 500 and within-sector ranks
+are computed on the resulting table without per-ticker loops.
+
+A stock that appears under several ETFs (e.g. NVDA in XLK and SMH) gets
+one row per sector.
+"""
+
+import numpy as np
+import pandas as pd
+
+BENCHMARK = "^GSPC"
+SCAN_COLUMNS = [
+    "sector",
+    "ticker",
+    "return",
+    "sector_return",
+    "benchmark_return",
+    "rs_vs_sector",
+    "rs_vs_benchmark",
+    "sector_rank",
+    "sector_size",
+]
+
+
+def panel_returns(close: pd.DataFrame) -> pd.Series:
+    """
+    Compute first-to-last returns for every column of a price panel.
+
+    Parameters
+    ----------
+    close : pd.DataFrame
+        Close prices indexed by date, one column per symbol
+
+    Returns
+    -------
+    pd.Series
+        Fractional return per symbol, NaN for symbols without prices
+    """
+    filled = close.sort_index().ffill().bfill()
+    if filled.empty:
+        return pd.Series(dtype=float, index=close.columns)
+    values = filled.to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = values[-1] / values[0] - 1.0
+    return pd.Series(returns, index=filled.columns)
+
+
+def scan_constituents(
+    close: pd.DataFrame,
+    sectors: dict[str, list[str]],
+    benchmark: str = BENCHMARK,
+) -> pd.DataFrame:
+    """
+    Score sector constituents against their ETF and the benchmark.
+
+    Parameters
+    ----------
+    close : pd.DataFrame
+        Close prices covering all constituents, sector ETFs and the benchmark
+    sectors : dict[str, list[str]]
+        Sector ETF symbol to constituent tickers
+    benchmark : str, default "^GSPC"
+        Benchmark symbol for market-relative strength
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per (sector, ticker) with columns from SCAN_COLUMNS, sorted
+        by sector and rank. Relative strength is the return difference in
+        fractional terms; rank 1 is the strongest name in its sector.
+    """
+    returns = panel_returns(close)
+    pairs = [(etf, ticker) for etf, tickers in sectors.items() for ticker in tickers]
+    if not pairs:
+        return pd.DataFrame(columns=SCAN_COLUMNS)
+
+    scan = pd.DataFrame(pairs, columns=["sector", "ticker"])
+    scan["return"] = returns.reindex(scan["ticker"]).to_numpy()
+    scan["sector_return"] = returns.reindex(scan["sector"]).to_numpy()
+    scan["benchmark_return"] = returns.get(benchmark, np.nan)
+    scan["rs_vs_sector"] = scan["return"] - scan["sector_return"]
+    scan["rs_vs_benchmark"] = scan["return"] - scan["benchmark_return"]
+
+    by_sector = scan.groupby("sector")["return"]
+    scan["sector_rank"] = by_sector.rank(ascending=False, method="min")
+    scan["sector_size"] = by_sector.transform("count")
+
+    return scan.sort_values(["sector", "sector_rank"], na_position="last")[
+        SCAN_COLUMNS
+    ].reset_index(drop=True)
+
+
+def sector_leaders(scan: pd.DataFrame, top_n: int = 3) -> dict[str, list[dict]]:
+    """
+    Get the strongest constituents per sector from a scan.
+
+    Parameters
+    ----------
+    scan : pd.DataFrame
+        Output of ``scan_constituents``
+    top_n : int, default 3
+        Number of leaders per sector
+
+    Returns
+    -------
+    dict[str, list[dict]]
+        Sector ETF symbol to leader records (ticker, return, rs_vs_sector,
+        rs_vs_benchmark), strongest first
+    """
+    ranked = scan.dropna(subset=["return"])
+    ranked = ranked[ranked["sector_rank"] <= top_n]
+    columns = ["ticker", "return", "rs_vs_sector", "rs_vs_benchmark"]
+    return {
+        sector: group[columns].to_dict(orient="records")
+        for sector, group in ranked.groupby("sector", sort=False)
+    }
@@ -0,0 +1,105 @@
+"""
+Multi-horizon return calculations over aligned price panels.
+
+This module computes period returns for many symbols and many look-back
+horizons at once. Start rows for every horizon are located with a single
+binary search over the date index, and returns for the whole
+symbol x horizon grid come from one vectorized NumPy division.
+
+Horizons use the same Yahoo-style period strings as the rest of the
+application (1wk, 1mo, 3mo, 6mo, 1y), so a single one-year panel can
+answer any shorter horizon without further downloads. ``period_start``
+maps those strings to calendar start dates for this module and for the
+bar store, which slices stored history the same way.
+"""
+
+import numpy as np
+import pandas as pd
+
+HORIZONS = ("1wk", "1mo", "3mo", "6mo", "1y")
+PERIOD_OFFSETS = {
+    "5d": pd.DateOffset(days=5),
+    "1wk": pd.DateOffset(weeks=1),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
+
+
+def period_start(period: str, end: pd.Timestamp | None = None) -> pd.Timestamp | None:
+    """
+    Get the first calendar date covered by a Yahoo-style period string.
+
+    Parameters
+    ----------
+    period : str
+        Period such as "1wk", "1mo" or "1y"; "max" means no lower bound
+    end : pd.Timestamp, optional
+        Anchor date, defaults to today
+
+    Returns
+    -------
+    pd.Timestamp or None
+        Inclusive start date, or None for unbounded periods
+    """
+    if period not in PERIOD_OFFSETS:
+        return None
+    end = end if end is not None else pd.Timestamp.today().normalize()
+    return end - PERIOD_OFFSETS[period]
+
+
+def horizon_returns(
+    close: pd.DataFrame,
+    horizons: tuple[str, ...] = HORIZONS,
+    end: pd.Timestamp | None = None,
+) -> dict:
+    """
+    Compute returns for every symbol over several horizons in one pass.
+
+    Parameters
+    ----------
+    close : pd.DataFrame
+        Close prices indexed by date, one column per symbol
+    horizons : tuple[str, ...], default HORIZONS
+        Period strings to evaluate
+    end : pd.Timestamp, optional
+        Anchor date for horizon starts, defaults to today
+
+    Returns
+    -------
+    dict
+        Keys:
+        - returns: DataFrame (symbol x horizon) of fractional returns
+        - start_prices: DataFrame (symbol x horizon) of starting closes
+        - end_prices: Series of latest closes per symbol
+        - start_dates: dict of horizon to first date used
+        - end_date: last date in the panel
+    """
+    filled = close.sort_index().ffill()
+    values = filled.to_numpy(dtype=float)
+    dates = filled.index.values
+
+    starts = np.array(
+        [np.datetime64(period_start(h, end)) for h in horizons], dtype=dates.dtype
+    )
+    positions = np.minimum(np.searchsorted(dates, starts, side="left"), len(dates) - 1)
+
+    start_prices = values[positions, :]
+    end_prices = values[-1, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = end_prices[np.newaxis, :] / start_prices - 1.0
+
+    columns = list(horizons)
+    return {
+        "returns": pd.DataFrame(returns.T, index=filled.columns, columns=columns),
+        "start_prices": pd.DataFrame(
+            start_prices.T, index=filled.columns, columns=columns
+        ),
+        "end_prices": pd.Series(end_prices, index=filled.columns),
+        "start_dates": {h: filled.index[p] for h, p in zip(horizons, positions)},
+        "end_date": filled.index[-1],
+    }
@@ -14,16 +14,286 @@ The regime classifier analyzes:
 
 Classification logic uses JSON-based rules for easy tuning and provides
 detailed context for investment decision-making.
+
+Rules are compiled once into a RegimeRules evaluator that is cached per
+file and reloaded only when regime_rules.json changes on disk. Conditions
+are written as ``<signal>_min`` / ``<signal>_max`` against any signal key
+(e.g. ``gold_pct_max`` or ``hyg_pct_min``), and evaluate on scalars or
+NumPy arrays alike, so new regime signals need no code changes.
+
+Besides the scalar classifier, the module offers a vectorized engine that
+applies the same rules as NumPy boolean masks over every day of aligned
+indicator histories, returning a regime time series together with
+transition points and dwell-time statistics for backtesting rule changes.
 """
 
 import json
+import operator
+import threading
 from pathlib import Path
+from typing import Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+REGIME_LEVEL_COLUMNS = ("spx", "vix", "dxy", "ust10y")
+REGIME_RULES_PATH = "knowledge_base/configs/regime_rules.json"
+CORE_RULES = ("risk_on", "usd_soft", "yields_rising", "us_exceptionalism")
+SIGNAL_UNITS = ("pct", "bp")
+
 
+def _condition_signal(key: str) -> tuple[str, Callable]:
+    """Split a condition key into its signal name and comparison."""
+    base, _, bound = key.rpartition("_")
+    if bound not in ("min", "max") or not base:
+        raise ValueError(f"Regime condition must end in _min or _max: {key}")
+    if base.rpartition("_")[2] not in SIGNAL_UNITS:
+        base = f"{base}_pct"
+    return base, operator.ge if bound == "min" else operator.le
 
-def load_regime_config(path: str = "knowledge_base/configs/regime_rules.json") -> dict:
+
+def _as_float(value) -> float | np.ndarray:
+    if value is None:
+        return np.nan
+    return np.asarray(value, dtype=float)
+
+
+class RegimeRules:
+    """
+    Compiled regime rules evaluator.
+
+    Every section under ``thresholds`` and ``tie_breakers`` becomes a named
+    rule that is the conjunction of its conditions. Missing or NaN signals
+    never satisfy a condition. Rules beyond the core four (risk_on,
+    usd_soft, yields_rising, us_exceptionalism) are reported as flags.
+    """
+
+    def __init__(self, cfg: dict) -> None:
+        """
+        Compile regime rules.
+
+        Parameters
+        ----------
+        cfg : dict
+            Regime configuration with windows, thresholds, tie_breakers and
+            labels
+
+        Raises
+        ------
+        ValueError
+            If a condition key does not end in _min or _max
+        """
+        self.cfg = cfg
+        self.labels = cfg["labels"]
+        self.rules: dict[str, tuple[tuple[str, Callable, float], ...]] = {}
+        for section in ("thresholds", "tie_breakers"):
+            for name, conditions in cfg.get(section, {}).items():
+                compiled = []
+                for key, threshold in conditions.items():
+                    signal, compare = _condition_signal(key)
+                    compiled.append((signal, compare, float(threshold)))
+                self.rules[name] = tuple(compiled)
+        self.signals = sorted(
+            {signal for rule in self.rules.values() for signal, _, _ in rule}
+        )
+        self.flags = [name for name in self.rules if name not in CORE_RULES]
+
+    def evaluate(self, signals: Mapping) -> dict[str, bool | np.ndarray]:
+        """
+        Evaluate every rule against scalar or array signals.
+
+        Parameters
+        ----------
+        signals : Mapping
+            Signal key (e.g. "spx_pct") to a scalar, None or array
+
+        Returns
+        -------
+        dict[str, bool | np.ndarray]
+            Rule name to a bool for scalar inputs or a boolean mask for
+            array inputs
+        """
+        results = {}
+        for name, conditions in self.rules.items():
+            mask = np.bool_(True)
+            for signal, compare, threshold in conditions:
+                with np.errstate(invalid="ignore"):
+                    mask = mask & compare(_as_float(signals.get(signal)), threshold)
+            results[name] = bool(mask) if np.ndim(mask) == 0 else mask
+        return results
+
+    def _has_signals(self, rule: str, signals: Mapping) -> bool:
+        return all(
+            signals.get(signal) is not None and not pd.isna(signals.get(signal))
+            for signal, _, _ in self.rules.get(rule, ())
+        )
+
+    def classify(self, signals: Mapping) -> dict:
+        """
+        Classify a single observation.
+
+        Parameters
+        ----------
+        signals : Mapping
+            Signal key to scalar value or None
+
+        Returns
+        -------
+        dict
+            Classification result with keys: regime, usd_context, yields,
+            note, flags
+        """
+        labels = self.labels
+        results = self.evaluate(signals)
+        flags = {name: results[name] for name in self.flags}
+
+        if not self._has_signals("risk_on", signals):
+            return {
+                "regime": labels["risk_off"],
+                "usd_context": "n/a",
+                "yields": "n/a",
+                "note": "Insufficient signals to confirm risk-on.",
+                "flags": flags,
+            }
+
+        if not results.get("risk_on", False):
+            return {
+                "regime": labels["risk_off"],
+                "usd_context": "n/a",
+                "yields": "n/a",
+                "note": "Stocks/VIX not confirming risk appetite.",
+                "flags": flags,
+            }
+
+        usd_context = (
+            labels["usd_soft"] if results.get("usd_soft") else labels["usd_firm"]
+        )
+        if results.get("us_exceptionalism"):
+            usd_context = labels["usd_usx"]
+        yields_label = (
+            labels["yields_rising"]
+            if results.get("yields_rising")
+            else labels["yields_mixed"]
+        )
+
+        return {
+            "regime": labels["risk_on"],
+            "usd_context": usd_context,
+            "yields": yields_label,
+            "note": "Falling VIX and rising stocks confirm risk-on; "
+            "USD/yields provide sector bias context.",
+            "flags": flags,
+        }
+
+    def classify_series(self, deltas: pd.DataFrame) -> pd.DataFrame:
+        """
+        Classify every row of a signal table in one vectorized pass.
+
+        Parameters
+        ----------
+        deltas : pd.DataFrame
+            One column per signal key (e.g. spx_pct, ust10y_bp)
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns regime, usd_context, yields, risk_on and one boolean
+            column per flag rule, same index as ``deltas``
+        """
+        labels = self.labels
+        signals = {column: deltas[column].to_numpy(dtype=float) for column in deltas}
+        false = np.zeros(len(deltas), dtype=bool)
+        results = {
+            name: np.broadcast_to(mask, false.shape)
+            for name, mask in self.evaluate(signals).items()
+        }
+        risk_on = results.get("risk_on", false)
+
+        usd_context = np.where(
+            results.get("usd_soft", false), labels["usd_soft"], labels["usd_firm"]
+        )
+        usd_context = np.where(
+            results.get("us_exceptionalism", false), labels["usd_usx"], usd_context
+        )
+        yields = np.where(
+            results.get("yields_rising", false),
+            labels["yields_rising"],
+            labels["yields_mixed"],
+        )
+
+        frame = pd.DataFrame(
+            {
+                "regime": np.where(risk_on, labels["risk_on"], labels["risk_off"]),
+                "usd_context": np.where(risk_on, usd_context, "n/a"),
+                "yields": np.where(risk_on, yields, "n/a"),
+                "risk_on": risk_on,
+            },
+            index=deltas.index,
+        )
+        for name in self.flags:
+            frame[name] = results[name]
+        return frame
+
+
+def compile_regime_rules(cfg: "dict | RegimeRules") -> RegimeRules:
+    """
+    Get a compiled evaluator for a configuration dict or evaluator.
+
+    Parameters
+    ----------
+    cfg : dict or RegimeRules
+        Raw configuration or an already compiled evaluator
+
+    Returns
+    -------
+    RegimeRules
+        Compiled evaluator
+    """
+    return cfg if isinstance(cfg, RegimeRules) else RegimeRules(cfg)
+
+
+_rules_cache: dict[Path, tuple[int, RegimeRules]] = {}
+_rules_lock = threading.Lock()
+
+
+def load_regime_rules(path: str = REGIME_RULES_PATH) -> RegimeRules:
+    """
+    Load compiled regime rules, recompiling only when the file changes.
+
+    Parameters
+    ----------
+    path : str, default REGIME_RULES_PATH
+        Path to the JSON rules file, relative paths resolve from the app
+        directory
+
+    Returns
+    -------
+    RegimeRules
+        Cached evaluator for the current file contents
+    """
+    path = Path(path)
+    if not path.is_absolute():
+        path = Path(__file__).parent.parent.parent / path
+
+    mtime = path.stat().st_mtime_ns
+    with _rules_lock:
+        cached = _rules_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    rules = RegimeRules(json.loads(path.read_text(encoding="utf-8")))
+    with _rules_lock:
+        _rules_cache[path] = (mtime, rules)
+    return rules
+
+
+def load_regime_config(path: str = REGIME_RULES_PATH) -> dict:
     """
     Load regime classification configuration from JSON file.
 
+    The parsed file is cached and only re-read when its modification time
+    changes; treat the returned dictionary as read-only.
+
     Parameters
     ----------
     path : str, default "knowledge_base/configs/regime_rules.json"
@@ -34,11 +304,7 @@ def load_regime_config(path: str = "knowledge_base/configs/regime_rules.json") -
     dict
         Configuration dictionary with thresholds and labels
     """
-    if not Path(path).is_absolute():
-        app_dir = Path(__file__).parent.parent.parent
-        path = app_dir / path
-    
-    return json.loads(Path(path).read_text(encoding="utf-8"))
+    return load_regime_rules(path).cfg
 
 
 def pct_change(a: float | None, b: float | None) -> float | None:
@@ -90,7 +356,8 @@ def classify_regime(
     vix_pct: float | None,
     dxy_pct: float | None,
     ust10y_bp: float | None,
-    cfg: dict,
+    cfg: "dict | RegimeRules",
+    **signals: float | None,
 ) -> dict:
     """
     Classify market regime based on key financial indicators.
@@ -108,61 +375,191 @@ def classify_regime(
         DXY dollar index percentage change
     ust10y_bp : float or None
         10-year Treasury yield change in basis points
-    cfg : dict
-        Configuration dictionary with thresholds and labels
+    cfg : dict or RegimeRules
+        Configuration dictionary with thresholds and labels, or compiled
+        rules from ``load_regime_rules``
+    **signals : float or None
+        Additional signals referenced by rules, e.g. gold_pct
 
     Returns
     -------
     dict
-        Classification result with keys: regime, usd_context, yields, note
+        Classification result with keys: regime, usd_context, yields, note,
+        flags
     """
-    labels = cfg["labels"]
-    th = cfg["thresholds"]
-    tb = cfg["tie_breakers"]
-
-    if spx_pct is None or vix_pct is None:
-        return {
-            "regime": labels["risk_off"],
-            "usd_context": "n/a",
-            "yields": "n/a",
-            "note": "Insufficient signals to confirm risk-on.",
+    return compile_regime_rules(cfg).classify(
+        {
+            "spx_pct": spx_pct,
+            "vix_pct": vix_pct,
+            "dxy_pct": dxy_pct,
+            "ust10y_bp": ust10y_bp,
+            **signals,
         }
+    )
+
 
-    risk_on = (spx_pct >= th["risk_on"]["spx_pct_min"]) and (
-        vix_pct <= th["risk_on"]["vix_pct_max"]
+def regime_deltas(levels: pd.DataFrame, window: int) -> pd.DataFrame:
+    """
+    Compute rolling indicator changes over a fixed number of sessions.
+
+    Parameters
+    ----------
+    levels : pd.DataFrame
+        Aligned daily levels with columns spx, vix, dxy and ust10y
+    window : int
+        Number of sessions each change spans
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns spx_pct, vix_pct, dxy_pct (percent) and ust10y_bp (basis
+        points), NaN where a full window is not yet available
+    """
+    levels = levels.reindex(columns=list(REGIME_LEVEL_COLUMNS)).ffill()
+    values = levels.to_numpy(dtype=float)
+    past = np.full_like(values, np.nan)
+    if window < len(values):
+        past[window:] = values[:-window]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = (values - past) / np.where(past == 0, np.nan, past) * 100.0
+    bp = (values[:, 3] - past[:, 3]) * 100.0
+
+    return pd.DataFrame(
+        {
+            "spx_pct": pct[:, 0],
+            "vix_pct": pct[:, 1],
+            "dxy_pct": pct[:, 2],
+            "ust10y_bp": bp,
+        },
+        index=levels.index,
     )
-    if not risk_on:
-        return {
-            "regime": labels["risk_off"],
-            "usd_context": "n/a",
-            "yields": "n/a",
-            "note": "Stocks/VIX not confirming risk appetite.",
+
+
+def classify_regime_series(
+    deltas: pd.DataFrame, cfg: "dict | RegimeRules"
+) -> pd.DataFrame:
+    """
+    Classify every row of an indicator-change table in one vectorized pass.
+
+    Applies exactly the rules of ``classify_regime``: missing SPX/VIX
+    changes are risk-off, USD and yield context only apply on risk-on days.
+
+    Parameters
+    ----------
+    deltas : pd.DataFrame
+        Columns spx_pct, vix_pct, dxy_pct and ust10y_bp, e.g. from
+        ``regime_deltas``, plus any other signals referenced by rules
+    cfg : dict or RegimeRules
+        Configuration dictionary with thresholds and labels, or compiled
+        rules
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns regime, usd_context, yields, risk_on (bool) and one boolean
+        column per flag rule, same index as ``deltas``
+    """
+    return compile_regime_rules(cfg).classify_series(deltas)
+
+
+def regime_transitions(regimes: pd.Series) -> pd.DataFrame:
+    """
+    Find the dates on which the regime label changes.
+
+    Parameters
+    ----------
+    regimes : pd.Series
+        Regime labels indexed by date
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns date, from_regime and to_regime, one row per change
+    """
+    values = regimes.to_numpy()
+    changed = np.flatnonzero(values[1:] != values[:-1]) + 1
+    return pd.DataFrame(
+        {
+            "date": regimes.index[changed],
+            "from_regime": values[changed - 1],
+            "to_regime": values[changed],
         }
+    )
 
-    usd_soft = None
-    usd_context = labels["usd_firm"]
-    if dxy_pct is not None:
-        usd_soft = dxy_pct <= th["usd_soft"]["dxy_pct_max"]
-        usd_context = labels["usd_soft"] if usd_soft else labels["usd_firm"]
 
-    yields_label = labels["yields_mixed"]
-    if ust10y_bp is not None:
-        yields_label = (
-            labels["yields_rising"]
-            if ust10y_bp >= th["yields_rising"]["ust10y_bp_min"]
-            else labels["yields_mixed"]
+def regime_dwell_stats(regimes: pd.Series) -> pd.DataFrame:
+    """
+    Summarize how long each regime persists once entered.
+
+    Parameters
+    ----------
+    regimes : pd.Series
+        Regime labels indexed by date
+
+    Returns
+    -------
+    pd.DataFrame
+        Indexed by regime label with columns spells, mean_sessions,
+        median_sessions, max_sessions and share (fraction of all sessions)
+    """
+    values = regimes.to_numpy()
+    if len(values) == 0:
+        return pd.DataFrame(
+            columns=[
+                "spells",
+                "mean_sessions",
+                "median_sessions",
+                "max_sessions",
+                "share",
+            ]
         )
 
-    if dxy_pct is not None and (
-        spx_pct >= tb["us_exceptionalism"]["spx_min"]
-        and dxy_pct >= tb["us_exceptionalism"]["dxy_min"]
-    ):
-        usd_context = labels["usd_usx"]
+    starts = np.concatenate(([0], np.flatnonzero(values[1:] != values[:-1]) + 1))
+    lengths = np.diff(np.append(starts, len(values)))
+    spells = pd.DataFrame({"regime": values[starts], "sessions": lengths})
+
+    stats = spells.groupby("regime")["sessions"].agg(
+        spells="count",
+        mean_sessions="mean",
+        median_sessions="median",
+        max_sessions="max",
+        total="sum",
+    )
+    stats["share"] = stats.pop("total") / len(values)
+    return stats
+
+
+def backtest_regimes(
+    levels: pd.DataFrame, cfg: "dict | RegimeRules", window: int
+) -> dict:
+    """
+    Run the regime rules over a full indicator history.
+
+    Parameters
+    ----------
+    levels : pd.DataFrame
+        Aligned daily levels with columns spx, vix, dxy and ust10y
+    cfg : dict or RegimeRules
+        Configuration dictionary with thresholds and labels, or compiled
+        rules
+    window : int
+        Number of sessions each indicator change spans
 
+    Returns
+    -------
+    dict
+        Keys:
+        - deltas: DataFrame of indicator changes per day
+        - regimes: DataFrame from ``classify_regime_series``
+        - transitions: DataFrame from ``regime_transitions``
+        - dwell: DataFrame from ``regime_dwell_stats``
+    """
+    deltas = regime_deltas(levels, window).iloc[window:]
+    regimes = classify_regime_series(deltas, cfg)
     return {
-        "regime": labels["risk_on"],
-        "usd_context": usd_context,
-        "yields": yields_label,
-        "note": "Falling VIX and rising stocks confirm risk-on; "
-        "USD/yields provide sector bias context.",
+        "deltas": deltas,
+        "regimes": regimes,
+        "transitions": regime_transitions(regimes["regime"]),
+        "dwell": regime_dwell_stats(regimes["regime"]),
     }
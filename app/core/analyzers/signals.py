@@ -0,0 +1,220 @@
+"""
+Rolling multi-window market signals over stored price panels.
+
+This module turns an aligned close-price panel into rolling signals for
+every symbol and every configured window at once. The windows come from
+``windows`` in regime_rules.json (short_days and medium_days), so the
+regime can be confirmed across several horizons from a single panel
+without further downloads.
+
+Signals per window:
+- return: fractional price change over the window
+- change: absolute level change over the window (used for yields)
+- vol: annualized realized volatility of daily log returns
+- zscore: distance of the latest close from its rolling mean in standard
+  deviations
+"""
+
+import numpy as np
+import pandas as pd
+
+from core.analyzers.regime import RegimeRules, compile_regime_rules
+
+SIGNAL_METRICS = ("return", "change", "vol", "zscore")
+TRADING_DAYS_PER_YEAR = 252
+DEFAULT_INDICATORS = {
+    "^GSPC": {"signal_key": "spx"},
+    "^VIX": {"signal_key": "vix"},
+    "DX-Y.NYB": {"signal_key": "dxy"},
+    "^TNX": {"signal_key": "ust10y", "signal_unit": "bp"},
+}
+
+
+def signal_windows(cfg: dict) -> dict[str, int]:
+    """
+    Read signal windows from a regime configuration.
+
+    Parameters
+    ----------
+    cfg : dict
+        Regime configuration with a ``windows`` section
+
+    Returns
+    -------
+    dict[str, int]
+        Window name (e.g. "short", "medium") to number of sessions
+    """
+    return {
+        name.removesuffix("_days"): int(days)
+        for name, days in cfg.get("windows", {}).items()
+    }
+
+
+def _compact(close: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Move each column's observations to the bottom rows, in date order.
+
+    Missing values move to the top, so consecutive rows of a column are
+    consecutive observations. Also returns the row order used, which maps
+    results back to the original dates.
+    """
+    values = close.to_numpy(dtype=float)
+    order = np.argsort(~np.isnan(values), axis=0, kind="stable")
+    return np.take_along_axis(values, order, axis=0), order
+
+
+def _restore(
+    compact: pd.DataFrame, order: np.ndarray, close: pd.DataFrame
+) -> pd.DataFrame:
+    """Scatter compacted results back onto the panel dates, carried forward."""
+    restored = np.empty(order.shape)
+    np.put_along_axis(restored, order, compact.to_numpy(dtype=float), axis=0)
+    return pd.DataFrame(restored, index=close.index, columns=close.columns).ffill()
+
+
+def rolling_signals(close: pd.DataFrame, windows: dict[str, int]) -> pd.DataFrame:
+    """
+    Compute rolling signals for all symbols and windows.
+
+    Each symbol's windows run over its own observed dates, so a window of
+    N sessions spans N of that symbol's sessions even when the panel mixes
+    exchange-traded indices with instruments quoted on weekends (crypto,
+    FX). Every column's observations are first packed into consecutive
+    rows, so each window is one frame-wide shift/rolling pass over all
+    symbols; signals are then carried forward onto the panel's dates.
+
+    Parameters
+    ----------
+    close : pd.DataFrame
+        Close prices indexed by date, one column per symbol
+    windows : dict[str, int]
+        Window name to number of sessions
+
+    Returns
+    -------
+    pd.DataFrame
+        Signals indexed by date with column levels (window, metric, symbol)
+    """
+    close = close.sort_index()
+    compact, order = _compact(close)
+    packed = pd.DataFrame(compact, columns=close.columns)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_returns = np.log(packed).diff()
+
+    frames = {}
+    for name, days in windows.items():
+        past = packed.shift(days)
+        rolling = packed.rolling(days, min_periods=days)
+        std = rolling.std().replace(0.0, np.nan)
+        metrics = {
+            "return": packed / past - 1.0,
+            "change": packed - past,
+            "vol": log_returns.rolling(days).std() * np.sqrt(TRADING_DAYS_PER_YEAR),
+            "zscore": (packed - rolling.mean()) / std,
+        }
+        for metric, values in metrics.items():
+            frames[(name, metric)] = _restore(values, order, close)
+
+    signals = pd.concat(frames, axis=1)
+    signals.columns = signals.columns.set_names(["window", "metric", "symbol"])
+    return signals
+
+
+def latest_signals(signals: pd.DataFrame) -> pd.DataFrame:
+    """
+    Get the most recent signal values as a symbol table.
+
+    Parameters
+    ----------
+    signals : pd.DataFrame
+        Output of ``rolling_signals``
+
+    Returns
+    -------
+    pd.DataFrame
+        Indexed by symbol with (window, metric) columns
+    """
+    if signals.empty:
+        return pd.DataFrame()
+    return signals.iloc[-1].unstack("symbol").T
+
+
+def regime_inputs(
+    latest: pd.DataFrame, window: str, indicators: dict | None = None
+) -> dict[str, float | None]:
+    """
+    Extract rule signals for one window.
+
+    Each indicator with a ``signal_key`` in market_indicators.json yields
+    ``<key>_pct`` (percent return) or, for ``"signal_unit": "bp"``,
+    ``<key>_bp`` (level change in basis points).
+
+    Parameters
+    ----------
+    latest : pd.DataFrame
+        Output of ``latest_signals``
+    window : str
+        Window name, e.g. "short"
+    indicators : dict, optional
+        Indicator configuration keyed by ticker, defaults to the four core
+        regime indicators
+
+    Returns
+    -------
+    dict[str, float | None]
+        Signal key (e.g. spx_pct, gold_pct, ust10y_bp) to value
+    """
+    inputs = {}
+    for symbol, info in (indicators or DEFAULT_INDICATORS).items():
+        key = info.get("signal_key")
+        if not key:
+            continue
+        unit = info.get("signal_unit", "pct")
+        metric = "change" if unit == "bp" else "return"
+        value = None
+        if symbol in latest.index and (window, metric) in latest.columns:
+            value = latest.at[symbol, (window, metric)]
+        inputs[f"{key}_{unit}"] = None if pd.isna(value) else float(value) * 100.0
+    return inputs
+
+
+def confirm_regime(
+    latest: pd.DataFrame, cfg: "dict | RegimeRules", indicators: dict | None = None
+) -> dict:
+    """
+    Classify the regime on every configured window and check agreement.
+
+    Parameters
+    ----------
+    latest : pd.DataFrame
+        Output of ``latest_signals``
+    cfg : dict or RegimeRules
+        Regime configuration with windows, thresholds and labels, or the
+        compiled rules
+    indicators : dict, optional
+        Indicator configuration keyed by ticker, see ``regime_inputs``
+
+    Returns
+    -------
+    dict
+        Keys:
+        - windows: window name to classification result
+        - confirmed: True when every window yields the same regime
+        - summary: short human-readable description of the agreement
+    """
+    rules = compile_regime_rules(cfg)
+    windows = signal_windows(rules.cfg)
+    results = {
+        name: rules.classify(regime_inputs(latest, name, indicators))
+        for name in windows
+    }
+    regimes = {name: result["regime"] for name, result in results.items()}
+    confirmed = len(set(regimes.values())) <= 1
+    detail = ", ".join(
+        f"{name} {windows[name]}d: {regime}" for name, regime in regimes.items()
+    )
+    if confirmed:
+        summary = f"confirmed across windows ({detail})"
+    else:
+        summary = f"windows disagree ({detail})"
+    return {"windows": results, "confirmed": confirmed, "summary": summary}
@@ -20,7 +20,9 @@ preventing direct coupling between UI components and internal services.
 
 from __future__ import annotations
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import time
 
 from .models import (
     SessionState,
@@ -31,7 +33,7 @@ from .models import (
     RespondStyle,
 )
 from .prompts import DefaultPromptFactory
-from .services.llm_openai import LLMClient
+from .services.llm_openai import LLMClient, ChatStream
 from .interfaces import SecurityGuard, PromptFactory, LLMClientInt
 from .services.security import DefaultSecurity
 from .services.rate_limit import RateLimiter
@@ -45,9 +47,19 @@ from .services.market_data import (
     get_market_snapshot,
     get_ticker_fundamentals,
     get_ticker_info,
+    get_ticker_info_batch,
+    get_market_breadth,
+    get_market_signals,
+    get_sector_leaders,
+    load_market_indicators,
 )
 from .services.retrievers import retrieve_semantic
-from .analyzers.regime import load_regime_config, classify_regime
+from .services.cache import cache_stats
+from .analyzers.regime import load_regime_rules, classify_regime
+from .analyzers.signals import confirm_regime, latest_signals
+from .analyzers.breadth import describe_breadth
+
+MAX_WATCHLIST_WORKERS = 8
 
 
 class MarketIntelligenceSessionController:
@@ -245,6 +257,57 @@ class MarketIntelligenceSessionController:
             logging.info(f"Tools used in this turn: {tools_used}")
         return reply, meta
 
+    def ai_desk_chat_stream(
+        self,
+        *,
+        settings: LLMSettings,
+        language: RespondLanguage,
+        style: RespondStyle,
+        user_text: Optional[str] = None,
+        use_web_search: bool = False,
+    ) -> ChatStream:
+        """
+        Streaming variant of ai_desk_chat.
+
+        Applies the same guardrails, then returns a stream of response text.
+        Token usage is tracked once the stream has been fully consumed; the
+        stream's ``meta`` then carries tools used and usage figures.
+        """
+        user_query = user_text or ""
+        self.security.validate_user_input(user_query)
+        self.security.moderate(user_query)
+        user_query = self.security.sanitize_for_prompt(user_query)
+        user_query, pii = self.security.redact_pii(user_query)
+        self.security.check_prompt_injection(user_query)
+
+        system_prompt = self.prompts.build_system(
+            language=language,
+            style=style,
+        )
+
+        tool_map = get_functions_for_openai(enable_web_search=use_web_search)
+
+        stream = self.llm_client.stream_chat_with_tools_and_history(
+            system_prompt=system_prompt,
+            user_input=user_query,
+            session_id=self.session_id,
+            settings=settings,
+            tool_map=tool_map,
+        )
+
+        def on_complete(meta: dict) -> None:
+            self._track_usage(
+                model=meta["model"],
+                tokens_in=meta["tokens_in"],
+                tokens_out=meta["tokens_out"],
+            )
+            tools_used = meta.get("tools_used", [])
+            if tools_used:
+                logging.info(f"Tools used in this turn: {tools_used}")
+
+        stream.add_done_callback(on_complete)
+        return stream
+
     def greet_and_open(
         self,
         *,
@@ -276,6 +339,93 @@ class MarketIntelligenceSessionController:
         )
         return reply
 
+    @staticmethod
+    def _sector_names_text(leaders: list[dict] | None, samples: list[str] | None) -> str:
+        """Describe a sector's leading constituents, or its sample tickers."""
+        if leaders:
+            return "leaders: " + ", ".join(
+                f"{leader['ticker']} ({leader['return']:+.1%}, "
+                f"{leader['rs_vs_sector']:+.1%} vs ETF)"
+                for leader in leaders
+            )
+        return "tickers: " + ", ".join(samples or [])
+
+    def _gather_pulse_inputs(
+        self, index_path: str, period: str
+    ) -> tuple[dict, dict[str, float]]:
+        """
+        Fetch independent market pulse inputs concurrently.
+
+        Sector performance, market snapshot, rolling signals, constituent
+        leaders, market breadth, knowledge base retrieval and ticker samples
+        do not depend on each other, so they run in parallel and are joined
+        before the LLM call. Only sectors and snapshot are required; a failed
+        optional stage is logged and replaced by its fallback (None for
+        signals and breadth, empty results for the others).
+
+        Parameters
+        ----------
+        index_path : str
+            Path to FAISS index for RAG retrieval
+        period : str
+            Analysis period passed to the market data services
+
+        Returns
+        -------
+        tuple[dict, dict[str, float]]
+            Stage results keyed by stage name, and per-stage wall-clock
+            seconds including the overall "inputs" join time
+
+        Raises
+        ------
+        Exception
+            Whatever the sectors or snapshot stage raised
+        """
+        query = self.prompts.market_pulse_rag_query()
+        stages = {
+            "sectors": lambda: get_sector_perf(period=period),
+            "snapshot": lambda: get_market_snapshot(period=period),
+            "signals": get_market_signals,
+            "rag": lambda: retrieve_semantic(index_path, query, k=4),
+            "samples": get_ticker_samples,
+            "leaders": lambda: get_sector_leaders(period=period),
+            "breadth": get_market_breadth,
+        }
+        fallbacks = {
+            "signals": lambda: None,
+            "rag": list,
+            "samples": dict,
+            "leaders": dict,
+            "breadth": lambda: None,
+        }
+        timings: dict[str, float] = {}
+
+        def timed(name: str, fn):
+            start = time.perf_counter()
+            try:
+                return fn()
+            finally:
+                timings[name] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=len(stages), thread_name_prefix="pulse"
+        ) as executor:
+            futures = {
+                name: executor.submit(timed, name, fn) for name, fn in stages.items()
+            }
+            results = {}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    if name not in fallbacks:
+                        raise
+                    logging.error(f"Market pulse stage {name} failed: {e}")
+                    results[name] = fallbacks[name]()
+        timings["inputs"] = time.perf_counter() - start
+        return results, timings
+
     def run_market_pulse(
         self,
         index_path: str,
@@ -284,9 +434,15 @@ class MarketIntelligenceSessionController:
         """
         Generate a market pulse analysis using current market data and RAG context.
 
+        Market data, RAG retrieval and ticker samples are fetched
+        concurrently; per-stage timings are kept in
+        ``state.last_pulse_timings``.
+
         Analysis approach:
         - Sector performance: Uses specified period for charts/rankings
-        - Market regime: Uses specified period for consistent analysis
+        - Market regime: Uses specified period for consistent analysis,
+          cross-checked on the short/medium rolling windows and qualified
+          by market breadth
         - RAG context: Retrieves relevant market analysis from knowledge base
 
         Args:
@@ -296,20 +452,23 @@ class MarketIntelligenceSessionController:
         Returns:
             MarketPulse object with regime, sectors, and narrative
         """
-        sectors_df = get_sector_perf(period=period)
-        snapshot = get_market_snapshot(period=period)
-        cfg = load_regime_config()
+        pulse_start = time.perf_counter()
+        inputs, timings = self._gather_pulse_inputs(index_path, period)
+        sectors_df = inputs["sectors"]
+        snapshot = inputs["snapshot"]
+        docs = inputs["rag"]
+        samples = inputs["samples"]
+        cfg = load_regime_rules()
+        confirmation = None
+        if inputs["signals"] is not None:
+            confirmation = confirm_regime(
+                latest_signals(inputs["signals"]), cfg, load_market_indicators()
+            )
 
         deltas = snapshot["deltas"]
-        regime = classify_regime(
-            spx_pct=deltas["spx_pct"],
-            vix_pct=deltas["vix_pct"],
-            dxy_pct=deltas["dxy_pct"],
-            ust10y_bp=deltas["ust10y_bp"],
-            cfg=cfg,
-        )
-        query = self.prompts.market_pulse_rag_query()
-        docs = retrieve_semantic(index_path, query, k=4)
+        breadth = inputs["breadth"]
+        breadth_signals = breadth["signals"] if breadth else {}
+        regime = classify_regime(**deltas, cfg=cfg, **breadth_signals)
         doc_snips = [
             {
                 "text": d.page_content[:800],
@@ -319,7 +478,7 @@ class MarketIntelligenceSessionController:
             for d in docs
         ]
 
-        samples = get_ticker_samples()
+        leaders = inputs["leaders"]
         top_sectors = sectors_df.head(3).to_dict(orient="records")
         sectors_text = "\\n".join(
             [
@@ -329,8 +488,9 @@ class MarketIntelligenceSessionController:
                     + ": "
                     + f"{float(sector['return']):.1%}"
                     + " change, "
-                    + "tickers: "
-                    + ", ".join(samples.get(sector["sector"], []))
+                    + self._sector_names_text(
+                        leaders.get(sector["sector"]), samples.get(sector["sector"])
+                    )
                 )
                 for sector in top_sectors
             ]
@@ -343,17 +503,37 @@ class MarketIntelligenceSessionController:
             regime_text = regime.get("regime", "Unknown")
         else:
             regime_text = str(regime)
+        if confirmation:
+            regime_text += f" (rolling signals {confirmation['summary']})"
+        active_flags = [name for name, on in regime.get("flags", {}).items() if on]
+        if active_flags:
+            regime_text += f"; active flags: {', '.join(active_flags)}"
+        if breadth:
+            regime_text += f"; breadth: {describe_breadth(breadth['summary'])}"
 
         system = self.prompts.market_pulse_system()
         user_prompt = self.prompts.market_pulse_user(
             regime_text=regime_text, sectors_text=sectors_text, docs_text=docs_text
         )
 
+        llm_start = time.perf_counter()
         result, meta = self.llm_client.chat_structured(
             system_prompt=system,
             user_prompt=user_prompt,
             schema=MarketPulse,
         )
+        timings["llm"] = time.perf_counter() - llm_start
+        timings["total"] = time.perf_counter() - pulse_start
+        self.state.last_pulse_timings = timings
+        logging.info(
+            "Market pulse timings: "
+            + ", ".join(f"{stage}={secs:.2f}s" for stage, secs in timings.items())
+        )
+        flights = cache_stats()["single_flight"]
+        logging.info(
+            f"Market data single-flight: {flights['executions']} fetches, "
+            f"{flights['coalesced']} coalesced"
+        )
 
         _ = self._track_usage(
             model=meta["model"],
@@ -395,31 +575,131 @@ class MarketIntelligenceSessionController:
             fundamentals = get_ticker_fundamentals(ticker)
         except ValueError as e:
             logging.error(f"Error retrieving data for ticker {ticker}: {e}")
-            error_msg = str(e)
-            if "No data available" in error_msg or "No price data" in error_msg:
-                error_msg = (
-                    f"Ticker '{ticker}' not found or has no price data available."
+            return self._ticker_error_analysis(ticker, e)
+
+        doc_snips = self._sector_doc_snips(index_path, ticker_data["sector"])
+        analysis, meta = self._generate_ticker_analysis(
+            ticker, ticker_data, fundamentals, doc_snips
+        )
+        _ = self._track_usage(
+            model=meta["model"],
+            tokens_in=meta["tokens_in"],
+            tokens_out=meta["tokens_out"],
+        )
+        return analysis
+
+    def run_watchlist_deep_dive(
+        self,
+        index_path: str,
+        tickers: list[str],
+        period: str = "3mo",
+    ) -> list["TickerAnalysis"]:
+        """
+        Generate deep dive analyses for a watchlist of tickers.
+
+        Prices for all tickers, the S&P 500 and each distinct sector ETF are
+        fetched in one batch, knowledge base context is retrieved once per
+        sector, and the per-ticker LLM calls run concurrently. A sector
+        whose retrieval fails is analyzed without knowledge base context.
+
+        Args:
+            index_path: Path to FAISS index for RAG retrieval
+            tickers: Ticker symbols; duplicates and blanks are ignored
+            period: Time period for charts and comparison data
+
+        Returns:
+            One TickerAnalysis per distinct ticker, in input order. Tickers
+            that fail carry an "Error: ..." analysis like
+            ``run_ticker_deep_dive``.
+        """
+        symbols = list(dict.fromkeys(t.strip().upper() for t in tickers if t.strip()))
+        if not symbols:
+            return []
+
+        batch = get_ticker_info_batch(tuple(symbols), period)
+        sectors = {data["sector"] for data in batch.values() if isinstance(data, dict)}
+
+        with ThreadPoolExecutor(
+            max_workers=MAX_WATCHLIST_WORKERS, thread_name_prefix="watchlist"
+        ) as executor:
+            doc_futures = {
+                sector: executor.submit(self._sector_doc_snips, index_path, sector)
+                for sector in sectors
+            }
+            sector_docs = {}
+            for sector, future in doc_futures.items():
+                try:
+                    sector_docs[sector] = future.result()
+                except Exception as e:
+                    logging.error(f"Error retrieving context for sector {sector}: {e}")
+                    sector_docs[sector] = []
+            analysis_futures = {
+                ticker: executor.submit(
+                    self._analyze_watchlist_ticker,
+                    ticker,
+                    data,
+                    sector_docs[data["sector"]],
                 )
-            elif "Invalid ticker" in error_msg.lower():
-                error_msg = f"'{ticker}' is not a valid ticker symbol."
-
-            return TickerAnalysis(
-                ticker=ticker,
-                company_name=ticker,
-                sector="Unknown",
-                analysis=f"Error: {error_msg}",
-                ticker_return=0.0,
-                spx_return=0.0,
-                sector_return=0.0,
-                comparison_data=None,
-                fundamentals={},
-                citations=[],
+                for ticker, data in batch.items()
+                if isinstance(data, dict)
+            }
+
+            results = []
+            for ticker in symbols:
+                data = batch[ticker]
+                if not isinstance(data, dict):
+                    results.append(self._ticker_error_analysis(ticker, data))
+                    continue
+                analysis, meta = analysis_futures[ticker].result()
+                if meta:
+                    _ = self._track_usage(
+                        model=meta["model"],
+                        tokens_in=meta["tokens_in"],
+                        tokens_out=meta["tokens_out"],
+                    )
+                results.append(analysis)
+        return results
+
+    def _analyze_watchlist_ticker(
+        self, ticker: str, ticker_data: dict, doc_snips: list[dict]
+    ) -> tuple["TickerAnalysis", dict]:
+        """Run one watchlist analysis, turning failures into error results."""
+        try:
+            fundamentals = get_ticker_fundamentals(ticker)
+            return self._generate_ticker_analysis(
+                ticker, ticker_data, fundamentals, doc_snips
             )
+        except Exception as e:
+            logging.error(f"Error analyzing ticker {ticker}: {e}")
+            return self._ticker_error_analysis(ticker, e), {}
+
+    @staticmethod
+    def _ticker_error_analysis(ticker: str, error: Exception) -> "TickerAnalysis":
+        """Build the TickerAnalysis returned when a ticker cannot be analyzed."""
+        error_msg = str(error)
+        if "No data available" in error_msg or "No price data" in error_msg:
+            error_msg = f"Ticker '{ticker}' not found or has no price data available."
+        elif "Invalid ticker" in error_msg.lower():
+            error_msg = f"'{ticker}' is not a valid ticker symbol."
 
-        sector = ticker_data["sector"]
+        return TickerAnalysis(
+            ticker=ticker,
+            company_name=ticker,
+            sector="Unknown",
+            analysis=f"Error: {error_msg}",
+            ticker_return=0.0,
+            spx_return=0.0,
+            sector_return=0.0,
+            comparison_data=None,
+            fundamentals={},
+            citations=[],
+        )
+
+    def _sector_doc_snips(self, index_path: str, sector: str) -> list[dict]:
+        """Retrieve knowledge base snippets for a sector."""
         query = self.prompts.sector_analysis_rag_query(sector)
         docs = retrieve_semantic(index_path, query, k=3)
-        doc_snips = [
+        return [
             {
                 "text": d.page_content[:600],
                 "source": d.metadata.get("source", "kb"),
@@ -428,6 +708,20 @@ class MarketIntelligenceSessionController:
             for d in docs
         ]
 
+    def _generate_ticker_analysis(
+        self,
+        ticker: str,
+        ticker_data: dict,
+        fundamentals: dict,
+        doc_snips: list[dict],
+    ) -> tuple["TickerAnalysis", dict]:
+        """
+        Ask the LLM for a ticker analysis from prepared data.
+
+        Returns the analysis and the LLM call metadata; usage is tracked by
+        the caller so concurrent calls never update session state.
+        """
+        sector = ticker_data["sector"]
         if self.state.last_market_summary:
             market_context = self.state.last_market_summary
         else:
@@ -464,18 +758,13 @@ class MarketIntelligenceSessionController:
             user_prompt=user_prompt,
         )
 
-        _ = self._track_usage(
-            model=meta["model"],
-            tokens_in=meta["tokens_in"],
-            tokens_out=meta["tokens_out"],
-        )
         citations = []
         for d in doc_snips:
             source_path = d["source"].replace("knowledge_base/playbooks/", "")
             chunk_info = f" (chunk {d['chunk']})" if d.get("chunk") != "" else ""
             citations.append(f"{source_path}{chunk_info}")
 
-        return TickerAnalysis(
+        analysis = TickerAnalysis(
             ticker=ticker,
             company_name=ticker_data["company_name"],
             sector=sector,
@@ -489,3 +778,4 @@ class MarketIntelligenceSessionController:
             fundamentals=fundamentals,
             citations=sorted(set(citations)),
         )
+        return analysis, meta
@@ -7,9 +7,11 @@ The controller depends on these interfaces rather than concrete implementations,
 following the dependency inversion principle.
 
 Key interfaces:
-- LLMClientInt: Language model client for chat and structured outputs
+- LLMClientInt: Language model client for chat, streaming and structured outputs
 - PromptFactory: Dynamic prompt generation with context
 - SecurityGuard: Input validation and content filtering
+- CacheBackend: Shared storage for cached market data results
+- MarketDataProvider: Source of OHLCV bars, company profiles and macro series
 
 This design enables:
 - Easy testing with mock implementations
@@ -30,6 +32,9 @@ if TYPE_CHECKING:
         MarketPulse,
         TickerAnalysis,
     )
+    from .services.llm_openai import ChatStream
+    from pathlib import Path
+    import pandas as pd
 
 
 class LLMClientInt(Protocol):
@@ -75,6 +80,15 @@ class LLMClientInt(Protocol):
         tool_map: dict,
     ) -> tuple[str, dict]: ...
 
+    def stream_chat_with_tools_and_history(
+        self,
+        system_prompt: str,
+        user_input: str,
+        session_id: str,
+        settings: "LLMSettings",
+        tool_map: dict,
+    ) -> "ChatStream": ...
+
     def get_session_history_messages(self, session_id: str) -> list: ...
     def clear_session_history(self, session_id: str) -> None: ...
     def add_user_message_to_session(self, session_id: str, message: str) -> None: ...
@@ -128,6 +142,39 @@ class SecurityGuard(Protocol):
     def moderate(self, text: str) -> None: ...
 
 
+class CacheBackend(Protocol):
+    """Protocol for key/value stores behind the market data result cache."""
+
+    def get(self, key: str) -> Optional[tuple[Any, float]]: ...
+    def set(self, key: str, value: Any, expire_seconds: float) -> None: ...
+    def delete(self, key: str) -> None: ...
+    def clear(self) -> None: ...
+
+
+class MarketDataProvider(Protocol):
+    """Protocol for upstream market data sources behind the on-disk stores."""
+
+    name: str
+    var_dir: "Path"
+
+    def fetch_bars(
+        self,
+        symbols: list[str],
+        period: Optional[str] = None,
+        start: Optional[str] = None,
+        interval: str = "1d",
+    ) -> "pd.DataFrame": ...
+
+    def fetch_profile(self, ticker: str) -> dict: ...
+
+    def fetch_macro_series(
+        self,
+        series_id: str,
+        api_key: str,
+        observation_start: Optional[str] = None,
+    ) -> "pd.Series": ...
+
+
 class MarketIntelligenceController(Protocol):
     """Protocol defining the interface for the market intelligence session controller."""
 
@@ -145,6 +192,16 @@ class MarketIntelligenceController(Protocol):
         use_web_search: bool = False,
     ) -> str: ...
 
+    def ai_desk_chat_stream(
+        self,
+        *,
+        settings: "LLMSettings",
+        language: "RespondLanguage",
+        style: "RespondStyle",
+        user_text: Optional[str] = None,
+        use_web_search: bool = False,
+    ) -> "ChatStream": ...
+
     def greet_and_open(
         self,
         settings: "LLMSettings",
@@ -163,3 +220,10 @@ class MarketIntelligenceController(Protocol):
         ticker: str,
         period: str = "3mo",
     ) -> "TickerAnalysis": ...
+
+    def run_watchlist_deep_dive(
+        self,
+        index_path: str,
+        tickers: list[str],
+        period: str = "3mo",
+    ) -> list["TickerAnalysis"]: ...
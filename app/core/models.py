@@ -77,6 +77,7 @@ class SessionState(BaseModel):
     total_cost: float = 0.0
 
     last_market_summary: Optional[str] = None
+    last_pulse_timings: dict[str, float] = Field(default_factory=dict)
 
     class Config:
         arbitrary_types_allowed = True
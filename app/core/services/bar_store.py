@@ -0,0 +1,351 @@
+"""
+Persistent on-disk store for daily OHLCV bars.
+
+This module keeps downloaded Yahoo Finance history in one Parquet file per
+symbol so that market data survives process restarts and in-memory cache
+expiries. When a symbol is requested again only the bars newer than the
+last stored date are fetched and appended.
+
+Key capabilities:
+- Columnar per-symbol storage under var/bars
+- Incremental delta fetches batched across all stale symbols
+- Backfill of deeper history when a longer period is requested
+- Aligned Close/High/Low panels sliced to Yahoo-style periods
+- Thread-safe synchronisation shared by all Streamlit sessions
+
+The store only talks to the network when a symbol is missing, was last
+synchronised longer ago than the freshness window, or lacks the history
+depth a request needs. Outside market hours, bars synchronised after the
+last session settled are final and are served from disk until the next
+open.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from core.analyzers.horizons import PERIOD_OFFSETS, period_start
+from core.services.data_providers import get_market_data_provider
+from core.services.trading_calendar import MARKET_TZ, get_trading_calendar
+
+BAR_STORE_DIR = Path(__file__).parent.parent.parent / "var" / "bars"
+BAR_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+PERIOD_ORDER = list(PERIOD_OFFSETS) + ["max"]
+
+_manifest_lock = threading.Lock()
+
+
+def _replace_atomically(path: Path, write: Callable[[Path], None]) -> None:
+    """Write ``path`` through a temporary sibling so readers never see a partial file."""
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    os.close(fd)
+    try:
+        write(Path(tmp_name))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _deeper_period(a: str, b: str) -> str:
+    """Return whichever of two periods reaches further back."""
+    rank = {p: i for i, p in enumerate(PERIOD_ORDER)}
+    return a if rank.get(a, len(rank)) >= rank.get(b, len(rank)) else b
+
+
+class BarStore:
+    """
+    Per-symbol Parquet store with incremental Yahoo Finance synchronisation.
+
+    A JSON manifest records when each symbol was last synchronised and how
+    much history has been backfilled, so freshness checks never touch the
+    Parquet files themselves.
+    """
+
+    def __init__(
+        self,
+        root: Path = BAR_STORE_DIR,
+        freshness_seconds: int = 900,
+        history_period: str = "1y",
+    ) -> None:
+        """
+        Initialize bar store.
+
+        Parameters
+        ----------
+        root : Path
+            Directory holding Parquet files and the manifest
+        freshness_seconds : int, default 900
+            Seconds after a sync during which a symbol is served from disk
+            only while a session is running
+        history_period : str, default "1y"
+            Minimum history downloaded the first time a symbol is seen
+        """
+        self.root = Path(root)
+        self.freshness_seconds = freshness_seconds
+        self.history_period = history_period
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._in_flight: set[str] = set()
+        self._manifest_path = self.root / "manifest.json"
+        self._manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict:
+        try:
+            return json.loads(self._manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.warning(f"Warning: Could not read bar store manifest: {e}")
+            return {}
+
+    def _save_manifest(self) -> None:
+        """Merge with the manifest on disk and save, keeping newer entries."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with _manifest_lock:
+            for symbol, entry in self._load_manifest().items():
+                ours = self._manifest.get(symbol)
+                if ours is None or ours.get("fetched_at", 0) < entry.get(
+                    "fetched_at", 0
+                ):
+                    self._manifest[symbol] = entry
+            text = json.dumps(self._manifest, indent=2)
+            _replace_atomically(
+                self._manifest_path, lambda tmp: tmp.write_text(text, encoding="utf-8")
+            )
+
+    def _path(self, symbol: str) -> Path:
+        safe_name = re.sub(r"[^A-Za-z0-9.\-]", "_", symbol)
+        return self.root / f"{safe_name}.parquet"
+
+    def read(self, symbol: str) -> pd.DataFrame:
+        """
+        Read all stored bars for a symbol.
+
+        Parameters
+        ----------
+        symbol : str
+            Ticker symbol
+
+        Returns
+        -------
+        pd.DataFrame
+            Bars indexed by date with OHLCV columns, empty if nothing stored
+        """
+        path = self._path(symbol)
+        if not path.exists():
+            return pd.DataFrame(columns=list(BAR_FIELDS))
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            logging.warning(f"Warning: Corrupt bar file for {symbol}, refetching: {e}")
+            self._manifest.pop(symbol, None)
+            return pd.DataFrame(columns=list(BAR_FIELDS))
+
+    def _write(self, symbol: str, bars: pd.DataFrame) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        bars = bars[~bars.index.duplicated(keep="last")].sort_index()
+        _replace_atomically(self._path(symbol), bars.to_parquet)
+
+    def _needs_backfill(self, symbol: str, period: str) -> bool:
+        entry = self._manifest.get(symbol)
+        if entry is None or not self._path(symbol).exists():
+            return True
+        depth = entry.get("period", self.history_period)
+        return _deeper_period(depth, period) != depth
+
+    def _is_fresh(self, symbol: str) -> bool:
+        entry = self._manifest.get(symbol)
+        if entry is None:
+            return False
+        fetched_at = entry.get("fetched_at", 0)
+        if time.time() - fetched_at < self.freshness_seconds:
+            return True
+        now = datetime.now(MARKET_TZ)
+        calendar = get_trading_calendar()
+        if calendar.is_open(now):
+            return False
+        return fetched_at >= calendar.last_settled(now).timestamp()
+
+    def last_synced(self) -> float:
+        """
+        Get the time of the most recent sync of any symbol.
+
+        Returns
+        -------
+        float
+            Epoch seconds of the latest sync, 0 if nothing is stored
+        """
+        return max(
+            (entry.get("fetched_at", 0) for entry in self._manifest.values()),
+            default=0,
+        )
+
+    @staticmethod
+    def _split_download(data: pd.DataFrame, symbols: list[str]) -> dict:
+        """Split a multi-ticker provider frame into per-symbol OHLCV frames."""
+        frames = {}
+        for symbol in symbols:
+            columns = {
+                field: data[field][symbol]
+                for field in BAR_FIELDS
+                if field in data.columns.get_level_values(0)
+                and symbol in data[field].columns
+            }
+            frame = pd.DataFrame(columns).dropna(how="all")
+            frame.index = pd.DatetimeIndex(frame.index).tz_localize(None)
+            frames[symbol] = frame
+        return frames
+
+    def sync(self, symbols: list[str], period: str = "1y") -> None:
+        """
+        Bring stored history up to date for the given symbols.
+
+        Missing or too-shallow symbols, and stale symbols whose stored bars
+        read back empty, are backfilled in one batch; other stale symbols
+        are refreshed in a second batch starting from the earliest
+        last-stored date among them. The final stored bar is always
+        re-fetched because it may have been captured intraday.
+
+        The store lock is only held to plan the batches and to write their
+        results; downloads run unlocked so syncs of different symbols
+        proceed in parallel. A sync needing a symbol another sync is
+        downloading waits for that download and re-checks it instead of
+        fetching it again.
+
+        Parameters
+        ----------
+        symbols : list[str]
+            Symbols required by the caller
+        period : str, default "1y"
+            History depth the caller needs
+        """
+        with self._ready:
+            self._ready.wait_for(lambda: not self._in_flight.intersection(symbols))
+            backfill = [s for s in symbols if self._needs_backfill(s, period)]
+            stale = [
+                s for s in symbols if s not in backfill and not self._is_fresh(s)
+            ]
+            if not backfill and not stale:
+                return
+
+            last_dates = {s: self.read(s).index.max() for s in stale}
+            backfill += [s for s, last in last_dates.items() if pd.isna(last)]
+            stale = [s for s, last in last_dates.items() if pd.notna(last)]
+            claimed = backfill + stale
+            self._in_flight.update(claimed)
+
+        try:
+            batches = []
+            if backfill:
+                depth = _deeper_period(self.history_period, period)
+                batches.append((self._download(backfill, period=depth), depth, False))
+            if stale:
+                start = min(last_dates[s] for s in stale)
+                frames = self._download(stale, start=start.strftime("%Y-%m-%d"))
+                batches.append((frames, None, True))
+
+            with self._lock:
+                for frames, depth, incremental in batches:
+                    self._store(frames, depth, incremental)
+                self._save_manifest()
+        finally:
+            with self._ready:
+                self._in_flight.difference_update(claimed)
+                self._ready.notify_all()
+
+    def _download(
+        self, symbols: list[str], period: str | None = None, start: str | None = None
+    ) -> dict:
+        """Download bars for several symbols, split per symbol; empty on failure."""
+        try:
+            data = get_market_data_provider().fetch_bars(
+                symbols, period=period, start=start
+            )
+        except Exception as e:
+            logging.error(f"Error downloading bars for {symbols}: {e}")
+            return {}
+        if data.empty:
+            logging.warning(f"Warning: No bars returned for {symbols}")
+            return {}
+        return self._split_download(data, symbols)
+
+    def _store(self, frames: dict, depth: str | None, incremental: bool) -> None:
+        """Write downloaded bars and record them in the manifest."""
+        fetched_at = time.time()
+        for symbol, fresh in frames.items():
+            if fresh.empty:
+                logging.warning(f"Warning: No bars returned for ticker {symbol}")
+                continue
+            if incremental:
+                stored = self.read(symbol)
+                fresh = pd.concat([stored[stored.index < fresh.index.min()], fresh])
+            self._write(symbol, fresh)
+            entry = self._manifest.setdefault(symbol, {"period": depth})
+            entry["period"] = depth or entry.get("period", self.history_period)
+            entry["fetched_at"] = fetched_at
+
+    def load_panel(
+        self, symbols: tuple[str, ...], period: str, fields=("Close", "High", "Low")
+    ) -> dict:
+        """
+        Build an aligned multi-ticker panel from the store.
+
+        Parameters
+        ----------
+        symbols : tuple[str, ...]
+            Symbols to include
+        period : str
+            Yahoo-style period used to slice the stored history
+        fields : tuple, default ("Close", "High", "Low")
+            OHLCV fields to return
+
+        Returns
+        -------
+        dict
+            Mapping of field name to DataFrame indexed by date, one column per
+            symbol
+        """
+        symbols = list(dict.fromkeys(symbols))
+        self.sync(symbols, period)
+
+        start = period_start(period)
+        bars = {}
+        for symbol in symbols:
+            frame = self.read(symbol)
+            if start is not None:
+                frame = frame[frame.index >= start]
+            bars[symbol] = frame
+
+        return {
+            field: pd.DataFrame(
+                {s: bars[s][field] for s in symbols if field in bars[s].columns}
+            )
+            .sort_index()
+            .reindex(columns=symbols)
+            for field in fields
+        }
+
+
+@lru_cache(maxsize=1)
+def get_bar_store() -> BarStore:
+    """
+    Get the process-wide bar store.
+
+    Returns
+    -------
+    BarStore
+        Shared store rooted at var/bars, or under the active provider's
+        data directory
+    """
+    return BarStore(get_market_data_provider().var_dir / "bars")
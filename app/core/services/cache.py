@@ -0,0 +1,414 @@
+"""
+Pluggable result cache for market data services.
+
+This module replaces Streamlit's per-process ``st.cache_data`` for the
+market data layer so the same functions can be cached from a worker
+process, a CLI or tests, and so several Streamlit replicas on one host can
+share one warm cache.
+
+Key capabilities:
+- In-process LRU backend with TTL-based expiry
+- SQLite backend shared by every process on the host
+- ``cached`` decorator with stale-while-revalidate refreshes
+- Refreshes that recompute nested cached calls instead of reading them
+- Single-flight coalescing of concurrent misses for the same key
+- Per-function hit, miss and coalescing statistics
+- Backend selection via the MARKET_CACHE_BACKEND environment variable
+
+Backends store values with the time they were computed; freshness and
+staleness decisions are made by the decorator. Cached functions calling
+other cached functions never build on a stale inner value: while a result
+is being computed, nested calls recompute stale entries inline, and during
+``refresh`` every nested entry is recomputed once.
+"""
+
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from core.interfaces import CacheBackend
+from core.services.data_providers import get_market_data_provider
+from core.services.single_flight import SingleFlight
+
+CACHE_DIR = Path(__file__).parent.parent.parent / "var" / "cache"
+
+
+class MemoryCacheBackend:
+    """
+    Thread-safe in-process LRU cache with per-entry expiry.
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """
+        Initialize memory backend.
+
+        Parameters
+        ----------
+        max_entries : int, default 512
+            Maximum number of entries kept before least recently used
+            entries are evicted
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Any, float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[tuple[Any, float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value, stored_at
+
+    def set(self, key: str, value: Any, expire_seconds: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._entries[key] = (value, now, now + expire_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend:
+    """
+    Host-wide cache stored in a SQLite file readable by several processes.
+
+    Values are pickled. WAL journaling lets readers in other processes
+    proceed while one process writes.
+    """
+
+    def __init__(self, path: Path = CACHE_DIR / "market_data.sqlite") -> None:
+        """
+        Initialize SQLite backend.
+
+        Parameters
+        ----------
+        path : Path
+            Location of the shared cache database
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, "
+                "value BLOB NOT NULL, stored_at REAL NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(str(self.path), timeout=10)
+            self._local.db = db
+        return db
+
+    def get(self, key: str) -> Optional[tuple[Any, float]]:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT value, stored_at FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0]), row[1]
+        except Exception as e:
+            logging.warning(f"Warning: Dropping unreadable cache entry {key}: {e}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, expire_seconds: float) -> None:
+        now = time.time()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO cache (key, value, stored_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, blob, now, now + expire_seconds),
+            )
+            db.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+
+    def delete(self, key: str) -> None:
+        with self._connect() as db:
+            db.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._connect() as db:
+            db.execute("DELETE FROM cache")
+
+
+_backend: Optional[CacheBackend] = None
+_backend_lock = threading.Lock()
+_flights = SingleFlight()
+# Keys already recomputed by the ``refresh`` call running in this context.
+_refreshed: ContextVar[Optional[set[str]]] = ContextVar("refreshed", default=None)
+# True while a cached function body runs, so nested calls skip stale values.
+_computing: ContextVar[bool] = ContextVar("computing", default=False)
+_stats_registry: dict[str, Callable[[], dict]] = {}
+
+
+def get_cache_backend() -> CacheBackend:
+    """
+    Get the active cache backend, creating it on first use.
+
+    MARKET_CACHE_BACKEND selects "sqlite" (default, shared across processes)
+    or "memory" (per process). The SQLite file lives under the active
+    market data provider's data directory. If it cannot be opened the
+    memory backend is used instead.
+
+    Returns
+    -------
+    CacheBackend
+        Backend used by all ``cached`` functions
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            kind = os.getenv("MARKET_CACHE_BACKEND", "sqlite").lower()
+            if kind == "sqlite":
+                path = get_market_data_provider().var_dir / "cache"
+                try:
+                    _backend = SQLiteCacheBackend(path / "market_data.sqlite")
+                except sqlite3.Error as e:
+                    logging.warning(f"Warning: SQLite cache unavailable: {e}")
+            if _backend is None:
+                _backend = MemoryCacheBackend()
+        return _backend
+
+
+def set_cache_backend(backend: CacheBackend) -> None:
+    """
+    Replace the cache backend used by all ``cached`` functions.
+
+    Parameters
+    ----------
+    backend : CacheBackend
+        Backend instance, e.g. a MemoryCacheBackend for tests
+    """
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+def _cache_key(fn: Callable, signature: inspect.Signature, args, kwargs) -> str:
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    payload = pickle.dumps(
+        sorted(bound.arguments.items()), protocol=pickle.HIGHEST_PROTOCOL
+    )
+    digest = hashlib.sha256(payload).hexdigest()
+    return f"{fn.__module__}.{fn.__qualname__}:{digest}"
+
+
+@contextmanager
+def refresh_scope() -> Iterator[None]:
+    """
+    Share one refresh across several ``refresh`` calls.
+
+    Inside the block, a cached call recomputed by one refresh (e.g. a
+    price panel read by several jobs) is not recomputed again by the next.
+    """
+    if _refreshed.get() is not None:
+        yield
+        return
+    token = _refreshed.set(set())
+    try:
+        yield
+    finally:
+        _refreshed.reset(token)
+
+
+def cached(ttl: float, stale_ttl: float = 0) -> Callable:
+    """
+    Cache a function's results in the active backend.
+
+    Results younger than ``ttl`` are returned directly. Results older than
+    ``ttl`` but younger than ``ttl + stale_ttl`` are returned immediately
+    while a background thread recomputes them (stale-while-revalidate).
+    Anything older is recomputed inline. Concurrent recomputations of the
+    same key within a process are coalesced into a single call.
+
+    Calls made while another cached function is computing are never
+    served stale, and ``refresh`` recomputes every cached call beneath it
+    once, so stacked layers do not store an inner layer's old data as new.
+
+    Parameters
+    ----------
+    ttl : float
+        Seconds a result is considered fresh
+    stale_ttl : float, default 0
+        Extra seconds a stale result may be served during revalidation
+
+    Returns
+    -------
+    Callable
+        Decorator adding caching plus ``refresh``, ``clear``, ``age`` and
+        ``stats`` helpers to the wrapped function
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+        refreshing: set[str] = set()
+        refreshing_lock = threading.Lock()
+        counters = {"hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0}
+        counters_lock = threading.Lock()
+
+        def count(name: str) -> None:
+            with counters_lock:
+                counters[name] += 1
+
+        def compute(key: str, args, kwargs) -> Any:
+            token = _computing.set(True)
+            try:
+                value = fn(*args, **kwargs)
+            finally:
+                _computing.reset(token)
+            get_cache_backend().set(key, value, ttl + stale_ttl)
+            return value
+
+        def load(key: str, args, kwargs) -> Any:
+            # A caller that just finished may have stored the value between
+            # our cache miss and joining the flight.
+            entry = get_cache_backend().get(key)
+            if entry is not None and time.time() - entry[1] < ttl:
+                return entry[0]
+            return compute(key, args, kwargs)
+
+        def coalesced(key: str, target: Callable, args, kwargs) -> Any:
+            value, shared = _flights.do(key, target, key, args, kwargs)
+            if shared:
+                count("coalesced")
+            return value
+
+        def revalidate(key: str, args, kwargs) -> None:
+            try:
+                coalesced(key, compute, args, kwargs)
+            except Exception as e:
+                logging.error(f"Background refresh of {fn.__qualname__} failed: {e}")
+            finally:
+                with refreshing_lock:
+                    refreshing.discard(key)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = _cache_key(fn, signature, args, kwargs)
+            refreshed = _refreshed.get()
+            if refreshed is not None and key not in refreshed:
+                refreshed.add(key)
+                count("misses")
+                return coalesced(key, compute, args, kwargs)
+            entry = get_cache_backend().get(key)
+            if entry is not None:
+                value, stored_at = entry
+                age = time.time() - stored_at
+                if age < ttl:
+                    count("hits")
+                    return value
+                if age < ttl + stale_ttl and not _computing.get():
+                    count("stale_hits")
+                    with refreshing_lock:
+                        start_refresh = key not in refreshing
+                        refreshing.add(key)
+                    if start_refresh:
+                        threading.Thread(
+                            target=revalidate,
+                            args=(key, args, kwargs),
+                            name=f"revalidate-{fn.__name__}",
+                            daemon=True,
+                        ).start()
+                    return value
+            count("misses")
+            return coalesced(key, load, args, kwargs)
+
+        def refresh(*args, **kwargs) -> Any:
+            """
+            Recompute and store a result regardless of its age.
+
+            Cached functions called while computing it are recomputed too,
+            each key once per refresh.
+            """
+            key = _cache_key(fn, signature, args, kwargs)
+            refreshed = _refreshed.get()
+            if refreshed is not None:
+                refreshed.add(key)
+                return coalesced(key, compute, args, kwargs)
+            token = _refreshed.set({key})
+            try:
+                return coalesced(key, compute, args, kwargs)
+            finally:
+                _refreshed.reset(token)
+
+        def clear(*args, **kwargs) -> None:
+            """Drop the cached result for the given arguments."""
+            get_cache_backend().delete(_cache_key(fn, signature, args, kwargs))
+
+        def age(*args, **kwargs) -> Optional[float]:
+            """Return seconds since the cached result was stored, or None."""
+            entry = get_cache_backend().get(_cache_key(fn, signature, args, kwargs))
+            return None if entry is None else time.time() - entry[1]
+
+        def stats() -> dict:
+            """
+            Return hit, stale hit, miss and coalesced call counts.
+
+            ``coalesced`` counts calls that received the result of another
+            caller's in-flight computation instead of running their own.
+            """
+            with counters_lock:
+                return dict(counters)
+
+        wrapper.refresh = refresh
+        wrapper.clear = clear
+        wrapper.age = age
+        wrapper.stats = stats
+        wrapper.ttl = ttl
+        wrapper.stale_ttl = stale_ttl
+        _stats_registry[f"{fn.__module__}.{fn.__qualname__}"] = stats
+        return wrapper
+
+    return decorator
+
+
+def cache_stats() -> dict:
+    """
+    Get cache and coalescing statistics for every ``cached`` function.
+
+    Returns
+    -------
+    dict
+        Keys:
+        - functions: qualified function name to its hit/miss/coalesced counts
+        - single_flight: process-wide execution and coalescing counters
+    """
+    return {
+        "functions": {name: stats() for name, stats in _stats_registry.items()},
+        "single_flight": _flights.stats(),
+    }
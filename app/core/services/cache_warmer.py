@@ -0,0 +1,324 @@
+"""
+Background warmer for the market data cache.
+
+The first visitor of the day used to pay the full cold cost of the sector,
+snapshot, index and yield fetches. This module runs a daemon thread,
+independent of Streamlit reruns, that refreshes those cached results
+before they expire so interactive requests are served from a warm cache.
+
+Refresh cadence follows the trading calendar (US/Eastern clock):
+- pre_open: every job is refreshed once between PRE_OPEN and the open
+- open: until shortly after the (possibly early) close, jobs are refreshed
+  when they reach ``1 - lead_fraction`` of their TTL
+- closed: nights, weekends and holidays refresh each entry once after
+  the last session settled, then skip jobs while the bar store holds that
+  session's final bars; expired entries are recomputed from disk on demand
+
+Job ages are read from the cache backend, so several processes sharing
+the SQLite backend do not refresh the same entry twice. A refresh also
+recomputes the cached layers beneath a job (price panels, sector
+horizons), each once per pass, so it pulls new bars instead of restoring
+an inner layer's stale value.
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from datetime import time as clock
+from typing import Callable, Optional
+
+from core.analyzers.horizons import HORIZONS
+from core.services.bar_store import BarStore, get_bar_store
+from core.services.cache import refresh_scope
+from core.services.market_data import (
+    _get_yield_data,
+    get_constituent_scan,
+    get_index_snap,
+    get_market_breadth,
+    get_market_signals,
+    get_market_snapshot,
+    get_sector_horizons,
+    get_sector_perf,
+)
+from core.services.trading_calendar import (
+    MARKET_OPEN,
+    MARKET_TZ,
+    TradingCalendar,
+    get_trading_calendar,
+)
+
+PRE_OPEN = clock(8, 30)
+
+
+class WarmJob:
+    """
+    One cached call kept warm by the warmer.
+    """
+
+    def __init__(self, fn: Callable, *args, **kwargs) -> None:
+        """
+        Initialize warm job.
+
+        Parameters
+        ----------
+        fn : Callable
+            Function decorated with ``core.services.cache.cached``
+        *args, **kwargs
+            Arguments identifying the cache entry, as interactive callers
+            pass them
+        """
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        params = [repr(a) for a in args] + [f"{k}={v!r}" for k, v in kwargs.items()]
+        self.name = f"{fn.__name__}({', '.join(params)})"
+
+    def age(self) -> Optional[float]:
+        """Return the age of the cached entry in seconds, or None if absent."""
+        return self.fn.age(*self.args, **self.kwargs)
+
+    def refresh(self) -> None:
+        """Recompute and store the cached entry."""
+        self.fn.refresh(*self.args, **self.kwargs)
+
+
+def default_warm_jobs(
+    index_tickers: tuple[str, ...] = (), periods: tuple[str, ...] = HORIZONS
+) -> list[WarmJob]:
+    """
+    Build the jobs behind the market overview and the market pulse.
+
+    Jobs are ordered so that results other jobs read from the cache
+    (sector horizons, yields) are refreshed first.
+
+    Parameters
+    ----------
+    index_tickers : tuple[str, ...], default ()
+        Indicator tickers charted on the overview tab; no index jobs when
+        empty
+    periods : tuple[str, ...], default HORIZONS
+        Analysis and chart periods to keep warm
+
+    Returns
+    -------
+    list[WarmJob]
+        Jobs in refresh order
+    """
+    jobs = [WarmJob(get_sector_horizons)]
+    jobs += [WarmJob(get_sector_perf, period=p) for p in periods]
+    jobs += [WarmJob(_get_yield_data, p) for p in periods]
+    jobs += [WarmJob(get_market_snapshot, period=p) for p in periods]
+    if index_tickers:
+        jobs += [
+            WarmJob(get_index_snap, tickers=list(index_tickers), period=p)
+            for p in periods
+        ]
+    jobs.append(WarmJob(get_market_signals))
+    jobs.append(WarmJob(get_market_breadth))
+    jobs.append(WarmJob(get_constituent_scan, period="1wk"))
+    return jobs
+
+
+class CacheWarmer:
+    """
+    Calendar-aware background refresher for cached market data.
+    """
+
+    def __init__(
+        self,
+        jobs: list[WarmJob],
+        lead_fraction: float = 0.2,
+        poll_seconds: float = 30,
+        retry_seconds: float = 300,
+        calendar: Optional[TradingCalendar] = None,
+        bar_store: Optional[BarStore] = None,
+    ) -> None:
+        """
+        Initialize cache warmer.
+
+        Parameters
+        ----------
+        jobs : list[WarmJob]
+            Cached calls to keep warm, refreshed in list order
+        lead_fraction : float, default 0.2
+            Fraction of the TTL before expiry at which entries are refreshed
+        poll_seconds : float, default 30
+            Seconds between checks for due jobs
+        retry_seconds : float, default 300
+            Seconds before a failed job is attempted again
+        calendar : TradingCalendar, optional
+            Session calendar, defaults to the shared trading calendar
+        bar_store : BarStore, optional
+            Store whose last sync tells whether final bars are on disk,
+            defaults to the shared bar store
+        """
+        self.jobs = jobs
+        self.lead_fraction = lead_fraction
+        self.poll_seconds = poll_seconds
+        self.retry_seconds = retry_seconds
+        self.calendar = calendar or get_trading_calendar()
+        self.bar_store = bar_store or get_bar_store()
+        self.refreshes = 0
+        self.failures = 0
+        self._retry_at: dict[str, float] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def phase(self, now: datetime) -> str:
+        """
+        Classify a moment as "pre_open", "open" or "closed".
+
+        Parameters
+        ----------
+        now : datetime
+            Timezone-aware moment
+
+        Returns
+        -------
+        str
+            Market phase driving the refresh cadence
+        """
+        local = now.astimezone(MARKET_TZ)
+        if not self.calendar.is_trading_day(local.date()):
+            return "closed"
+        if PRE_OPEN <= local.time() < MARKET_OPEN:
+            return "pre_open"
+        return "open" if self.calendar.is_open(local) else "closed"
+
+    def is_due(self, job: WarmJob, now: datetime) -> bool:
+        """
+        Check whether a job's cache entry should be refreshed now.
+
+        Parameters
+        ----------
+        job : WarmJob
+            Job to check
+        now : datetime
+            Timezone-aware moment
+
+        Returns
+        -------
+        bool
+            True when the entry is missing or due for its phase; while
+            closed, only entries computed before the last session settled
+            are due, and missing ones only until the bar store has synced
+            since then
+        """
+        age = job.age()
+        phase = self.phase(now)
+        if phase == "closed":
+            settled_at = self.calendar.last_settled(now).timestamp()
+            if age is None:
+                return self.bar_store.last_synced() < settled_at
+            return time.time() - age < settled_at
+        if age is None:
+            return True
+        if phase == "pre_open":
+            local = now.astimezone(MARKET_TZ)
+            pre_open_at = datetime.combine(local.date(), PRE_OPEN, MARKET_TZ)
+            return age > (local - pre_open_at).total_seconds()
+        return age >= job.fn.ttl * (1 - self.lead_fraction)
+
+    def run_once(self, now: Optional[datetime] = None) -> list[str]:
+        """
+        Refresh every job that is due.
+
+        Jobs run in one refresh scope, so a price panel or other nested
+        cached call shared by several due jobs is recomputed only once.
+
+        Parameters
+        ----------
+        now : datetime, optional
+            Timezone-aware moment, defaults to the current time
+
+        Returns
+        -------
+        list[str]
+            Names of the jobs refreshed successfully
+        """
+        now = now or datetime.now(MARKET_TZ)
+        refreshed = []
+        with refresh_scope():
+            for job in self.jobs:
+                if self._stop.is_set():
+                    break
+                if time.time() < self._retry_at.get(job.name, 0):
+                    continue
+                try:
+                    if not self.is_due(job, now):
+                        continue
+                    job.refresh()
+                except Exception as e:
+                    self.failures += 1
+                    self._retry_at[job.name] = time.time() + self.retry_seconds
+                    logging.error(f"Cache warm-up of {job.name} failed: {e}")
+                    continue
+                self.refreshes += 1
+                refreshed.append(job.name)
+        if refreshed:
+            logging.info(f"Cache warmer refreshed {len(refreshed)} entries")
+        return refreshed
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.poll_seconds)
+
+    def start(self) -> None:
+        """Start the background thread if it is not already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="cache-warmer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Signal the background thread to stop and wait for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        """Return refresh and failure counters."""
+        return {
+            "jobs": len(self.jobs),
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
+
+
+_warmer: Optional[CacheWarmer] = None
+_warmer_lock = threading.Lock()
+
+
+def start_cache_warmer(index_tickers: tuple[str, ...] = ()) -> Optional[CacheWarmer]:
+    """
+    Start the process-wide cache warmer once.
+
+    Safe to call on every Streamlit rerun; later calls return the running
+    warmer. Setting MARKET_CACHE_WARMER to "off" disables warming.
+
+    Parameters
+    ----------
+    index_tickers : tuple[str, ...], default ()
+        Indicator tickers charted on the overview tab
+
+    Returns
+    -------
+    CacheWarmer or None
+        The running warmer, or None when disabled
+    """
+    global _warmer
+    if os.getenv("MARKET_CACHE_WARMER", "on").lower() in ("off", "0", "false"):
+        return None
+    with _warmer_lock:
+        if _warmer is None:
+            _warmer = CacheWarmer(default_warm_jobs(tuple(index_tickers)))
+            _warmer.start()
+            logging.info(f"Cache warmer started with {len(_warmer.jobs)} jobs")
+        return _warmer
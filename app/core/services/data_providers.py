@@ -0,0 +1,408 @@
+"""
+Upstream market data providers for the bar, fundamentals and FRED stores.
+
+Every network call for prices, company profiles and macro series goes
+through a MarketDataProvider, so the whole pipeline can be run, profiled
+and load-tested without network access.
+
+Providers:
+- YahooFredProvider: live data from Yahoo Finance and FRED (default)
+- SyntheticMarketProvider: deterministic offline data served from a replay
+  directory, or generated from a per-symbol seeded random walk when no
+  recording exists
+
+The MARKET_DATA_PROVIDER environment variable selects "yahoo" or
+"synthetic" when the process starts. Stores and the result cache built
+from synthetic data live under var/synthetic so they never mix with live
+data. FRED-backed paths still require FRED_API_KEY to be set; the
+synthetic provider ignores its value.
+
+Replay directory layout (MARKET_REPLAY_DIR, default var/replay), matching
+the on-disk stores so a copy of var/bars and var/fred is a valid recording:
+- bars/<symbol>.parquet: OHLCV bars indexed by date
+- fred/<series_id>.parquet: observations in a "value" column
+- profiles.json: ticker to Yahoo info fields
+"""
+
+import json
+import logging
+import os
+import re
+import zlib
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from fredapi import Fred
+
+from core.interfaces import MarketDataProvider
+from core.services.trading_calendar import get_trading_calendar
+
+VAR_DIR = Path(__file__).parent.parent.parent / "var"
+REPLAY_DIR = VAR_DIR / "replay"
+SECTORS_PATH = (
+    Path(__file__).parent.parent.parent
+    / "knowledge_base"
+    / "semistatic"
+    / "sector_representatives.json"
+)
+SYNTHETIC_START = "2015-01-02"
+BAR_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+PERIOD_UNITS = {"d": "days", "wk": "weeks", "mo": "months", "y": "years"}
+
+
+def _period_offset(period: Optional[str]) -> Optional[pd.DateOffset]:
+    """Convert a Yahoo-style period such as "3mo" to an offset, None for max."""
+    match = re.fullmatch(r"(\d+)(d|wk|mo|y)", period or "")
+    if not match:
+        return None
+    return pd.DateOffset(**{PERIOD_UNITS[match.group(2)]: int(match.group(1))})
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9.\-]", "_", name)
+
+
+def _series_name(series_id: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]", "_", series_id)
+
+
+def _seed(name: str) -> int:
+    return zlib.crc32(name.encode("utf-8"))
+
+
+class YahooFredProvider:
+    """
+    Live provider backed by yfinance and fredapi.
+    """
+
+    name = "yahoo"
+    var_dir = VAR_DIR
+
+    def fetch_bars(
+        self,
+        symbols: list[str],
+        period: Optional[str] = None,
+        start: Optional[str] = None,
+        interval: str = "1d",
+    ) -> pd.DataFrame:
+        """
+        Download adjusted OHLCV bars.
+
+        Parameters
+        ----------
+        symbols : list[str]
+            Ticker symbols
+        period : str, optional
+            Yahoo-style period, ignored when ``start`` is given
+        start : str, optional
+            First date to download (YYYY-MM-DD)
+        interval : str, default "1d"
+            Bar interval
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns (field, symbol) as returned by ``yf.download``
+        """
+        return yf.download(
+            symbols,
+            period=period,
+            start=start,
+            interval=interval,
+            auto_adjust=True,
+            progress=False,
+        )
+
+    def fetch_profile(self, ticker: str) -> dict:
+        """Return the Yahoo ``info`` dict for a ticker."""
+        return yf.Ticker(ticker).info or {}
+
+    def fetch_macro_series(
+        self, series_id: str, api_key: str, observation_start: Optional[str] = None
+    ) -> pd.Series:
+        """Return FRED observations, optionally starting at a date."""
+        fred = _fred_client(api_key)
+        if observation_start is None:
+            return fred.get_series(series_id)
+        return fred.get_series(series_id, observation_start=observation_start)
+
+
+@lru_cache(maxsize=4)
+def _fred_client(api_key: str) -> Fred:
+    return Fred(api_key=api_key)
+
+
+class SyntheticMarketProvider:
+    """
+    Offline provider serving recorded data, or seeded random walks.
+
+    Generated series start at SYNTHETIC_START and follow the trading
+    calendar up to today. Values for a given symbol and date never change
+    between runs, so timings and outputs are reproducible.
+    """
+
+    name = "synthetic"
+    var_dir = VAR_DIR / "synthetic"
+
+    def __init__(self, root: Path = REPLAY_DIR) -> None:
+        """
+        Initialize synthetic provider.
+
+        Parameters
+        ----------
+        root : Path
+            Replay directory with recorded bars, FRED series and profiles
+        """
+        self.root = Path(root)
+        try:
+            self._profiles = json.loads(
+                (self.root / "profiles.json").read_text("utf-8")
+            )
+        except FileNotFoundError:
+            self._profiles = {}
+        except Exception as e:
+            logging.warning(f"Warning: Could not read replay profiles: {e}")
+            self._profiles = {}
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _sessions(end: date) -> pd.DatetimeIndex:
+        holidays = get_trading_calendar().holidays_between(SYNTHETIC_START, end)
+        return pd.bdate_range(SYNTHETIC_START, end, freq="C", holidays=holidays)
+
+    def _generate_bars(self, symbol: str) -> pd.DataFrame:
+        sessions = self._sessions(date.today())
+        seed = _seed(symbol)
+        rng = np.random.default_rng(seed)
+        n = len(sessions)
+        base = 10 ** (1 + (seed % 1000) / 500)
+        sigma = 0.008 + (seed % 17) / 1000
+        close = base * np.exp(np.cumsum(rng.normal(0.0002, sigma, n)))
+        gap = np.exp(rng.normal(0, sigma / 3, n))
+        open_ = np.concatenate([[base], close[:-1]]) * gap
+        wick = np.abs(rng.normal(0, sigma / 2, (2, n)))
+        return pd.DataFrame(
+            {
+                "Open": open_,
+                "High": np.maximum(open_, close) * (1 + wick[0]),
+                "Low": np.minimum(open_, close) * (1 - wick[1]),
+                "Close": close,
+                "Volume": np.round(
+                    1e6 * (1 + seed % 50) * np.exp(rng.normal(0, 0.3, n))
+                ),
+            },
+            index=sessions,
+        )
+
+    def _bars(self, symbol: str) -> pd.DataFrame:
+        path = self.root / "bars" / f"{_safe_name(symbol)}.parquet"
+        if path.exists():
+            try:
+                return pd.read_parquet(path)
+            except Exception as e:
+                logging.warning(f"Warning: Corrupt replay file for {symbol}: {e}")
+        return self._generate_bars(symbol)
+
+    def fetch_bars(
+        self,
+        symbols: list[str],
+        period: Optional[str] = None,
+        start: Optional[str] = None,
+        interval: str = "1d",
+    ) -> pd.DataFrame:
+        """
+        Serve OHLCV bars shaped like ``yf.download`` output.
+
+        Weekly ("1wk") and monthly ("1mo") intervals are resampled from the
+        daily bars; other intervals return daily bars.
+
+        Parameters
+        ----------
+        symbols : list[str]
+            Ticker symbols
+        period : str, optional
+            Yahoo-style period, ignored when ``start`` is given
+        start : str, optional
+            First date to return (YYYY-MM-DD)
+        interval : str, default "1d"
+            Bar interval
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns (field, symbol)
+        """
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        frames = {}
+        for symbol in symbols:
+            bars = self._bars(symbol)
+            if start is not None:
+                bars = bars[bars.index >= pd.Timestamp(start)]
+            elif _period_offset(period) is not None and not bars.empty:
+                bars = bars[bars.index >= bars.index[-1] - _period_offset(period)]
+            if interval in ("1wk", "1mo"):
+                rule = "W-FRI" if interval == "1wk" else "ME"
+                bars = (
+                    bars.resample(rule)
+                    .agg(
+                        {
+                            "Open": "first",
+                            "High": "max",
+                            "Low": "min",
+                            "Close": "last",
+                            "Volume": "sum",
+                        }
+                    )
+                    .dropna(subset=["Close"])
+                )
+            frames[symbol] = bars.reindex(columns=list(BAR_FIELDS))
+
+        data = pd.concat(frames, axis=1, names=["Ticker", "Price"])
+        data = data.swaplevel(0, 1, axis=1).sort_index(axis=1, level=0)
+        data.index.name = "Date"
+        return data
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _sector_names() -> dict[str, str]:
+        """Map every listed constituent and sector ETF to its Yahoo sector."""
+        data = json.loads(SECTORS_PATH.read_text("utf-8"))["sector_representatives.json"]
+        sectors = {}
+        for etf, etf_data in data.items():
+            name = etf_data.get("yahoo_sector_name")
+            if not name:
+                continue
+            sectors.setdefault(etf, name)
+            for ticker in etf_data.get("stocks", {}):
+                sectors.setdefault(ticker, name)
+        return sectors
+
+    def fetch_profile(self, ticker: str) -> dict:
+        """
+        Serve a recorded or generated Yahoo-style ``info`` dict.
+
+        Generated profiles use the sector the ticker is listed under in
+        sector_representatives.json, Technology otherwise.
+        """
+        if ticker in self._profiles:
+            return dict(self._profiles[ticker])
+        seed = _seed(ticker)
+        close = self._bars(ticker)["Close"]
+        year = close.iloc[-252:]
+        return {
+            "sector": self._sector_names().get(ticker, "Technology"),
+            "longName": f"{ticker} (synthetic)",
+            "marketCap": float(1e9 * (1 + seed % 2000)),
+            "trailingPE": 8 + (seed % 400) / 10,
+            "forwardPE": 7 + (seed % 350) / 10,
+            "dividendYield": (seed % 50) / 1000,
+            "beta": 0.5 + (seed % 150) / 100,
+            "fiftyTwoWeekHigh": float(year.max()),
+            "fiftyTwoWeekLow": float(year.min()),
+        }
+
+    def fetch_macro_series(
+        self, series_id: str, api_key: str, observation_start: Optional[str] = None
+    ) -> pd.Series:
+        """
+        Serve a recorded or generated macro series; ``api_key`` is ignored.
+        """
+        path = self.root / "fred" / f"{_series_name(series_id)}.parquet"
+        series = None
+        if path.exists():
+            try:
+                series = pd.read_parquet(path)["value"]
+            except Exception as e:
+                logging.warning(f"Warning: Corrupt replay file for {series_id}: {e}")
+        if series is None:
+            sessions = self._sessions(date.today())
+            seed = _seed(series_id)
+            rng = np.random.default_rng(seed)
+            walk = np.cumsum(rng.normal(0, 0.04, len(sessions)))
+            level = 1 + (seed % 500) / 100 + walk
+            series = pd.Series(np.clip(level, 0.01, None), index=sessions)
+        if observation_start is not None:
+            series = series[series.index >= pd.Timestamp(observation_start)]
+        return series
+
+
+def record_replay(
+    symbols: list[str],
+    series_ids: list[str] = (),
+    api_key: str = "",
+    period: str = "5y",
+    root: Path = REPLAY_DIR,
+) -> None:
+    """
+    Record live data into a replay directory for SyntheticMarketProvider.
+
+    Parameters
+    ----------
+    symbols : list[str]
+        Tickers whose bars and profiles are recorded
+    series_ids : list[str], default ()
+        FRED series to record, requires ``api_key``
+    api_key : str, default ""
+        FRED API key
+    period : str, default "5y"
+        Bar history depth
+    root : Path
+        Replay directory to write
+    """
+    root = Path(root)
+    live = YahooFredProvider()
+    (root / "bars").mkdir(parents=True, exist_ok=True)
+    data = live.fetch_bars(list(symbols), period=period)
+    for symbol in symbols:
+        frame = pd.DataFrame(
+            {field: data[field][symbol] for field in BAR_FIELDS if field in data}
+        ).dropna(how="all")
+        frame.index = pd.DatetimeIndex(frame.index).tz_localize(None)
+        frame.to_parquet(root / "bars" / f"{_safe_name(symbol)}.parquet")
+
+    profiles_path = root / "profiles.json"
+    profiles = (
+        json.loads(profiles_path.read_text("utf-8")) if profiles_path.exists() else {}
+    )
+    for symbol in symbols:
+        try:
+            profiles[symbol] = live.fetch_profile(symbol)
+        except Exception as e:
+            logging.error(f"Error recording profile for {symbol}: {str(e)}")
+    profiles_path.write_text(json.dumps(profiles, indent=2, default=str), "utf-8")
+
+    if series_ids:
+        (root / "fred").mkdir(parents=True, exist_ok=True)
+        for series_id in series_ids:
+            series = live.fetch_macro_series(series_id, api_key).dropna()
+            series.to_frame("value").to_parquet(
+                root / "fred" / f"{_series_name(series_id)}.parquet"
+            )
+
+
+@lru_cache(maxsize=1)
+def get_market_data_provider() -> MarketDataProvider:
+    """
+    Get the process-wide market data provider.
+
+    MARKET_DATA_PROVIDER selects "yahoo" (default) or "synthetic";
+    MARKET_REPLAY_DIR overrides the synthetic provider's replay directory.
+
+    Returns
+    -------
+    MarketDataProvider
+        Provider used by the bar, fundamentals and FRED stores
+    """
+    kind = os.getenv("MARKET_DATA_PROVIDER", "yahoo").lower()
+    if kind in ("synthetic", "replay"):
+        root = Path(os.getenv("MARKET_REPLAY_DIR", str(REPLAY_DIR)))
+        logging.info(f"Using synthetic market data provider ({root})")
+        return SyntheticMarketProvider(root)
+    if kind != "yahoo":
+        logging.warning(f"Warning: Unknown MARKET_DATA_PROVIDER {kind}, using yahoo")
+    return YahooFredProvider()
@@ -0,0 +1,236 @@
+"""
+Parallel, streaming text extraction for knowledge base documents.
+
+PDF pages are extracted in a process pool in small page ranges, so a
+long filing or a batch of uploads spreads across cores. Results are
+consumed in document order through a bounded window of in-flight ranges,
+and pages are streamed into the text splitter one at a time; neither the
+whole document text nor all of its pages are held in memory at once.
+
+Key capabilities:
+- Page-range extraction with PyPDF2 and a pdfplumber fallback per range
+- Ordered, bounded fan-out across all pages of all documents
+- Incremental chunking of page streams with a LangChain text splitter
+- Plain text and markdown files read in the calling process
+"""
+
+import multiprocessing
+import os
+import pathlib
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+import PyPDF2
+import pdfplumber
+from langchain_text_splitters import TextSplitter
+
+PAGES_PER_TASK = 16
+EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+TASKS_IN_FLIGHT = 2 * EXTRACT_WORKERS
+
+
+@lru_cache(maxsize=1)
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """
+    Get the process-wide pool used for PDF page extraction.
+
+    Workers are spawned rather than forked: by the time the pool starts,
+    the app process runs background threads (cache warmer, index
+    compactor) and may hold SQLite and logging locks that a forked child
+    would inherit in a locked state.
+
+    Returns
+    -------
+    ProcessPoolExecutor
+        Pool with EXTRACT_WORKERS spawned processes, started on first use
+    """
+    return ProcessPoolExecutor(
+        max_workers=EXTRACT_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _is_pdf(path: str) -> bool:
+    return pathlib.Path(path).suffix.lower() == ".pdf"
+
+
+def _page_count(path: str) -> int:
+    try:
+        return len(PyPDF2.PdfReader(path).pages)
+    except Exception:
+        with pdfplumber.open(path) as pdf:
+            return len(pdf.pages)
+
+
+def _plumber_text(page) -> str:
+    text = page.extract_text() or ""
+    page.close()
+    return text
+
+
+@lru_cache(maxsize=2)
+def _open_reader(path: str, mtime_ns: int) -> PyPDF2.PdfReader:
+    # Cached per worker process so consecutive ranges skip re-parsing.
+    return PyPDF2.PdfReader(path)
+
+
+def _extract_pages(path: str, start: int, stop: int) -> list[str]:
+    """Extract the text of pages ``start`` to ``stop`` (exclusive)."""
+    try:
+        reader = _open_reader(path, os.stat(path).st_mtime_ns)
+        return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+    except Exception:
+        with pdfplumber.open(path) as pdf:
+            return [_plumber_text(pdf.pages[i]) for i in range(start, stop)]
+
+
+def _read_text(path: str) -> list[str]:
+    try:
+        return [pathlib.Path(path).read_text(encoding="utf-8")]
+    except UnicodeDecodeError:
+        raise ValueError(f"Unsupported file type: {pathlib.Path(path).suffix}")
+
+
+def _raise(error: Exception) -> None:
+    raise error
+
+
+def _done(fn, *args) -> Future:
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _tasks(
+    paths: list[str], executor: Optional[Executor]
+) -> Iterator[tuple[int, Future]]:
+    for position, path in enumerate(paths):
+        if not _is_pdf(path):
+            yield position, _done(_read_text, path)
+            continue
+        try:
+            pages = _page_count(path)
+        except Exception as e:
+            yield position, _done(_raise, e)
+            continue
+        for start in range(0, pages, PAGES_PER_TASK):
+            stop = min(start + PAGES_PER_TASK, pages)
+            if executor is None:
+                yield position, _done(_extract_pages, path, start, stop)
+            else:
+                yield position, executor.submit(_extract_pages, path, start, stop)
+
+
+def _ordered(
+    tasks: Iterator[tuple[int, Future]], window: int
+) -> Iterator[tuple[int, Future]]:
+    pending: deque[tuple[int, Future]] = deque()
+    for task in tasks:
+        pending.append(task)
+        if len(pending) >= window:
+            yield pending.popleft()
+    yield from pending
+
+
+def _pages(group: Iterable[tuple[int, Future]]) -> Iterator[str]:
+    for _, future in group:
+        yield from future.result()
+
+
+def stream_pages(
+    paths: list[str], executor: Optional[Executor] = None
+) -> Iterator[tuple[str, Iterator[str]]]:
+    """
+    Stream the page texts of several documents in order.
+
+    Page ranges of all documents are submitted to the pool ahead of
+    consumption, at most TASKS_IN_FLIGHT at a time, so later documents are
+    extracted while earlier ones are being chunked and embedded.
+
+    Parameters
+    ----------
+    paths : list[str]
+        Documents to read; PDFs are split into pages, other files are read
+        as one UTF-8 page
+    executor : Executor, optional
+        Pool for PDF page ranges, defaults to the shared extraction pool;
+        pages are extracted in the calling process on single-core hosts
+
+    Yields
+    ------
+    tuple[str, Iterator[str]]
+        Each path with an iterator over its page texts. The iterator must
+        be consumed (or abandoned) before advancing to the next document;
+        it raises the document's extraction error, if any.
+    """
+    if executor is None and EXTRACT_WORKERS > 1:
+        executor = get_extraction_pool()
+    tasks = _ordered(_tasks(paths, executor), TASKS_IN_FLIGHT)
+    for position, group in groupby(tasks, key=lambda task: task[0]):
+        yield paths[position], _pages(group)
+
+
+def iter_pdf_pages(source: str | BinaryIO) -> Iterator[str]:
+    """
+    Stream the page texts of one PDF, extracted in the calling process.
+
+    PyPDF2 is tried first; pdfplumber is used when PyPDF2 cannot open the
+    document.
+
+    Parameters
+    ----------
+    source : str or BinaryIO
+        Path or binary file object of the PDF
+
+    Yields
+    ------
+    str
+        Text of each page
+    """
+    try:
+        pages = PyPDF2.PdfReader(source).pages
+    except Exception:
+        if hasattr(source, "seek"):
+            source.seek(0)
+        with pdfplumber.open(source) as pdf:
+            for page in pdf.pages:
+                yield _plumber_text(page)
+        return
+    for page in pages:
+        yield page.extract_text() or ""
+
+
+def stream_chunks(pages: Iterable[str], splitter: TextSplitter) -> Iterator[str]:
+    """
+    Split a stream of pages into chunks without joining the whole text.
+
+    The last chunk of each split is carried over and re-split together with
+    the next page, so chunks still span page boundaries. The buffer never
+    holds more than one page plus one chunk.
+
+    Parameters
+    ----------
+    pages : Iterable[str]
+        Page texts in document order
+    splitter : TextSplitter
+        Splitter defining chunk size and overlap
+
+    Yields
+    ------
+    str
+        Chunks in document order
+    """
+    buffer = ""
+    for page in pages:
+        buffer = f"{buffer}{page}\n"
+        chunks = splitter.split_text(buffer)
+        if len(chunks) > 1:
+            yield from chunks[:-1]
+            buffer = f"{chunks[-1]}\n"
+    if buffer.strip():
+        yield from splitter.split_text(buffer)
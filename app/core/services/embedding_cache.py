@@ -0,0 +1,202 @@
+"""
+Query and document embedding cache for retrieval services.
+
+This module wraps a LangChain Embeddings object so that repeated texts are
+embedded only once. Most retrieval queries in the application are fixed
+strings (market pulse, per-sector and ticker context queries), so caching
+their vectors removes an embeddings API round trip from every retrieval.
+
+Key capabilities:
+- Cache keyed by embedding model and whitespace-normalized text
+- In-memory LRU eviction with a configurable entry limit
+- Optional SQLite backing file shared across restarts and processes
+- Batched upstream calls for cache misses in embed_documents
+- Hit/miss statistics for monitoring
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+EMBEDDING_CACHE_DB = (
+    Path(__file__).parent.parent.parent / "var" / "embedding_cache.sqlite"
+)
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper with LRU memory cache and optional SQLite persistence.
+
+    Vectors are stored as float32, which matches the precision FAISS uses
+    for indexing and search.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        model: Optional[str] = None,
+        max_entries: int = 4096,
+        db_path: Optional[Path] = None,
+    ) -> None:
+        """
+        Initialize cached embeddings.
+
+        Parameters
+        ----------
+        underlying : Embeddings
+            Embeddings implementation used on cache misses
+        model : str, optional
+            Model name used in cache keys, read from the underlying client
+            when omitted
+        max_entries : int, default 4096
+            Maximum number of vectors kept in memory
+        db_path : Path, optional
+            SQLite file for persistence, memory-only when None
+        """
+        self.underlying = underlying
+        self.model = model or getattr(underlying, "model", type(underlying).__name__)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            self._db = self._open_db(Path(db_path))
+
+    @staticmethod
+    def _open_db(db_path: Path) -> Optional[sqlite3.Connection]:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(db_path), check_same_thread=False, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            logging.warning(f"Warning: Embedding cache file disabled: {e}")
+            return None
+
+    def _key(self, text: str) -> str:
+        normalized = " ".join(text.split())
+        return hashlib.sha256(f"{self.model}\x00{normalized}".encode()).hexdigest()
+
+    def _remember(self, key: str, vector: list[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, keys: list[str]) -> dict[str, list[float]]:
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+
+            missing = [k for k in keys if k not in found]
+            if self._db is not None and missing:
+                placeholders = ",".join("?" * len(missing))
+                rows = self._db.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    missing,
+                ).fetchall()
+                for key, blob in rows:
+                    vector = np.frombuffer(blob, dtype=np.float32).tolist()
+                    self._remember(key, vector)
+                    found[key] = vector
+        return found
+
+    def _store(self, items: dict[str, list[float]]) -> None:
+        with self._lock:
+            for key, vector in items.items():
+                self._remember(key, vector)
+            if self._db is not None and items:
+                try:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        [
+                            (key, np.asarray(vector, dtype=np.float32).tobytes())
+                            for key, vector in items.items()
+                        ],
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logging.warning(f"Warning: Could not persist embeddings: {e}")
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed documents, calling the upstream model only for unseen texts.
+
+        Parameters
+        ----------
+        texts : list[str]
+            Texts to embed
+
+        Returns
+        -------
+        list[list[float]]
+            One vector per input text, in input order
+        """
+        keys = [self._key(text) for text in texts]
+        found = self._lookup(list(dict.fromkeys(keys)))
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            vectors = self.underlying.embed_documents(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            self._store(computed)
+            found.update(computed)
+
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        """
+        Embed a query string, reusing a cached vector when available.
+
+        Parameters
+        ----------
+        text : str
+            Query text
+
+        Returns
+        -------
+        list[float]
+            Query embedding vector
+        """
+        key = self._key(text)
+        found = self._lookup([key])
+        if key in found:
+            self.hits += 1
+            return found[key]
+
+        self.misses += 1
+        vector = self.underlying.embed_query(text)
+        self._store({key: vector})
+        return vector
+
+    def stats(self) -> dict:
+        """Return cache hit/miss counters and current memory size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory),
+            "persistent": self._db is not None,
+        }
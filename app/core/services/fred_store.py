@@ -0,0 +1,204 @@
+"""
+Persistent FRED observation store with incremental updates.
+
+This module keeps FRED series (DGS10 and any other macro series) on disk
+in one Parquet file per series ID. The full history is downloaded once;
+afterwards only observations after the last stored date are requested.
+Loaded series are also kept in memory as NumPy date/value arrays so that
+window lookups are plain index operations.
+
+Key capabilities:
+- Per-series Parquet storage under var/fred
+- Incremental fetches using FRED's observation_start parameter
+- Freshness window to avoid hitting FRED on every cache expiry
+- In-memory array views for constant-time window lookups
+- Stored history served when an incremental update fails
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.services.bar_store import _replace_atomically
+from core.services.data_providers import get_market_data_provider
+
+FRED_STORE_DIR = Path(__file__).parent.parent.parent / "var" / "fred"
+
+
+class FredSeriesStore:
+    """
+    On-disk FRED series cache keyed by series ID.
+    """
+
+    def __init__(
+        self, root: Path = FRED_STORE_DIR, freshness_seconds: int = 3600
+    ) -> None:
+        """
+        Initialize FRED series store.
+
+        Parameters
+        ----------
+        root : Path
+            Directory holding Parquet files and the manifest
+        freshness_seconds : int, default 3600
+            Seconds after a sync during which FRED is not contacted again
+        """
+        self.root = Path(root)
+        self.freshness_seconds = freshness_seconds
+        self._lock = threading.Lock()
+        self._arrays: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._manifest_path = self.root / "manifest.json"
+        try:
+            self._manifest = json.loads(self._manifest_path.read_text("utf-8"))
+        except FileNotFoundError:
+            self._manifest = {}
+        except Exception as e:
+            logging.warning(f"Warning: Could not read FRED store manifest: {e}")
+            self._manifest = {}
+
+    def _path(self, series_id: str) -> Path:
+        return self.root / f"{re.sub(r'[^A-Za-z0-9_-]', '_', series_id)}.parquet"
+
+    def _read(self, series_id: str) -> pd.Series:
+        path = self._path(series_id)
+        if not path.exists():
+            return pd.Series(dtype=float)
+        try:
+            return pd.read_parquet(path)["value"]
+        except Exception as e:
+            logging.warning(f"Warning: Corrupt FRED file for {series_id}: {e}")
+            return pd.Series(dtype=float)
+
+    def _write(self, series_id: str, series: pd.Series) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        _replace_atomically(self._path(series_id), series.to_frame("value").to_parquet)
+        text = json.dumps(self._manifest, indent=2)
+        _replace_atomically(
+            self._manifest_path, lambda tmp: tmp.write_text(text, encoding="utf-8")
+        )
+
+    def _is_fresh(self, series_id: str) -> bool:
+        fetched_at = self._manifest.get(series_id, {}).get("fetched_at", 0)
+        return time.time() - fetched_at < self.freshness_seconds
+
+    def sync(self, series_id: str, api_key: str) -> None:
+        """
+        Fetch observations newer than the last stored date.
+
+        The first call for a series downloads its full history; later calls
+        within the freshness window do nothing. FRED is contacted without
+        holding the store lock. If an incremental update fails, the error
+        is logged and the stored history is served.
+
+        Parameters
+        ----------
+        series_id : str
+            FRED series ID, e.g. "DGS10"
+        api_key : str
+            FRED API key
+
+        Raises
+        ------
+        Exception
+            Whatever the provider raised, when nothing is stored yet
+        """
+        with self._lock:
+            if self._is_fresh(series_id) and series_id in self._arrays:
+                return
+
+            stored = self._read(series_id).dropna()
+            if self._is_fresh(series_id) and not stored.empty:
+                self._cache_arrays(series_id, stored)
+                return
+
+        provider = get_market_data_provider()
+        try:
+            if stored.empty:
+                fresh = provider.fetch_macro_series(series_id, api_key)
+            else:
+                start = stored.index[-1] + pd.Timedelta(days=1)
+                fresh = provider.fetch_macro_series(
+                    series_id, api_key, observation_start=start.strftime("%Y-%m-%d")
+                )
+        except Exception as e:
+            if stored.empty:
+                raise
+            logging.error(f"Error updating FRED {series_id}, serving stored data: {e}")
+            with self._lock:
+                self._cache_arrays(series_id, stored)
+            return
+
+        with self._lock:
+            stored = self._read(series_id).dropna()
+            fresh = fresh.dropna().astype(float)
+            series = pd.concat([stored, fresh]) if not stored.empty else fresh
+            series = series[~series.index.duplicated(keep="last")].sort_index()
+            self._manifest[series_id] = {"fetched_at": time.time()}
+            self._write(series_id, series)
+            self._cache_arrays(series_id, series)
+            logging.info(f"FRED {series_id}: stored {len(fresh)} new observations")
+
+    def _cache_arrays(self, series_id: str, series: pd.Series) -> None:
+        self._arrays[series_id] = (
+            series.index.values.astype("datetime64[D]"),
+            series.to_numpy(dtype=float),
+        )
+
+    def arrays(self, series_id: str, api_key: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get a series as aligned date and value arrays.
+
+        Parameters
+        ----------
+        series_id : str
+            FRED series ID
+        api_key : str
+            FRED API key used if the series needs syncing
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Observation dates (datetime64[D]) and values, oldest first
+        """
+        self.sync(series_id, api_key)
+        return self._arrays[series_id]
+
+    def get_series(self, series_id: str, api_key: str) -> pd.Series:
+        """
+        Get a series as a date-indexed pandas Series.
+
+        Parameters
+        ----------
+        series_id : str
+            FRED series ID
+        api_key : str
+            FRED API key used if the series needs syncing
+
+        Returns
+        -------
+        pd.Series
+            Observations indexed by date, oldest first, NaNs removed
+        """
+        dates, values = self.arrays(series_id, api_key)
+        return pd.Series(values, index=pd.DatetimeIndex(dates), name=series_id)
+
+
+@lru_cache(maxsize=1)
+def get_fred_store() -> FredSeriesStore:
+    """
+    Get the process-wide FRED series store.
+
+    Returns
+    -------
+    FredSeriesStore
+        Shared store rooted at var/fred, or under the active provider's data
+        directory
+    """
+    return FredSeriesStore(get_market_data_provider().var_dir / "fred")
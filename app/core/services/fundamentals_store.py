@@ -0,0 +1,201 @@
+"""
+Persistent per-session snapshot store for Yahoo Finance company profiles.
+
+``yf.Ticker(...).info`` is the slowest Yahoo endpoint the application
+uses. This module fetches it at most once per ticker and trading session,
+keeps only the fields the application reads, and persists them in SQLite
+so that price comparisons, fundamentals and watchlists share one snapshot
+across sessions and restarts.
+
+Key capabilities:
+- Snapshots keyed by ticker and trading session date
+- Compact projection of the profile fields in PROFILE_FIELDS
+- In-memory layer in front of the SQLite file
+- Bulk refresh of ticker lists through a bounded worker pool
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from core.services.data_providers import get_market_data_provider
+from core.services.trading_calendar import get_trading_calendar
+
+FUNDAMENTALS_DB = Path(__file__).parent.parent.parent / "var" / "fundamentals.sqlite"
+PROFILE_FIELDS = (
+    "sector",
+    "longName",
+    "marketCap",
+    "trailingPE",
+    "forwardPE",
+    "dividendYield",
+    "beta",
+    "fiftyTwoWeekHigh",
+    "fiftyTwoWeekLow",
+)
+
+
+class FundamentalsStore:
+    """
+    Ticker profile snapshots keyed by (ticker, trading session).
+    """
+
+    def __init__(
+        self, db_path: Optional[Path] = FUNDAMENTALS_DB, max_workers: int = 8
+    ) -> None:
+        """
+        Initialize fundamentals store.
+
+        Parameters
+        ----------
+        db_path : Path, optional
+            SQLite file for persistence, memory-only when None
+        max_workers : int, default 8
+            Maximum concurrent profile requests during bulk refresh
+        """
+        self.max_workers = max_workers
+        self._memory: dict[tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            self._db = self._open_db(Path(db_path))
+
+    @staticmethod
+    def _open_db(db_path: Path) -> Optional[sqlite3.Connection]:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(db_path), check_same_thread=False, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS profiles (ticker TEXT NOT NULL, "
+                "session TEXT NOT NULL, fetched_at REAL NOT NULL, "
+                "profile TEXT NOT NULL, PRIMARY KEY (ticker, session))"
+            )
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            logging.warning(f"Warning: Fundamentals store file disabled: {e}")
+            return None
+
+    @staticmethod
+    def _session() -> str:
+        today = date.today()
+        return get_trading_calendar().previous_session(today, inclusive=True).isoformat()
+
+    def _lookup(self, ticker: str, session: str) -> Optional[dict]:
+        with self._lock:
+            profile = self._memory.get((ticker, session))
+            if profile is not None or self._db is None:
+                return profile
+            row = self._db.execute(
+                "SELECT profile FROM profiles WHERE ticker = ? AND session = ?",
+                (ticker, session),
+            ).fetchone()
+            if row is None:
+                return None
+            profile = json.loads(row[0])
+            self._memory[(ticker, session)] = profile
+            return profile
+
+    def _store(self, ticker: str, session: str, profile: dict) -> None:
+        with self._lock:
+            self._memory[(ticker, session)] = profile
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO profiles "
+                    "(ticker, session, fetched_at, profile) VALUES (?, ?, ?, ?)",
+                    (ticker, session, time.time(), json.dumps(profile)),
+                )
+                self._db.execute("DELETE FROM profiles WHERE session < ?", (session,))
+                self._db.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"Warning: Could not persist profile for {ticker}: {e}")
+
+    @staticmethod
+    def _fetch(ticker: str) -> dict:
+        info = get_market_data_provider().fetch_profile(ticker)
+        return {
+            field: info[field] for field in PROFILE_FIELDS if info.get(field) is not None
+        }
+
+    def get(self, ticker: str) -> dict:
+        """
+        Get the current session's profile snapshot for a ticker.
+
+        Parameters
+        ----------
+        ticker : str
+            Ticker symbol
+
+        Returns
+        -------
+        dict
+            Projection of PROFILE_FIELDS; fields Yahoo did not return are
+            omitted
+
+        Raises
+        ------
+        Exception
+            Whatever the Yahoo request raises when no snapshot is stored
+        """
+        session = self._session()
+        profile = self._lookup(ticker, session)
+        if profile is None:
+            profile = self._fetch(ticker)
+            if profile:
+                self._store(ticker, session, profile)
+        return profile
+
+    def refresh(self, tickers: list[str]) -> dict[str, dict | Exception]:
+        """
+        Get snapshots for many tickers, fetching missing ones concurrently.
+
+        Parameters
+        ----------
+        tickers : list[str]
+            Ticker symbols
+
+        Returns
+        -------
+        dict[str, dict | Exception]
+            Ticker to profile snapshot, or to the exception its fetch raised
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+
+        def fetch(ticker: str) -> dict | Exception:
+            try:
+                return self.get(ticker)
+            except Exception as e:
+                logging.error(f"Error fetching profile for {ticker}: {str(e)}")
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(tickers)),
+            thread_name_prefix="fundamentals",
+        ) as executor:
+            return dict(zip(tickers, executor.map(fetch, tickers)))
+
+
+@lru_cache(maxsize=1)
+def get_fundamentals_store() -> FundamentalsStore:
+    """
+    Get the process-wide fundamentals store.
+
+    Returns
+    -------
+    FundamentalsStore
+        Shared store backed by var/fundamentals.sqlite, or under the active
+        provider's data directory
+    """
+    return FundamentalsStore(get_market_data_provider().var_dir / "fundamentals.sqlite")
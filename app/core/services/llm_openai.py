@@ -4,22 +4,25 @@ One place for auth, retries, model options, response/usage normalization.
 
 Extensibility:
 - Add other providers (AnthropicLLM, LocalLLM) without touching controller.
-- Add streaming support later (yield tokens) behind the same interface.
+- Streaming responses (ChatStream) sit behind the same interface.
 
 Testing: Mock SDK calls; assert it maps usage and errors correctly.
 """
 
 from __future__ import annotations
-from typing import Any, Optional, Union, Type
+from typing import Any, Callable, Generator, Iterator, Optional, Union, Type
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 import tiktoken
 import logging
+import threading
+import time
 from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnableLambda
 from langchain_core.tools import BaseTool
 from langchain_core.utils.function_calling import convert_to_openai_function
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, AIMessageChunk
 from langchain_core.chat_history import (
     BaseChatMessageHistory,
     InMemoryChatMessageHistory,
@@ -33,6 +36,9 @@ from core.services.rate_limit import RateLimiter
 
 session_store: dict[str, BaseChatMessageHistory] = {}
 
+MAX_TOOL_WORKERS = 4
+TOOL_TIMEOUT_SECONDS = 60
+
 
 def get_session_history(session_id: str) -> BaseChatMessageHistory:
     """
@@ -53,6 +59,52 @@ def get_session_history(session_id: str) -> BaseChatMessageHistory:
     return session_store[session_id]
 
 
+class ChatStream:
+    """
+    Iterable of streamed response text with metadata filled in at the end.
+
+    Wraps a generator that yields text chunks and returns a metadata dict.
+    ``meta`` is empty until the stream has been fully consumed, at which
+    point registered completion callbacks are invoked with it.
+    """
+
+    def __init__(self, chunks: Generator[str, None, dict]) -> None:
+        self._chunks = chunks
+        self._callbacks: list[Callable[[dict], None]] = []
+        self.meta: dict[str, Any] = {}
+        self.text = ""
+
+    @classmethod
+    def from_text(cls, text: str, meta: dict[str, Any]) -> "ChatStream":
+        """Build an already-complete stream, e.g. for rate-limit replies."""
+
+        def single_chunk() -> Generator[str, None, dict]:
+            yield text
+            return meta
+
+        return cls(single_chunk())
+
+    def add_done_callback(self, callback: Callable[[dict], None]) -> None:
+        """Register a callback receiving ``meta`` once streaming finishes."""
+        self._callbacks.append(callback)
+
+    def __iter__(self) -> Iterator[str]:
+        parts = []
+        chunks = self._chunks
+        while True:
+            try:
+                chunk = next(chunks)
+            except StopIteration as stop:
+                self.meta = stop.value or {}
+                break
+            parts.append(chunk)
+            yield chunk
+
+        self.text = "".join(parts)
+        for callback in self._callbacks:
+            callback(self.meta)
+
+
 class LLMClient:
     """
     OpenAI LLM client with rate limiting and caching.
@@ -215,6 +267,9 @@ class LLMClient:
         """
         Generate structured output using Pydantic schema validation.
 
+        The parsed object and the raw AI message used for token accounting
+        come from the same single model call.
+
         Parameters
         ----------
         system_prompt : str
@@ -254,21 +309,17 @@ class LLMClient:
             ]
         )
 
-        captured_ai_message = None
-
-        def capture_ai_message(ai_message) -> AIMessage:
-            nonlocal captured_ai_message
-            captured_ai_message = ai_message
-            return ai_message
-
-        raw_chain = prompt_template | llm | RunnableLambda(capture_ai_message)
-
-        _ = raw_chain.invoke({})
-        structured_llm = llm.with_structured_output(schema)
+        structured_llm = llm.with_structured_output(schema, include_raw=True)
         structured_chain = prompt_template | structured_llm
-        result = structured_chain.invoke({})
+        output = structured_chain.invoke({})
 
-        tokens_in, tokens_out = self._extract_token_usage(captured_ai_message)
+        result = output["parsed"]
+        if result is None:
+            raise output.get("parsing_error") or ValueError(
+                f"Model response could not be parsed as {schema.__name__}"
+            )
+
+        tokens_in, tokens_out = self._extract_token_usage(output["raw"])
 
         meta = {
             "tokens_in": tokens_in,
@@ -419,46 +470,12 @@ class LLMClient:
 
             if ai_message.tool_calls:
                 for tool_call in ai_message.tool_calls:
-                    function_name = tool_call["name"]
-                    function_args = tool_call["args"]
-
-                    if function_name not in tools_used:
-                        tools_used.append(function_name)
-
-                    if function_name in tool_map:
-                        try:
-                            tool_function = tool_map[function_name]
-                            if isinstance(tool_function, BaseTool):
-                                result = tool_function.run(function_args)
-                            else:
-                                result = tool_function(**function_args)
-                            tool_results.append(
-                                {
-                                    "tool": function_name,
-                                    "query": function_args,
-                                    "result": result,
-                                }
-                            )
-
-                        except Exception as e:
-                            logging.error(f"Error executing tool {function_name}: {e}")
-                            error_msg = f"Error executing {function_name}: {str(e)}"
-                            tool_results.append(
-                                {
-                                    "tool": function_name,
-                                    "query": function_args,
-                                    "result": error_msg,
-                                }
-                            )
-                    else:
-                        error_msg = f"Error: Tool {function_name} not found"
-                        tool_results.append(
-                            {
-                                "tool": function_name,
-                                "query": function_args,
-                                "result": error_msg,
-                            }
-                        )
+                    if tool_call["name"] not in tools_used:
+                        tools_used.append(tool_call["name"])
+
+                tool_results.extend(
+                    self._run_tool_calls(ai_message.tool_calls, tool_map)
+                )
 
                 return self._generate_final_response(user_prompt, tool_results, llm)
 
@@ -555,28 +572,12 @@ class LLMClient:
             captured_response = ai_message
 
             if ai_message.tool_calls:
-                for tool_call in ai_message.tool_calls:
-                    function_name = tool_call["name"]
-                    function_args = tool_call["args"]
-                    tools_used.append(function_name)
-
-                    try:
-                        tool_fn = tool_map[function_name]
-                        result = (
-                            tool_fn.run(function_args)
-                            if isinstance(tool_fn, BaseTool)
-                            else tool_fn(**function_args)
-                        )
-                    except Exception as e:
-                        result = f"Error: {str(e)}"
-
-                    tool_results.append(
-                        {
-                            "tool": function_name,
-                            "query": function_args,
-                            "result": result,
-                        }
-                    )
+                tools_used.extend(
+                    tool_call["name"] for tool_call in ai_message.tool_calls
+                )
+                tool_results.extend(
+                    self._run_tool_calls(ai_message.tool_calls, tool_map)
+                )
 
                 return self._generate_final_response(user_input, tool_results, llm)
 
@@ -618,6 +619,225 @@ class LLMClient:
                 "session_id": session_id,
             }
 
+    def stream_chat_with_tools_and_history(
+        self,
+        system_prompt: str,
+        user_input: str,
+        session_id: str,
+        settings: LLMSettings,
+        tool_map: dict,
+    ) -> ChatStream:
+        """
+        Streaming variant of chat_with_tools_and_history.
+
+        The tool-routing call is streamed too, so answers that need no tools
+        start rendering immediately. When tools are requested they run
+        concurrently and the final synthesis is streamed token by token.
+        The exchange is written to session history once the stream ends.
+
+        Parameters
+        ----------
+        system_prompt : str
+            System instruction prompt for AI behavior
+        user_input : str
+            Current user message or question
+        session_id : str
+            Unique identifier for conversation session
+        settings : LLMSettings
+            LLM configuration settings
+        tool_map : dict
+            Mapping of tool names to callable functions
+
+        Returns
+        -------
+        ChatStream
+            Iterable of text chunks; ``meta`` holds token usage, tools used
+            and session info once iteration finishes
+        """
+        if self._rate_limiter and not self._rate_limiter.allow():
+            return ChatStream.from_text(
+                "Rate limit exceeded. Please wait before retrying.",
+                {
+                    "model": settings.model,
+                    "tokens_in": 0,
+                    "tokens_out": 0,
+                    "tools_used": [],
+                    "session_id": session_id,
+                    "rate_limited": True,
+                },
+            )
+        return ChatStream(
+            self._stream_tools_and_history(
+                system_prompt, user_input, session_id, settings, tool_map
+            )
+        )
+
+    def _stream_tools_and_history(
+        self,
+        system_prompt: str,
+        user_input: str,
+        session_id: str,
+        settings: LLMSettings,
+        tool_map: dict,
+    ) -> Generator[str, None, dict]:
+        llm = self._get_llm(settings)
+        converted_tools = [
+            convert_to_openai_function(func) for func in tool_map.values()
+        ]
+        llm_with_tools = llm.bind_tools(converted_tools) if converted_tools else llm
+
+        prompt_template = ChatPromptTemplate.from_messages(
+            [
+                ("system", "{system_prompt}"),
+                MessagesPlaceholder(variable_name="history"),
+                ("human", "{input}"),
+            ]
+        )
+        history = get_session_history(session_id)
+        messages = prompt_template.format_messages(
+            system_prompt=system_prompt, history=history.messages, input=user_input
+        )
+
+        tools_used = []
+        parts = []
+        tokens_in = tokens_out = 0
+        try:
+            routed = None
+            for chunk in llm_with_tools.stream(messages, stream_usage=True):
+                routed = chunk if routed is None else routed + chunk
+                if chunk.content:
+                    parts.append(chunk.content)
+                    yield chunk.content
+            tokens_in, tokens_out = self._extract_token_usage(routed)
+
+            if routed is not None and routed.tool_calls:
+                tools_used.extend(tool_call["name"] for tool_call in routed.tool_calls)
+                tool_results = self._run_tool_calls(routed.tool_calls, tool_map)
+                final = yield from self._stream_response_parts(
+                    self._stream_final_response(user_input, tool_results, llm), parts
+                )
+                if final is not None:
+                    final_in, final_out = self._extract_token_usage(final)
+                    tokens_in += final_in
+                    tokens_out += final_out
+
+        except Exception as e:
+            logging.error(f"Error in streaming tool + history execution: {e}")
+            error_text = f"Error: {str(e)}"
+            parts.append(error_text)
+            yield error_text
+
+        history.add_user_message(user_input)
+        history.add_ai_message("".join(parts))
+        return {
+            "tokens_in": tokens_in,
+            "tokens_out": tokens_out,
+            "tools_used": tools_used,
+            "model": llm.model_name,
+            "session_id": session_id,
+        }
+
+    @staticmethod
+    def _stream_response_parts(
+        chunks: Generator[str, None, Any], parts: list[str]
+    ) -> Generator[str, None, Any]:
+        """Re-yield chunks while recording them, passing the return value on."""
+        result = None
+        while True:
+            try:
+                chunk = next(chunks)
+            except StopIteration as stop:
+                result = stop.value
+                break
+            parts.append(chunk)
+            yield chunk
+        return result
+
+    @staticmethod
+    def _run_tool(tool_fn: Any, function_args: dict) -> Any:
+        """Invoke a LangChain tool or plain callable with model-provided args."""
+        if isinstance(tool_fn, BaseTool):
+            return tool_fn.run(function_args)
+        return tool_fn(**function_args)
+
+    def _run_tool_calls(
+        self,
+        tool_calls: list[dict],
+        tool_map: dict,
+        timeout: float = TOOL_TIMEOUT_SECONDS,
+    ) -> list[dict]:
+        """
+        Execute independent tool calls concurrently in a bounded thread pool.
+
+        Parameters
+        ----------
+        tool_calls : list[dict]
+            Tool calls requested by the model in one turn
+        tool_map : dict
+            Mapping of tool names to callable functions
+        timeout : float, default TOOL_TIMEOUT_SECONDS
+            Seconds each tool may run, measured from when it starts
+            executing. A call still queued behind busy workers times out
+            once every earlier wave of calls could have used its full
+            timeout.
+
+        Returns
+        -------
+        list[dict]
+            One result entry per tool call, in the order the model requested
+        """
+        workers = min(MAX_TOOL_WORKERS, max(len(tool_calls), 1))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tool")
+        started = [threading.Event() for _ in tool_calls]
+        started_at: dict[int, float] = {}
+
+        def run(position: int, tool_fn: Callable, args: dict) -> Any:
+            started_at[position] = time.monotonic()
+            started[position].set()
+            return self._run_tool(tool_fn, args)
+
+        submitted_at = time.monotonic()
+        futures = []
+        for position, tool_call in enumerate(tool_calls):
+            tool_fn = tool_map.get(tool_call["name"])
+            futures.append(
+                executor.submit(run, position, tool_fn, tool_call["args"])
+                if tool_fn is not None
+                else None
+            )
+
+        tool_results = []
+        for position, (tool_call, future) in enumerate(zip(tool_calls, futures)):
+            function_name = tool_call["name"]
+            if future is None:
+                result = f"Error: Tool {function_name} not found"
+            else:
+                queued_until = submitted_at + timeout * (1 + position // workers)
+                try:
+                    waiting = queued_until - time.monotonic()
+                    if not started[position].wait(max(waiting, 0)):
+                        raise FuturesTimeoutError()
+                    remaining = started_at[position] + timeout - time.monotonic()
+                    result = future.result(timeout=max(remaining, 0))
+                except FuturesTimeoutError:
+                    future.cancel()
+                    logging.error(f"Tool {function_name} timed out after {timeout}s")
+                    result = f"Error: {function_name} timed out after {timeout}s"
+                except Exception as e:
+                    logging.error(f"Error executing tool {function_name}: {e}")
+                    result = f"Error executing {function_name}: {str(e)}"
+
+            tool_results.append(
+                {
+                    "tool": function_name,
+                    "query": tool_call["args"],
+                    "result": result,
+                }
+            )
+
+        executor.shutdown(wait=False, cancel_futures=True)
+        return tool_results
+
     def _extract_token_usage(self, ai_message) -> tuple[int, int]:
         """
         Extract token usage statistics from AI response message.
@@ -661,11 +881,11 @@ class LLMClient:
 
         return 0, 0
 
-    def _generate_final_response(
-        self, user_question: str, tool_results: list[dict], llm: ChatOpenAI
-    ) -> str:
+    def _final_response_prompt(
+        self, user_question: str, tool_results: list[dict]
+    ) -> tuple[ChatPromptTemplate, str]:
         """
-        Generate final response using tool results as context.
+        Build the synthesis prompt and tool context for the final response.
         """
         context_parts = []
         for tool_result in tool_results:
@@ -689,6 +909,17 @@ class LLMClient:
                 ("user", user_prompt),
             ]
         )
+        return final_prompt, context
+
+    def _generate_final_response(
+        self, user_question: str, tool_results: list[dict], llm: ChatOpenAI
+    ) -> str:
+        """
+        Generate final response using tool results as context.
+        """
+        final_prompt, context = self._final_response_prompt(
+            user_question, tool_results
+        )
         final_chain = final_prompt | llm | StrOutputParser()
 
         try:
@@ -701,6 +932,39 @@ class LLMClient:
                 f"(Note: Unable to generate synthesized response: {e})"
             )
 
+    def _stream_final_response(
+        self, user_question: str, tool_results: list[dict], llm: ChatOpenAI
+    ) -> Generator[str, None, Optional[AIMessageChunk]]:
+        """
+        Stream the final synthesis step token by token.
+
+        Yields
+        ------
+        str
+            Response text chunks as they arrive from the model
+
+        Returns
+        -------
+        AIMessageChunk or None
+            Aggregated message carrying usage metadata, None on failure
+        """
+        final_prompt, context = self._final_response_prompt(
+            user_question, tool_results
+        )
+        gathered = None
+        try:
+            for chunk in llm.stream(final_prompt.format_messages(), stream_usage=True):
+                gathered = chunk if gathered is None else gathered + chunk
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            logging.error(f"Error streaming final response: {e}")
+            yield (
+                f"Based on the available information:\n\n{context}\n\n"
+                f"(Note: Unable to generate synthesized response: {e})"
+            )
+        return gathered
+
     def get_session_history_messages(self, session_id: str) -> list:
         """Get all messages from a session history."""
         history = get_session_history(session_id)
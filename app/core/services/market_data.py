@@ -9,32 +9,48 @@ historical market information.
 Key capabilities:
 - Real-time price data for stocks, ETFs, and indices
 - Sector performance analysis and ETF mapping
+- Multi-horizon sector return matrix from a single one-year panel
 - Market snapshot generation with key indicators
+- Rolling multi-window signals for all configured market indicators
 - Individual ticker analysis with fundamentals
 - Historical data retrieval with configurable periods
 - Market regime indicator calculation
 - Sector strength ranking and comparison
+- Constituent scan with relative strength and within-sector rank
+- Market breadth (percent above moving averages, A/D line, new highs/lows)
 
 Data sources:
 - Yahoo Finance (yfinance) for price and volume data
-- FRED API for economic indicators
+- FRED API for economic indicators, stored incrementally per series
 - Local JSON configuration for sector mappings
+- Offline synthetic/replay data when MARKET_DATA_PROVIDER=synthetic
+  (see core.services.data_providers)
 
-The module uses caching to improve performance and includes error
-handling for robust data retrieval in production environments.
+The module caches results through core.services.cache (shared across
+processes, stale-while-revalidate) and includes error handling for robust
+data retrieval in production environments.
 """
 
 import os
 import logging
 import json
+import threading
+import numpy as np
 import pandas as pd
-import yfinance as yf
-from fredapi import Fred
 from functools import lru_cache
 from pathlib import Path
-import streamlit as st
 from typing import Literal
-from core.analyzers.regime import pct_change, bp_change
+from core.analyzers.regime import bp_change, load_regime_config, pct_change
+from core.analyzers.signals import rolling_signals, signal_windows
+from core.analyzers.constituents import BENCHMARK, scan_constituents, sector_leaders
+from core.analyzers.breadth import BreadthEngine
+from core.analyzers.horizons import HORIZONS, horizon_returns, period_start
+from core.services.bar_store import get_bar_store
+from core.services.cache import cached
+from core.services.data_providers import get_market_data_provider
+from core.services.fred_store import get_fred_store
+from core.services.fundamentals_store import get_fundamentals_store
+from core.services.trading_calendar import get_trading_calendar
 
 
 @lru_cache(maxsize=1)
@@ -93,110 +109,157 @@ def get_sector_etfs() -> list[str]:
     return list(sector_data.keys())
 
 
-@st.cache_data(ttl=900)
-def get_index_snap(tickers: list, period: str, interval: str = "1d") -> pd.DataFrame:
-    df = yf.download(tickers, period=period, interval=interval, auto_adjust=True)[
-        "Close"
-    ].ffill()
-    return df
-
+PANEL_FIELDS = ("Close", "High", "Low")
+CORE_INDICATORS = ("^GSPC", "^VIX", "DX-Y.NYB", "GC=F")
 
-@st.cache_data(ttl=1800)
-def get_sector_perf(period="1wk") -> "pd.DataFrame":
-    sectors = get_sector_etfs()
-    df = yf.download(sectors, period=period, interval="1d", auto_adjust=True)[
-        "Close"
-    ].ffill()
-    start_prices = df.iloc[0]
-    end_prices = df.iloc[-1]
-    perf = (end_prices / start_prices - 1).sort_values(ascending=False)
 
-    result_df = perf.to_frame("return").assign(sector=perf.index)
-    result_df["start_price"] = start_prices[result_df["sector"]].values
-    result_df["end_price"] = end_prices[result_df["sector"]].values
-    result_df["start_date"] = df.index[0].strftime("%Y-%m-%d")
-    result_df["end_date"] = df.index[-1].strftime("%Y-%m-%d")
+def get_pulse_tickers() -> tuple[str, ...]:
+    """
+    Get every symbol a market pulse needs in a single batch.
 
-    return result_df.reset_index(drop=True)
+    Returns
+    -------
+    tuple[str, ...]
+        Core market indicators followed by all sector ETF symbols
+    """
+    return CORE_INDICATORS + tuple(get_sector_etfs())
 
 
-@st.cache_data(ttl=900)
-def _get_price_data(ticker: str, period: str = "1wk") -> dict[str, float | None | str]:
+@cached(ttl=900, stale_ttl=900)
+def get_price_panel(tickers: tuple[str, ...], period: str = "1wk") -> dict:
     """
-    Get comprehensive price data for a ticker with a single API call.
+    Get daily bars for many tickers through the on-disk bar store.
+
+    Bars are served from disk; symbols that are missing or stale are
+    synchronised together in batched downloads rather than one per ticker.
+
+    Parameters
+    ----------
+    tickers : tuple[str, ...]
+        Symbols to fetch; duplicates are merged into a single request
+    period : str, default "1wk"
+        Yahoo Finance period string (e.g. "1wk", "1mo", "1y")
+
+    Returns
+    -------
+    dict
+        Mapping of "Close", "High" and "Low" to DataFrames indexed by date
+        with one column per requested ticker. Values are not forward-filled;
+        each ticker keeps its own trading days.
     """
-    try:
-        data = yf.download(
-            ticker, period=period, interval="1d", auto_adjust=True, progress=False
-        )
-        if data.empty:
-            logging.warning(
-                f"Warning: No data returned for ticker {ticker} with period {period}"
-            )
-            return {
-                "latest_close": None,
-                "latest_date": None,
-                "past_close": None,
-                "past_date": None,
-                "source": "Yahoo",
-                "error": "No data returned from Yahoo Finance",
-            }
+    return get_bar_store().load_panel(tuple(tickers), period, PANEL_FIELDS)
 
-        series = data["Close"].sort_index(ascending=True)
-        latest_val = float(series.iloc[-1][ticker])
-        past_val = float(series.iloc[0][ticker])
-        latest_date = series.index[-1].date()
-        past_date = series.index[0].date()
-        return {
-            "latest_close": round(latest_val, 4),
-            "latest_date": latest_date,
-            "past_close": round(past_val, 4),
-            "past_date": past_date,
-            "source": "Yahoo",
-        }
-    except Exception as e:
-        logging.error(f"Error in _get_price_data for {ticker}: {str(e)}")
+
+def _summarize_close(close: pd.DataFrame, ticker: str) -> dict:
+    """
+    Summarize first/last close for one ticker column of a price panel.
+    """
+    series = close[ticker].dropna() if ticker in close.columns else pd.Series()
+    if series.empty:
+        logging.warning(f"Warning: No price data returned for ticker {ticker}")
         return {
             "latest_close": None,
             "latest_date": None,
             "past_close": None,
             "past_date": None,
             "source": "Yahoo",
-            "error": str(e),
+            "error": "No data returned from Yahoo Finance",
         }
 
+    return {
+        "latest_close": round(float(series.iloc[-1]), 4),
+        "latest_date": series.index[-1].date(),
+        "past_close": round(float(series.iloc[0]), 4),
+        "past_date": series.index[0].date(),
+        "source": "Yahoo",
+    }
+
+
+@cached(ttl=900, stale_ttl=900)
+def get_index_snap(tickers: list, period: str, interval: str = "1d") -> pd.DataFrame:
+    if interval != "1d":
+        return (
+            get_market_data_provider()
+            .fetch_bars(list(tickers), period=period, interval=interval)["Close"]
+            .ffill()
+        )
+    return get_price_panel(tuple(tickers), period)["Close"].ffill()
+
 
-@st.cache_data(ttl=1800)
+@cached(ttl=1800, stale_ttl=1800)
+def get_sector_horizons(horizons: tuple[str, ...] = HORIZONS) -> dict:
+    """
+    Get sector ETF returns for every horizon from one one-year panel.
+
+    Parameters
+    ----------
+    horizons : tuple[str, ...], default HORIZONS
+        Period strings to evaluate (1wk, 1mo, 3mo, 6mo, 1y)
+
+    Returns
+    -------
+    dict
+        Sector x horizon return matrix with start/end prices and dates,
+        as produced by core.analyzers.horizons.horizon_returns
+    """
+    sectors = get_sector_etfs()
+    close = get_price_panel(get_pulse_tickers(), "1y")["Close"]
+    return horizon_returns(close[sectors].dropna(how="all"), horizons)
+
+
+@cached(ttl=1800, stale_ttl=1800)
+def get_sector_perf(period="1wk") -> "pd.DataFrame":
+    if period in HORIZONS:
+        matrix = get_sector_horizons()
+        perf = matrix["returns"][period].sort_values(ascending=False)
+        start_prices = matrix["start_prices"][period]
+        end_prices = matrix["end_prices"]
+        start_date = matrix["start_dates"][period]
+        end_date = matrix["end_date"]
+    else:
+        sectors = get_sector_etfs()
+        close = get_price_panel(get_pulse_tickers(), period)["Close"]
+        df = close[sectors].dropna(how="all").ffill()
+        start_prices = df.iloc[0]
+        end_prices = df.iloc[-1]
+        perf = (end_prices / start_prices - 1).sort_values(ascending=False)
+        start_date = df.index[0]
+        end_date = df.index[-1]
+
+    result_df = perf.to_frame("return").assign(sector=perf.index)
+    result_df["start_price"] = start_prices[result_df["sector"]].values
+    result_df["end_price"] = end_prices[result_df["sector"]].values
+    result_df["start_date"] = start_date.strftime("%Y-%m-%d")
+    result_df["end_date"] = end_date.strftime("%Y-%m-%d")
+
+    return result_df.reset_index(drop=True)
+
+
+@cached(ttl=1800, stale_ttl=1800)
 def _get_yield_data(
     analysis_period: Literal["1wk", "1mo", "3mo", "6mo", "1y"] = "1wk",
 ) -> dict[str, float | None | str]:
     """
     Get both current and historical 10Y yield from FRED.
     """
-    window_days = (
-        5
-        if analysis_period == "1wk"
-        else (
-            21
-            if analysis_period == "1mo"
-            else (
-                63
-                if analysis_period == "3mo"
-                else 126 if analysis_period == "6mo" else 252
-            )
-        )
-    )
+    calendar = get_trading_calendar()
     fred_key = os.getenv("FRED_API_KEY", "")
     if fred_key:
         try:
-            fred = Fred(api_key=fred_key)
-            series = fred.get_series("DGS10").dropna().sort_index(ascending=True)
-            if len(series) > window_days:
+            dates, values = get_fred_store().arrays("DGS10", fred_key)
+            window_days = (
+                calendar.period_sessions(analysis_period, dates[-1]) if len(dates) else 0
+            )
+            if len(values) > window_days:
+                past_session = np.datetime64(
+                    calendar.sessions_back(window_days, dates[-1]), "D"
+                )
+                past = max(int(np.searchsorted(dates, past_session, "right")) - 1, 0)
                 return {
-                    "latest_yield": float(series.iloc[-1]),
-                    "latest_date": series.index[-1].date(),
-                    "past_yield": float(series.iloc[-(window_days)]),
-                    "past_date": series.index[-(window_days)].date(),
+                    "latest_yield": float(values[-1]),
+                    "latest_date": pd.Timestamp(dates[-1]).date(),
+                    "past_yield": float(values[past]),
+                    "past_date": pd.Timestamp(dates[past]).date(),
                     "source": "FRED",
                 }
 
@@ -211,7 +274,86 @@ def _get_yield_data(
             }
 
 
-@st.cache_data(ttl=900)
+@cached(ttl=1800, stale_ttl=1800)
+def get_macro_series(series_id: str, period: str = "1y") -> pd.Series:
+    """
+    Get a FRED macro series (e.g. DGS2, CPIAUCSL, T10Y2Y) from the local store.
+
+    Parameters
+    ----------
+    series_id : str
+        FRED series ID
+    period : str, default "1y"
+        Yahoo-style period to slice, "max" for full history
+
+    Returns
+    -------
+    pd.Series
+        Observations indexed by date, empty if FRED is unavailable
+    """
+    fred_key = os.getenv("FRED_API_KEY", "")
+    if not fred_key:
+        return pd.Series(dtype=float, name=series_id)
+    try:
+        series = get_fred_store().get_series(series_id, fred_key)
+    except Exception as e:
+        logging.error(f"Error fetching {series_id} from FRED: {e}")
+        return pd.Series(dtype=float, name=series_id)
+    start = period_start(period)
+    return series if start is None else series[series.index >= start]
+
+
+@cached(ttl=3600, stale_ttl=3600)
+def get_regime_levels(period: str = "10y") -> pd.DataFrame:
+    """
+    Get aligned daily SPX, VIX, DXY and 10Y yield levels for regime backtests.
+
+    Parameters
+    ----------
+    period : str, default "10y"
+        Yahoo-style history depth, "max" for the full stored history
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns spx, vix, dxy and ust10y indexed by trading date; the
+        10Y yield comes from FRED when a key is set, otherwise from ^TNX
+    """
+    close = get_price_panel(("^GSPC", "^VIX", "DX-Y.NYB", "^TNX"), period)["Close"]
+    levels = close.rename(
+        columns={"^GSPC": "spx", "^VIX": "vix", "DX-Y.NYB": "dxy", "^TNX": "ust10y"}
+    )
+    dgs10 = get_macro_series("DGS10", period)
+    if not dgs10.empty:
+        levels["ust10y"] = dgs10.reindex(levels.index, method="ffill")
+    return levels.dropna(subset=["spx"]).ffill()
+
+
+@cached(ttl=900, stale_ttl=900)
+def get_market_signals(period: str = "1y") -> pd.DataFrame:
+    """
+    Get rolling signals for every configured market indicator.
+
+    Windows are read from ``windows`` in regime_rules.json and all
+    indicators from market_indicators.json are served from one stored panel.
+
+    Parameters
+    ----------
+    period : str, default "1y"
+        History depth of the panel the rolling windows run over
+
+    Returns
+    -------
+    pd.DataFrame
+        Signals indexed by date with column levels (window, metric, symbol)
+    """
+    windows = signal_windows(load_regime_config())
+    tickers = tuple(load_market_indicators()) or CORE_INDICATORS
+    close = get_price_panel(tickers, period)["Close"]
+    return rolling_signals(close, windows)
+
+
+@cached(ttl=900, stale_ttl=900)
 def get_market_snapshot(period: str) -> dict:
     """
     Returns latest levels and short-window deltas for core market indicators.
@@ -219,10 +361,8 @@ def get_market_snapshot(period: str) -> dict:
     - ust10y_bp as basis points
     Sources prefer FRED for 10Y; fall back to Yahoo's ^TNX.
     """
-    market_data = {}
-    tickers = ["^GSPC", "^VIX", "DX-Y.NYB", "GC=F"]
-    for ticker in tickers:
-        market_data[ticker] = _get_price_data(ticker, period)
+    close = get_price_panel(get_pulse_tickers(), period)["Close"]
+    market_data = {ticker: _summarize_close(close, ticker) for ticker in CORE_INDICATORS}
 
     spx_data = market_data["^GSPC"]
     spx_now = spx_data["latest_close"]
@@ -306,6 +446,133 @@ def get_ticker_samples() -> dict[str, list[str]]:
     return samples
 
 
+def get_sector_constituents() -> dict[str, list[str]]:
+    """Get every listed constituent ticker for each sector ETF."""
+    return {
+        etf_symbol: list(etf_data.get("stocks", {}))
+        for etf_symbol, etf_data in load_sector_data().items()
+    }
+
+
+@cached(ttl=1800, stale_ttl=1800)
+def get_constituent_scan(period: str = "1wk") -> pd.DataFrame:
+    """
+    Score every sector constituent against its ETF and the S&P 500.
+
+    All constituents, sector ETFs and the benchmark are priced from one
+    stored panel, so the scan costs a single batched download at most.
+
+    Parameters
+    ----------
+    period : str, default "1wk"
+        Yahoo Finance period string
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per (sector, ticker) with return, relative strength and
+        within-sector rank, see ``scan_constituents``
+    """
+    constituents = get_sector_constituents()
+    symbols = [BENCHMARK, *constituents]
+    symbols += [ticker for tickers in constituents.values() for ticker in tickers]
+    close = get_price_panel(tuple(dict.fromkeys(symbols)), period)["Close"]
+    return scan_constituents(close, constituents, BENCHMARK)
+
+
+BREADTH_UNIVERSE_PATH = (
+    Path(__file__).parent.parent.parent
+    / "knowledge_base"
+    / "semistatic"
+    / "breadth_universe.json"
+)
+_breadth_engines: dict[str, BreadthEngine] = {}
+_breadth_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_breadth_universe() -> tuple[str, ...]:
+    """
+    Get the stocks breadth is measured over.
+
+    Uses the ticker list in knowledge_base/semistatic/breadth_universe.json
+    when present (e.g. the S&P 500), otherwise every sector constituent.
+
+    Returns
+    -------
+    tuple[str, ...]
+        Unique ticker symbols
+    """
+    try:
+        with open(BREADTH_UNIVERSE_PATH, "r", encoding="utf-8") as f:
+            return tuple(dict.fromkeys(json.load(f)["tickers"]))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.warning(f"Warning: Invalid breadth universe file: {e}")
+    constituents = get_sector_constituents()
+    return tuple(
+        dict.fromkeys(ticker for tickers in constituents.values() for ticker in tickers)
+    )
+
+
+@cached(ttl=900, stale_ttl=900)
+def get_market_breadth(period: str = "2y") -> dict:
+    """
+    Get breadth measures over the breadth universe.
+
+    A breadth engine is kept per period in this process; after the first
+    build only bars newer than its last session are applied.
+
+    Parameters
+    ----------
+    period : str, default "2y"
+        History loaded from the bar store; needs at least one year for the
+        200-day average and 52-week highs/lows
+
+    Returns
+    -------
+    dict
+        Keys:
+        - history: DataFrame of daily breadth measures
+        - summary: latest reading, see ``BreadthEngine.summary``
+        - signals: regime rule inputs, see ``BreadthEngine.regime_signals``
+    """
+    universe = get_breadth_universe()
+    close = get_price_panel(universe, period)["Close"]
+    with _breadth_lock:
+        engine = _breadth_engines.get(period)
+        if engine is None or engine.symbols != tuple(close.columns):
+            engine = BreadthEngine(close)
+            _breadth_engines[period] = engine
+        else:
+            engine.extend(close)
+        return {
+            "history": engine.history(),
+            "summary": engine.summary(),
+            "signals": engine.regime_signals(),
+        }
+
+
+def get_sector_leaders(period: str = "1wk", top_n: int = 3) -> dict[str, list[dict]]:
+    """
+    Get the best-performing constituents of each sector ETF.
+
+    Parameters
+    ----------
+    period : str, default "1wk"
+        Yahoo Finance period string
+    top_n : int, default 3
+        Leaders per sector
+
+    Returns
+    -------
+    dict[str, list[dict]]
+        Sector ETF symbol to leader records, strongest first
+    """
+    return sector_leaders(get_constituent_scan(period), top_n)
+
+
 def get_sector_etf_mapping(source: str = None) -> dict[str, str]:
     """Get mapping from Yahoo Finance sector names to ETF symbols."""
     sector_data = load_sector_data()
@@ -322,93 +589,153 @@ def get_sector_etf_mapping(source: str = None) -> dict[str, str]:
     return mapping
 
 
-@st.cache_data(ttl=1800)
+def _sector_etf_for(info: dict) -> str:
+    """Map a Yahoo info dict to its sector ETF, XLK when unknown."""
+    return get_sector_etf_mapping("yahoo").get(info.get("sector", "Unknown"), "XLK")
+
+
+def _compare_ticker(ticker: str, info: dict, panel: dict, period: str) -> dict:
+    """
+    Build ticker vs S&P 500 vs sector ETF comparison from a price panel.
+    """
+    sector = info.get("sector", "Unknown")
+    company_name = info.get("longName", ticker)
+
+    sector_etf = _sector_etf_for(info)
+    close = panel["Close"]
+
+    ticker_data = _summarize_close(close, ticker)
+    if not ticker_data["latest_close"]:
+        error_detail = ticker_data.get("error", "Unknown error")
+        logging.warning(f"No price data available for {ticker}: {error_detail}")
+
+    latest_price = ticker_data["latest_close"]
+    past_price = ticker_data["past_close"]
+    ticker_return = ((latest_price / past_price) - 1) * 100 if past_price else 0
+
+    spx_data = _summarize_close(close, "^GSPC")
+    spx_return = (
+        ((spx_data["latest_close"] / spx_data["past_close"]) - 1) * 100
+        if spx_data["latest_close"] and spx_data["past_close"]
+        else 0
+    )
+
+    sector_data = _summarize_close(close, sector_etf)
+    sector_return = (
+        ((sector_data["latest_close"] / sector_data["past_close"]) - 1) * 100
+        if sector_data["latest_close"] and sector_data["past_close"]
+        else 0
+    )
+    try:
+        comparison_df = pd.DataFrame(
+            {
+                ticker: close[ticker],
+                "S&P 500": close["^GSPC"],
+                f"{sector_etf} ({sector})": close[sector_etf],
+            }
+        ).dropna(subset=[ticker])
+
+        high = panel["High"][ticker].dropna()
+        low = panel["Low"][ticker].dropna()
+        period_high = high.max() if not high.empty else latest_price
+        period_low = low.min() if not low.empty else latest_price
+    except Exception:
+        comparison_df = None
+        period_high = period_low = latest_price
+
+    return {
+        "ticker": ticker,
+        "company_name": company_name,
+        "sector": sector,
+        "sector_etf": sector_etf,
+        "period": period,
+        "ticker_return": ticker_return,
+        "spx_return": spx_return,
+        "sector_return": sector_return,
+        "comparison_data": comparison_df,
+        "outperformance_vs_spx": ticker_return - spx_return,
+        "outperformance_vs_sector": ticker_return - sector_return,
+        "current_price": latest_price,
+        "period_high": period_high,
+        "period_low": period_low,
+    }
+
+
+@cached(ttl=1800, stale_ttl=1800)
 def get_ticker_info(ticker: str, period: str = "1wk") -> dict:
     """
     Get ticker data and compare to S&P 500 and its sector.
     Uses consistent 1-week analysis period by default for alignment with other tools.
     """
     try:
-        stock = yf.Ticker(ticker)
-
-        info = stock.info
-        sector = info.get("sector", "Unknown")
-        company_name = info.get("longName", ticker)
-
-        ticker_data = _get_price_data(ticker, period)
+        info = get_fundamentals_store().get(ticker)
+        panel = get_price_panel((ticker, BENCHMARK, _sector_etf_for(info)), period)
+        return _compare_ticker(ticker, info, panel, period)
 
-        if not ticker_data["latest_close"]:
-            error_detail = ticker_data.get("error", "Unknown error")
-            logging.warning(f"No price data available for {ticker}: {error_detail}")
+    except Exception as e:
+        logging.error(f"Error fetching data for {ticker}: {str(e)}")
+        raise ValueError(f"Error fetching data for {ticker}: {str(e)}")
 
-        latest_price = ticker_data["latest_close"]
-        past_price = ticker_data["past_close"]
-        ticker_return = ((latest_price / past_price) - 1) * 100 if past_price else 0
 
-        spx_data = _get_price_data("^GSPC", period)
-        spx_return = (
-            ((spx_data["latest_close"] / spx_data["past_close"]) - 1) * 100
-            if spx_data["latest_close"] and spx_data["past_close"]
-            else 0
-        )
+def get_ticker_info_batch(
+    tickers: tuple[str, ...], period: str = "1wk"
+) -> dict[str, dict | ValueError]:
+    """
+    Get ``get_ticker_info`` results for a watchlist with shared price data.
 
-        sector_etf_map = get_sector_etf_mapping("yahoo")
-        sector_etf = sector_etf_map.get(sector, "XLK")
-        sector_data = _get_price_data(sector_etf, period)
-        sector_return = (
-            ((sector_data["latest_close"] / sector_data["past_close"]) - 1) * 100
-            if sector_data["latest_close"] and sector_data["past_close"]
-            else 0
-        )
-        try:
-            hist = stock.history(period=period, auto_adjust=True)
-            spx_hist = yf.Ticker("^GSPC").history(period=period, auto_adjust=True)
-            sector_hist = yf.Ticker(sector_etf).history(period=period, auto_adjust=True)
-
-            comparison_df = pd.DataFrame(
-                {
-                    ticker: hist["Close"],
-                    "S&P 500": spx_hist["Close"],
-                    f"{sector_etf} ({sector})": sector_hist["Close"],
-                }
-            )
+    Missing profile snapshots are refreshed concurrently through the
+    fundamentals store; prices for all tickers, the S&P 500 and every
+    distinct sector ETF come from one panel.
 
-            period_high = hist["High"].max() if not hist.empty else latest_price
-            period_low = hist["Low"].min() if not hist.empty else latest_price
-        except Exception:
-            comparison_df = None
-            period_high = period_low = latest_price
+    Parameters
+    ----------
+    tickers : tuple[str, ...]
+        Ticker symbols
+    period : str, default "1wk"
+        Yahoo Finance period string
 
-        return {
-            "ticker": ticker,
-            "company_name": company_name,
-            "sector": sector,
-            "sector_etf": sector_etf,
-            "period": period,
-            "ticker_return": ticker_return,
-            "spx_return": spx_return,
-            "sector_return": sector_return,
-            "comparison_data": comparison_df,
-            "outperformance_vs_spx": ticker_return - spx_return,
-            "outperformance_vs_sector": ticker_return - sector_return,
-            "current_price": latest_price,
-            "period_high": period_high,
-            "period_low": period_low,
-        }
+    Returns
+    -------
+    dict[str, dict | ValueError]
+        Ticker to comparison dict, or to the ValueError describing why it
+        could not be built
+    """
+    tickers = tuple(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
 
+    profiles = get_fundamentals_store().refresh(list(tickers))
+    etfs = [
+        _sector_etf_for(info) for info in profiles.values() if isinstance(info, dict)
+    ]
+    symbols = tuple(dict.fromkeys([*tickers, BENCHMARK, *etfs]))
+    try:
+        panel = get_price_panel(symbols, period)
     except Exception as e:
-        logging.error(f"Error fetching data for {ticker}: {str(e)}")
-        raise ValueError(f"Error fetching data for {ticker}: {str(e)}")
+        logging.error(f"Error fetching prices for {tickers}: {str(e)}")
+        return {t: ValueError(f"Error fetching data for {t}: {e}") for t in tickers}
+
+    results: dict[str, dict | ValueError] = {}
+    for ticker, info in profiles.items():
+        try:
+            if isinstance(info, Exception):
+                raise info
+            results[ticker] = _compare_ticker(ticker, info, panel, period)
+        except Exception as e:
+            logging.error(f"Error fetching data for {ticker}: {str(e)}")
+            results[ticker] = ValueError(f"Error fetching data for {ticker}: {str(e)}")
+    return results
 
 
-@st.cache_data(ttl=3600)
 def get_ticker_fundamentals(ticker: str) -> dict:
     """
     Get basic fundamental metrics for a ticker.
+
+    Reads the same per-session profile snapshot as ``get_ticker_info``, so
+    no additional Yahoo request is made once either has run.
     """
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = get_fundamentals_store().get(ticker)
 
         return {
             "market_cap": info.get("marketCap", "N/A"),
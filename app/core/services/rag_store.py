@@ -7,9 +7,12 @@ PDF files and handles text extraction, chunking, and embedding generation.
 
 Key capabilities:
 - Text extraction from PDF files using PyPDF2 and pdfplumber fallbacks
+- Parallel page extraction streamed into the splitter and embedded in
+  bounded batches
 - Document chunking with RecursiveCharacterTextSplitter
 - FAISS vector index creation and management
-- URL content integration into existing indexes
+- URL content integration into existing indexes as append-only segments
+- Background compaction of segments into the index base
 - Uploaded file processing and text extraction
 - OpenAI embeddings generation for semantic search
 
@@ -18,14 +21,249 @@ handling for various file formats and processing scenarios.
 """
 
 from langchain_community.vectorstores import FAISS
-from langchain_openai import OpenAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 import os
+import hashlib
 import logging
 import pathlib
-import PyPDF2
-import pdfplumber
+import tempfile
+import uuid
+from functools import lru_cache
+from typing import Iterable
 from urllib.parse import urlparse
+from .document_pipeline import iter_pdf_pages, stream_chunks, stream_pages
+from .retrievers import bump_index_version, get_embeddings, load_vectorstore
+from .segmented_index import IndexCompactor, add_segment, read_manifest, write_base
+
+EMBED_BATCH_SIZE = 128
+
+
+@lru_cache(maxsize=1)
+def get_index_compactor() -> IndexCompactor:
+    """
+    Get the process-wide background compactor for knowledge base indexes.
+
+    Returns
+    -------
+    IndexCompactor
+        Compactor that reloads the index in the registry after each merge
+    """
+    return IndexCompactor(get_embeddings, on_compacted=bump_index_version)
+
+
+def _index_exists(index_path: str) -> bool:
+    manifest = read_manifest(index_path)
+    return bool(manifest["base"] or manifest["segments"])
+
+
+def _sha256(content: bytes | str) -> str:
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def _source_origin(full_path: str) -> str:
+    if full_path.startswith("uploaded:"):
+        return "upload"
+    if urlparse(full_path).scheme in ("http", "https"):
+        return "url"
+    return "kb"
+
+
+def _is_duplicate(index_path: str, sha: str) -> bool:
+    files = read_manifest(index_path)["files"]
+    return any(record["sha256"] == sha for record in files.values())
+
+
+def _adopt_untracked(index_path: str) -> None:
+    """
+    Record sources of an index built before the ingest manifest existed.
+
+    Chunks are grouped by their ``full_path`` metadata and hashed from the
+    stored text, so later ingests reuse their vectors. File hashes are
+    unknown, so each adopted file is re-chunked once on its next ingest.
+    """
+    manifest = read_manifest(index_path)
+    if manifest["files"] or not _index_exists(index_path):
+        return
+    files: dict[str, dict] = {}
+    vectorstore = load_vectorstore(index_path)
+    for name in vectorstore.order:
+        for doc_id, doc in vectorstore.stores[name].docstore._dict.items():
+            source = doc.metadata.get("source")
+            key = doc.metadata.get("full_path") or f"untracked:{source}"
+            record = files.setdefault(
+                key, {"sha256": None, "origin": _source_origin(key), "chunks": []}
+            )
+            record["chunks"].append([_sha256(doc.page_content), doc_id])
+    add_segment(index_path, None, files)
+    logging.info(f"Recorded {len(files)} existing sources in {index_path} manifest")
+
+
+class _SegmentWriter:
+    """
+    Accumulates chunks into an in-memory FAISS store in embedding batches.
+
+    Vectors are taken from chunks with the same text already in the index
+    or written earlier in this run; only the rest are sent to the
+    embeddings model, ``batch_size`` chunks at a time.
+    """
+
+    def __init__(self, index_path: str, known: dict[str, str], batch_size: int):
+        self.embeddings = get_embeddings()
+        self.existing = load_vectorstore(index_path) if known else None
+        self.known = known
+        self.batch_size = batch_size
+        self.store: FAISS | None = None
+        self.embedded = 0
+        self._pending: list[tuple[str, str, str, dict]] = []
+        self._hashes: dict[str, str] = {}
+        self._positions: dict[str, int] = {}
+
+    def add(self, text: str, chunk_hash: str, doc_id: str, metadata: dict) -> None:
+        self._pending.append((text, chunk_hash, doc_id, metadata))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        texts, hashes, ids, metadatas = map(list, zip(*self._pending))
+        self._pending = []
+
+        vectors = {
+            h: self.store.index.reconstruct(self._positions[h]).tolist()
+            for h in hashes
+            if h in self._positions
+        }
+        reusable = {h: self.known[h] for h in hashes if h in self.known}
+        if reusable and self.existing is not None:
+            stored = self.existing.get_vectors(reusable.values())
+            vectors.update({h: stored[i] for h, i in reusable.items() if i in stored})
+        missing = {h: t for h, t in zip(hashes, texts) if h not in vectors}
+        if missing:
+            embedded = self.embeddings.embed_documents(list(missing.values()))
+            vectors.update(zip(missing, embedded))
+            self.embedded += len(missing)
+
+        pairs = [(t, vectors[h]) for t, h in zip(texts, hashes)]
+        offset = self.store.index.ntotal if self.store is not None else 0
+        if self.store is None:
+            self.store = FAISS.from_embeddings(
+                pairs, self.embeddings, metadatas=metadatas, ids=ids
+            )
+        else:
+            self.store.add_embeddings(pairs, metadatas=metadatas, ids=ids)
+        for position, (h, doc_id) in enumerate(zip(hashes, ids), start=offset):
+            self._positions.setdefault(h, position)
+            self._hashes[doc_id] = h
+
+    def set_metadata(self, ids: list[str], **fields) -> None:
+        pending = {doc_id: metadata for _, _, doc_id, metadata in self._pending}
+        for doc_id in ids:
+            if doc_id in pending:
+                pending[doc_id].update(fields)
+            else:
+                self.store.docstore.search(doc_id).metadata.update(fields)
+
+    def discard(self, ids: list[str]) -> None:
+        dropped = set(ids)
+        self._pending = [item for item in self._pending if item[2] not in dropped]
+        flushed = [doc_id for doc_id in ids if doc_id in self._hashes]
+        if not flushed:
+            return
+        self.store.delete(flushed)
+        for doc_id in flushed:
+            del self._hashes[doc_id]
+        self._positions = {}
+        for position, doc_id in self.store.index_to_docstore_id.items():
+            self._positions.setdefault(self._hashes[doc_id], position)
+        if not self.store.index_to_docstore_id:
+            self.store = None
+
+
+def _ingest(
+    index_path: str,
+    sources: Iterable[dict],
+    drop: tuple[str, ...] = (),
+    rebuild: bool = False,
+    batch_size: int = EMBED_BATCH_SIZE,
+) -> int:
+    """
+    Stream chunked sources into the index, embedding only unseen chunks.
+
+    Chunks are embedded in batches as the sources produce them, so a long
+    document is never held as one text or one embedding request. A source
+    whose chunks fail to extract is logged and left out.
+
+    Parameters
+    ----------
+    index_path : str
+        Index directory
+    sources : Iterable[dict]
+        Sources with key, sha256, origin, chunks (any iterable of strings)
+        and metadata (applied to every chunk of the source)
+    drop : tuple[str, ...], default ()
+        Source keys whose chunks are removed
+    rebuild : bool, default False
+        Write a new base holding only ``sources`` instead of a delta segment
+    batch_size : int, default EMBED_BATCH_SIZE
+        Chunks per embedding request
+
+    Returns
+    -------
+    int
+        Number of chunks written
+
+    Raises
+    ------
+    ValueError
+        If a rebuild produced no chunks
+    """
+    known = {}
+    if not rebuild:
+        for record in read_manifest(index_path)["files"].values():
+            known.update(dict(record["chunks"]))
+
+    writer = _SegmentWriter(index_path, known, batch_size)
+    files, total = {}, 0
+    for source in sources:
+        pairs = []
+        try:
+            for i, chunk in enumerate(source["chunks"]):
+                pair = [_sha256(chunk), str(uuid.uuid4())]
+                pairs.append(pair)
+                writer.add(chunk, *pair, {**source["metadata"], "chunk": i})
+        except Exception as e:
+            logging.error(f"Error processing {source['key']}: {e}")
+            writer.discard([doc_id for _, doc_id in pairs])
+            continue
+        if not pairs:
+            logging.warning(f"Warning: No content extracted from {source['key']}")
+            continue
+        writer.set_metadata([doc_id for _, doc_id in pairs], total_chunks=len(pairs))
+        files[source["key"]] = {
+            "sha256": source["sha256"],
+            "origin": source["origin"],
+            "chunks": pairs,
+        }
+        total += len(pairs)
+        logging.info(f"Processed {source['key']}: {len(pairs)} chunks")
+    writer.flush()
+
+    if rebuild:
+        if writer.store is None:
+            raise ValueError("No text content found in any files.")
+        write_base(index_path, writer.store, files)
+    else:
+        add_segment(index_path, writer.store, files, drop)
+        get_index_compactor().request(index_path)
+    bump_index_version(index_path)
+    logging.info(
+        f"Indexed {total} chunks from {len(files)} sources "
+        f"({writer.embedded} embedded, {len(drop)} sources removed)"
+    )
+    return total
 
 
 def extract_text_from_file(file_path: str) -> str:
@@ -53,26 +291,7 @@ def extract_text_from_file(file_path: str) -> str:
     path = pathlib.Path(file_path)
 
     if path.suffix.lower() == ".pdf":
-        try:
-
-            with open(file_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
-        except ImportError:
-            try:
-
-                with pdfplumber.open(file_path) as pdf:
-                    text = ""
-                    for page in pdf.pages:
-                        text += page.extract_text() + "\n"
-                    return text
-            except ImportError:
-                raise ImportError(
-                    "PDF support requires PyPDF2 or pdfplumber: pip install PyPDF2"
-                )
+        return "".join(f"{page}\n" for page in iter_pdf_pages(file_path))
 
     elif path.suffix.lower() in [".md", ".txt"]:
         return path.read_text(encoding="utf-8")
@@ -86,10 +305,14 @@ def extract_text_from_file(file_path: str) -> str:
 
 def build_faiss_from_documents(file_paths: list[str], index_path: str) -> str:
     """
-    Build FAISS vector index from multiple document files.
+    Build or update FAISS vector index from multiple document files.
 
-    Creates a new FAISS index by extracting text from various document
-    formats, chunking the content, and generating embeddings.
+    Files are tracked in the index manifest by content hash. Unchanged
+    files are skipped without being read further, changed files replace
+    only their own chunks, files no longer listed are removed, and chunks
+    already in the index reuse their stored vectors. A new base is built
+    only when the index does not exist yet. Changed PDFs are extracted in
+    parallel and streamed through chunking and embedding.
 
     Parameters
     ----------
@@ -103,56 +326,57 @@ def build_faiss_from_documents(file_paths: list[str], index_path: str) -> str:
     Exception
         If document processing or index creation fails
     """
-    texts, metadatas = [], []
-    splitter = RecursiveCharacterTextSplitter(chunk_size=700, chunk_overlap=120)
+    _adopt_untracked(index_path)
+    rebuild = not _index_exists(index_path)
+    files = {} if rebuild else read_manifest(index_path)["files"]
 
+    changed = {}
     for file_path in file_paths:
         try:
-            content = extract_text_from_file(file_path)
-            if not content.strip():
-                logging.warning(f"Warning: No content extracted from {file_path}")
-                continue
-
-            chunks = splitter.split_text(content)
-            texts += chunks
-
-            file_name = pathlib.Path(file_path).name
-            file_type = (
-                "user_document"
-                if "knowledge_base/user" in file_path
-                else "macro_education"
-            )
-
-            metadatas += [
-                {
-                    "source": file_name,
-                    "full_path": file_path,
-                    "type": file_type,
-                    "chunk": i,
-                    "total_chunks": len(chunks),
-                }
-                for i in range(len(chunks))
-            ]
-
-            logging.info(f"Processed {file_path}: {len(chunks)} chunks")
-
-        except Exception as e:
+            sha = _sha256(pathlib.Path(file_path).read_bytes())
+        except OSError as e:
             logging.error(f"Error processing {file_path}: {e}")
             continue
+        if file_path not in files or files[file_path]["sha256"] != sha:
+            changed[file_path] = sha
 
-    if not texts:
-        raise ValueError("No text content found in any files.")
+    removed = tuple(
+        key
+        for key, record in files.items()
+        if record["origin"] == "kb" and key not in file_paths
+    )
+    if not changed and not removed:
+        if rebuild:
+            raise ValueError("No text content found in any files.")
+        logging.info(f"Knowledge base index at {index_path} is up to date")
+        return index_path
 
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY not set")
 
-    vs = FAISS.from_texts(texts, OpenAIEmbeddings(), metadatas=metadatas)
-    vs.save_local(index_path)
-
-    logging.info(
-        f"Built FAISS index with {len(texts)} chunks from {len(file_paths)} files"
+    splitter = RecursiveCharacterTextSplitter(chunk_size=700, chunk_overlap=120)
+    sources = (
+        {
+            "key": file_path,
+            "sha256": changed[file_path],
+            "origin": "kb",
+            "chunks": stream_chunks(pages, splitter),
+            "metadata": {
+                "source": pathlib.Path(file_path).name,
+                "full_path": file_path,
+                "type": (
+                    "user_document"
+                    if "knowledge_base/user" in file_path
+                    else "macro_education"
+                ),
+            },
+        }
+        for file_path, pages in stream_pages(list(changed))
     )
+    _ingest(index_path, sources, drop=removed, rebuild=rebuild)
+
+    logging.info(f"Updated FAISS index from {len(changed)} of {len(file_paths)} files")
     return index_path
 
 
@@ -160,8 +384,10 @@ def add_url_content_to_index(url: str, content: str, index_path: str) -> bool:
     """
     Add web content to existing FAISS vector index.
 
-    Processes web content by chunking it and adding the resulting
-    embeddings to an existing FAISS index.
+    Processes web content by chunking it and writing the resulting
+    embeddings as a new delta segment, leaving the existing index files
+    untouched. Content already in the index is not added again; changed
+    content of a known URL replaces its previous chunks.
 
     Parameters
     ----------
@@ -177,41 +403,33 @@ def add_url_content_to_index(url: str, content: str, index_path: str) -> bool:
     Exception
         If content processing or index update fails
     """
-    try:
-        existing_vs = FAISS.load_local(
-            index_path, OpenAIEmbeddings(), allow_dangerous_deserialization=True
-        )
-    except FileNotFoundError:
+    if not _index_exists(index_path):
         logging.error("No existing index found, cannot add URL content.")
         return False
-    except Exception as e:
-        logging.error(f"Error loading existing index: {e}")
-        return False
+    _adopt_untracked(index_path)
 
     if not content.strip():
         logging.warning("Warning: No content to add from URL")
         return False
 
+    sha = _sha256(content)
+    if _is_duplicate(index_path, sha):
+        logging.info(f"Content from URL {url} is already indexed")
+        return True
+
     splitter = RecursiveCharacterTextSplitter(chunk_size=700, chunk_overlap=120)
     chunks = splitter.split_text(content)
     domain = urlparse(url).netloc or url
-    metadatas = [
-        {
-            "source": f"{domain}",
-            "full_path": url,
-            "type": "web_content",
-            "chunk": i,
-            "total_chunks": len(chunks),
-        }
-        for i in range(len(chunks))
-    ]
+    source = {
+        "key": url,
+        "sha256": sha,
+        "origin": "url",
+        "chunks": chunks,
+        "metadata": {"source": domain, "full_path": url, "type": "web_content"},
+    }
     try:
-        existing_vs.add_texts(chunks, metadatas=metadatas)
-        existing_vs.save_local(index_path)
-        logging.info(
-            f"Successfully added {len(chunks)} chunks from URL: {url}. "
-            f"Metadata: {metadatas}"
-        )
+        _ingest(index_path, [source])
+        logging.info(f"Successfully added {len(chunks)} chunks from URL: {url}")
         return True
     except Exception as e:
         logging.error(f"Error adding URL content to index: {e}")
@@ -223,7 +441,10 @@ def add_uploaded_files_to_index(uploaded_files: list, index_path: str) -> bool:
     Process uploaded files and add to existing FAISS index.
 
     Handles file uploads directly from memory without requiring
-    disk storage, supporting various file formats.
+    disk storage, supporting various file formats. New chunks are written
+    as a delta segment rather than rewriting the index. Files whose content
+    is already indexed are skipped; a re-upload under a known name with
+    new content replaces the previous chunks.
 
     Parameters
     ----------
@@ -235,62 +456,66 @@ def add_uploaded_files_to_index(uploaded_files: list, index_path: str) -> bool:
     Returns
     -------
     bool
-        True if files were successfully processed, False otherwise
+        True if files were successfully processed or already indexed,
+        False otherwise
     """
-    try:
-        existing_vs = FAISS.load_local(
-            index_path, OpenAIEmbeddings(), allow_dangerous_deserialization=True
-        )
-    except Exception as e:
-        logging.error(f"Error loading existing index: {e}")
+    if not _index_exists(index_path):
+        logging.error("No existing index found, cannot add uploaded files.")
         return False
+    _adopt_untracked(index_path)
 
-    texts, metadatas = [], []
     splitter = RecursiveCharacterTextSplitter(chunk_size=700, chunk_overlap=120)
-
-    for uploaded_file in uploaded_files:
-        try:
-            content = extract_text_from_uploaded_file(uploaded_file)
-
-            if not content.strip():
-                logging.warning(
-                    f"Warning: No content extracted from {uploaded_file.name}"
-                )
-                continue
-
-            chunks = splitter.split_text(content)
-            texts += chunks
-
-            metadatas += [
+    try:
+        with tempfile.TemporaryDirectory() as spool:
+            # Spool uploads to disk so extraction workers read them by path.
+            pending, paths, duplicates = [], [], 0
+            seen = set()
+            for uploaded_file in uploaded_files:
+                data = _uploaded_bytes(uploaded_file)
+                sha = _sha256(data)
+                if sha in seen or _is_duplicate(index_path, sha):
+                    logging.info(f"{uploaded_file.name} is already indexed")
+                    duplicates += 1
+                    continue
+                suffix = pathlib.Path(uploaded_file.name).suffix
+                path = pathlib.Path(spool) / f"{len(paths):04d}{suffix}"
+                path.write_bytes(data)
+                seen.add(sha)
+                pending.append((uploaded_file.name, sha))
+                paths.append(str(path))
+
+            sources = (
                 {
-                    "source": uploaded_file.name,
-                    "full_path": f"uploaded:{uploaded_file.name}",
-                    "type": "user_document",
-                    "chunk": i,
-                    "total_chunks": len(chunks),
+                    "key": f"uploaded:{name}",
+                    "sha256": sha,
+                    "origin": "upload",
+                    "chunks": stream_chunks(pages, splitter),
+                    "metadata": {
+                        "source": name,
+                        "full_path": f"uploaded:{name}",
+                        "type": "user_document",
+                    },
                 }
-                for i in range(len(chunks))
-            ]
-
-            logging.info(f"Processed {uploaded_file.name}: {len(chunks)} chunks")
-
-        except Exception as e:
-            logging.error(f"Error processing {uploaded_file.name}: {e}")
-            continue
-
-    if not texts:
-        return False
-
-    try:
-        existing_vs.add_texts(texts, metadatas=metadatas)
-        existing_vs.save_local(index_path)
-        logging.info(f"Successfully added {len(texts)} chunks from uploaded files")
+                for (name, sha), (_, pages) in zip(pending, stream_pages(paths))
+            )
+            chunk_count = _ingest(index_path, sources) if pending else 0
+        if not chunk_count:
+            return duplicates > 0
+        logging.info(f"Successfully added {chunk_count} chunks from uploaded files")
         return True
     except Exception as e:
         logging.error(f"Error adding to index: {e}")
         return False
 
 
+def _uploaded_bytes(uploaded_file) -> bytes:
+    if hasattr(uploaded_file, "getvalue"):
+        return uploaded_file.getvalue()
+    data = uploaded_file.read()
+    uploaded_file.seek(0)
+    return data
+
+
 def extract_text_from_uploaded_file(uploaded_file) -> str:
     """
     Extract text from uploaded file object.
@@ -317,21 +542,9 @@ def extract_text_from_uploaded_file(uploaded_file) -> str:
 
     if file_extension == ".pdf":
         try:
-            reader = PyPDF2.PdfReader(uploaded_file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text
-        except Exception:
-            try:
-                uploaded_file.seek(0)
-                with pdfplumber.open(uploaded_file) as pdf:
-                    text = ""
-                    for page in pdf.pages:
-                        text += page.extract_text() + "\n"
-                    return text
-            except Exception as e:
-                raise ValueError(f"Failed to extract PDF text: {e}")
+            return "".join(f"{page}\n" for page in iter_pdf_pages(uploaded_file))
+        except Exception as e:
+            raise ValueError(f"Failed to extract PDF text: {e}")
 
     elif file_extension in [".md", ".txt"]:
         return uploaded_file.read().decode("utf-8")
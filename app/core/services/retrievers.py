@@ -7,8 +7,10 @@ including simple similarity search and RAG fusion for enhanced document
 discovery.
 
 Key capabilities:
-- FAISS vector store loading and management
+- Process-wide FAISS vector store registry with change detection
+- Segmented indexes searched across base and delta segments
 - Semantic similarity search with configurable result counts
+- Cached query embeddings shared across retrievals
 - RAG fusion retrieval combining multiple query variants
 - Document deduplication and stable ID generation
 - LangChain integration for retrieval chains
@@ -20,33 +22,181 @@ query expansion for improved search results in knowledge base applications.
 from __future__ import annotations
 import hashlib
 import logging
-from langchain_community.vectorstores import FAISS
+import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator
 from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnableLambda
 from langchain_core.vectorstores import VectorStoreRetriever
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
+from .embedding_cache import CachedEmbeddings, EMBEDDING_CACHE_DB
+from .segmented_index import MANIFEST_NAME, SegmentedFAISS
 from ..prompts.tools.query_variants import system_prompt, user_prompt
 
 logger = logging.getLogger(__name__)
 
 
-def get_embeddings() -> OpenAIEmbeddings:
+@lru_cache(maxsize=4)
+def _cached_embeddings(api_key: str) -> CachedEmbeddings:
+    return CachedEmbeddings(OpenAIEmbeddings(), db_path=EMBEDDING_CACHE_DB)
+
+
+def get_embeddings() -> CachedEmbeddings:
     """
-    Create OpenAI embeddings instance for vector operations.
+    Get the shared OpenAI embeddings client with query/document caching.
+
+    One cached client is kept per API key so that switching keys in the
+    sidebar never reuses a client bound to the previous key.
 
     Returns
     -------
-    OpenAIEmbeddings
-        Configured OpenAI embeddings client
+    CachedEmbeddings
+        OpenAI embeddings wrapped in an LRU cache backed by SQLite
     """
-    return OpenAIEmbeddings()
+    return _cached_embeddings(os.getenv("OPENAI_API_KEY", ""))
 
 
-def load_vectorstore(index_path: str) -> FAISS:
+class VectorstoreRegistry:
+    """
+    Process-wide, thread-safe cache of loaded FAISS vector stores.
+
+    Entries are keyed by absolute index path and validated against the
+    segment manifest and legacy index file mtimes plus an explicit version
+    counter that writers bump after saving. A reload only reads segments
+    the previous entry did not hold. Readers hold a reference while
+    searching, so a reload never drops an index that another session is
+    still using.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        self._versions: dict[str, int] = {}
+
+    def _signature(self, key: str) -> tuple:
+        mtimes = []
+        for name in (MANIFEST_NAME, "index.faiss", "index.pkl"):
+            try:
+                mtimes.append(os.stat(os.path.join(key, name)).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return (*mtimes, self._versions.get(key, 0))
+
+    def _load(self, key: str, previous: SegmentedFAISS | None) -> SegmentedFAISS:
+        try:
+            return SegmentedFAISS.open(key, get_embeddings(), previous=previous)
+        except Exception as e:
+            logger.error(f"Failed to load FAISS index from {key}: {e}")
+            raise FileNotFoundError(f"FAISS index not found or corrupted at {key}")
+
+    def _entry(self, index_path: str) -> dict:
+        key = os.path.abspath(index_path)
+        with self._lock:
+            signature = self._signature(key)
+            entry = self._entries.get(key)
+            if entry is not None and entry["signature"] == signature:
+                entry["refs"] += 1
+                return entry
+            previous = entry["store"] if entry is not None else None
+
+        vectorstore = self._load(key, previous)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["signature"] != signature:
+                entry = {"store": vectorstore, "signature": signature, "refs": 0}
+                self._entries[key] = entry
+                logger.info(f"Loaded FAISS index into registry: {key}")
+            entry["refs"] += 1
+            return entry
+
+    def _release(self, entry: dict) -> None:
+        with self._lock:
+            entry["refs"] -= 1
+
+    @contextmanager
+    def acquire(self, index_path: str) -> Iterator[SegmentedFAISS]:
+        """
+        Borrow the current vector store for an index path.
+
+        Parameters
+        ----------
+        index_path : str
+            Path to the FAISS index directory
+
+        Yields
+        ------
+        SegmentedFAISS
+            Loaded vector store, reloaded only if the index changed on disk
+        """
+        entry = self._entry(index_path)
+        try:
+            yield entry["store"]
+        finally:
+            self._release(entry)
+
+    def get(self, index_path: str) -> SegmentedFAISS:
+        """
+        Get the current vector store for long-lived retrievers and chains.
+
+        Parameters
+        ----------
+        index_path : str
+            Path to the FAISS index directory
+
+        Returns
+        -------
+        SegmentedFAISS
+            Loaded vector store
+        """
+        with self.acquire(index_path) as vectorstore:
+            return vectorstore
+
+    def bump_version(self, index_path: str) -> None:
+        """
+        Mark an index as changed so the next reader reloads it.
+
+        The current entry is kept so the reload can reuse its segments.
+
+        Parameters
+        ----------
+        index_path : str
+            Path to the FAISS index directory that was rewritten
+        """
+        key = os.path.abspath(index_path)
+        with self._lock:
+            self._versions[key] = self._versions.get(key, 0) + 1
+
+    def stats(self) -> dict:
+        """Return loaded index paths with their active reference counts."""
+        with self._lock:
+            return {key: entry["refs"] for key, entry in self._entries.items()}
+
+
+vectorstore_registry = VectorstoreRegistry()
+
+
+def bump_index_version(index_path: str) -> None:
     """
-    Load FAISS vector store from disk.
+    Invalidate the cached vector store after an index was rewritten.
+
+    Parameters
+    ----------
+    index_path : str
+        Path to the FAISS index directory
+    """
+    vectorstore_registry.bump_version(index_path)
+
+
+def load_vectorstore(index_path: str) -> SegmentedFAISS:
+    """
+    Get FAISS vector store from the process-wide registry.
+
+    The index is deserialized from disk only on first use or after it
+    changed; later calls return the already-loaded instance.
 
     Parameters
     ----------
@@ -55,23 +205,15 @@ def load_vectorstore(index_path: str) -> FAISS:
 
     Returns
     -------
-    FAISS
-        Loaded FAISS vector store instance
-        
+    SegmentedFAISS
+        Loaded vector store searching base and delta segments
+
     Raises
     ------
     FileNotFoundError
         If the FAISS index doesn't exist at the specified path
     """
-    try:
-        return FAISS.load_local(
-            index_path,
-            get_embeddings(),
-            allow_dangerous_deserialization=True,
-        )
-    except Exception as e:
-        logger.error(f"Failed to load FAISS index from {index_path}: {e}")
-        raise FileNotFoundError(f"FAISS index not found or corrupted at {index_path}")
+    return vectorstore_registry.get(index_path)
 
 
 def get_semantic_retriever(index_path: str, k: int = 4) -> VectorStoreRetriever:
@@ -105,8 +247,8 @@ def retrieve_semantic(index_path: str, query: str, k: int = 4) -> list[Document]
     query : str
         Search query for document retrieval
     """
-    retriever = get_semantic_retriever(index_path, k=k)
-    return retriever.invoke(query)
+    with vectorstore_registry.acquire(index_path) as vs:
+        return vs.similarity_search(query, k=k)
 
 
 def create_semantic_chain(index_path: str, k: int = 4) -> 'RunnableLambda':
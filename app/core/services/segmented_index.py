@@ -0,0 +1,587 @@
+"""
+Append-only segmented FAISS index with background compaction.
+
+Rewriting one monolithic FAISS index on every knowledge base addition
+makes each addition cost as much as the whole index. This module stores an
+index directory as one base plus small immutable delta segments:
+
+    <index_path>/
+        segments.json          manifest: base, segments, files, deleted
+        base-000003/           index.faiss + index.pkl
+        seg-000004/            index.faiss + index.pkl
+        seg-000005/            ...
+
+Additions embed only the new chunks, write them to a new segment and
+append its name to the manifest, so their cost does not depend on the size
+of the knowledge base. Searches embed the query once, fan out across base
+and segments and merge the per-segment top-k by distance. An IndexCompactor
+thread folds segments into a new base once enough have accumulated.
+
+The manifest also records which source files the index holds, with the
+content hash and docstore ids of their chunks, so callers can skip
+unchanged files. Replacing or dropping a file tombstones its ids in
+``deleted``; searches hide tombstoned documents and compaction removes
+them for good.
+
+Directories written before segmentation (index.faiss and index.pkl at the
+top level) are read as the base until the first compaction or rebuild.
+Segments and bases are never modified after they are written; replaced
+ones are listed as retired and deleted by a later compaction, after
+readers have had time to move on.
+"""
+
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+MANIFEST_NAME = "segments.json"
+LEGACY_BASE = "."
+COMPACT_SEGMENTS = 8
+COMPACT_DELETED = 2000
+RETIRED_GRACE_SECONDS = 300
+
+_path_locks: dict[str, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
+
+def _path_lock(index_path: str) -> threading.Lock:
+    key = os.path.abspath(index_path)
+    with _path_locks_guard:
+        return _path_locks.setdefault(key, threading.Lock())
+
+
+def read_manifest(index_path: str) -> dict:
+    """
+    Read the segment manifest of an index directory.
+
+    Parameters
+    ----------
+    index_path : str
+        Index directory
+
+    Returns
+    -------
+    dict
+        Keys base (directory name or None), segments (list of directory
+        names, oldest first), files (source key to record with sha256 and
+        chunks), deleted (tombstoned docstore ids), retired and next_seq.
+        Directories without a manifest are described from their top-level
+        index files.
+    """
+    path = Path(index_path)
+    try:
+        manifest = json.loads((path / MANIFEST_NAME).read_text("utf-8"))
+    except FileNotFoundError:
+        base = LEGACY_BASE if (path / "index.faiss").exists() else None
+        manifest = {"base": base, "segments": [], "retired": [], "next_seq": 1}
+    manifest.setdefault("files", {})
+    manifest.setdefault("deleted", [])
+    return manifest
+
+
+def _write_manifest(index_path: str, manifest: dict) -> None:
+    path = Path(index_path)
+    tmp_path = path / f"{MANIFEST_NAME}.tmp"
+    tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    tmp_path.replace(path / MANIFEST_NAME)
+
+
+def _allocate(index_path: str, prefix: str) -> str:
+    with _path_lock(index_path):
+        manifest = read_manifest(index_path)
+        name = f"{prefix}-{manifest['next_seq']:06d}"
+        manifest["next_seq"] += 1
+        Path(index_path).mkdir(parents=True, exist_ok=True)
+        _write_manifest(index_path, manifest)
+        return name
+
+
+def _record_ids(record: dict) -> list[str]:
+    return [doc_id for _, doc_id in record["chunks"]]
+
+
+def add_segment(
+    index_path: str,
+    store: Optional[FAISS],
+    files: Optional[dict[str, dict]] = None,
+    drop_files: Iterable[str] = (),
+) -> Optional[str]:
+    """
+    Publish a store as a new delta segment and update file records.
+
+    Parameters
+    ----------
+    index_path : str
+        Index directory
+    store : FAISS, optional
+        Chunks to add; when None only the file records change
+    files : dict[str, dict], optional
+        Source records to store, keyed by source; chunks of a replaced
+        record are tombstoned
+    drop_files : Iterable[str], default ()
+        Sources whose records and chunks are removed
+
+    Returns
+    -------
+    str or None
+        Name of the new segment directory, or None without a store
+    """
+    name = None
+    if store is not None:
+        name = _allocate(index_path, "seg")
+        store.save_local(str(Path(index_path) / name))
+    files = files or {}
+    with _path_lock(index_path):
+        manifest = read_manifest(index_path)
+        for key in [*files, *drop_files]:
+            previous = manifest["files"].pop(key, None)
+            if previous is not None:
+                manifest["deleted"] += _record_ids(previous)
+        manifest["files"].update(files)
+        if name is not None:
+            manifest["segments"].append(name)
+        Path(index_path).mkdir(parents=True, exist_ok=True)
+        _write_manifest(index_path, manifest)
+    if name is not None:
+        logging.info(
+            f"Added segment {name} with {store.index.ntotal} chunks to {index_path}"
+        )
+    return name
+
+
+def write_base(
+    index_path: str, store: FAISS, files: Optional[dict[str, dict]] = None
+) -> str:
+    """
+    Publish a store as the new base, retiring the previous base and segments.
+
+    Parameters
+    ----------
+    index_path : str
+        Index directory, created if missing
+    store : FAISS
+        All chunks of the index
+    files : dict[str, dict], optional
+        Records of the sources making up the new base
+
+    Returns
+    -------
+    str
+        Name of the new base directory
+    """
+    name = _allocate(index_path, "base")
+    store.save_local(str(Path(index_path) / name))
+    with _path_lock(index_path):
+        manifest = read_manifest(index_path)
+        replaced = [manifest["base"], *manifest["segments"]]
+        manifest["retired"] += [
+            {"name": old, "at": time.time()} for old in replaced if old
+        ]
+        manifest["base"] = name
+        manifest["segments"] = []
+        manifest["files"] = files or {}
+        manifest["deleted"] = []
+        _write_manifest(index_path, manifest)
+    return name
+
+
+def _delete_segment(index_path: str, name: str) -> None:
+    path = Path(index_path)
+    if name == LEGACY_BASE:
+        for file_name in ("index.faiss", "index.pkl"):
+            (path / file_name).unlink(missing_ok=True)
+    else:
+        shutil.rmtree(path / name, ignore_errors=True)
+
+
+def _purge_retired(index_path: str) -> None:
+    with _path_lock(index_path):
+        manifest = read_manifest(index_path)
+        cutoff = time.time() - RETIRED_GRACE_SECONDS
+        expired = [r for r in manifest["retired"] if r["at"] < cutoff]
+        if not expired:
+            return
+        manifest["retired"] = [r for r in manifest["retired"] if r["at"] >= cutoff]
+        _write_manifest(index_path, manifest)
+    for retired in expired:
+        _delete_segment(index_path, retired["name"])
+
+
+def _load_segment(index_path: str, name: str, embeddings: Embeddings) -> FAISS:
+    return FAISS.load_local(
+        str(Path(index_path) / name),
+        embeddings,
+        allow_dangerous_deserialization=True,
+    )
+
+
+def compact_index(index_path: str, embeddings: Embeddings) -> bool:
+    """
+    Fold all current segments into a new base and drop tombstoned chunks.
+
+    The merge runs without holding the manifest lock, so additions made
+    during compaction stay as segments for the next round.
+
+    Parameters
+    ----------
+    index_path : str
+        Index directory
+    embeddings : Embeddings
+        Embeddings used for the whole index
+
+    Returns
+    -------
+    bool
+        True if a new base was written
+    """
+    _purge_retired(index_path)
+    manifest = read_manifest(index_path)
+    merged = list(manifest["segments"])
+    if not merged and not manifest["deleted"]:
+        return False
+
+    parts = [manifest["base"], *merged] if manifest["base"] else merged
+    if not parts:
+        return False
+    base = _load_segment(index_path, parts[0], embeddings)
+    for name in parts[1:]:
+        base.merge_from(_load_segment(index_path, name, embeddings))
+    removed = [i for i in manifest["deleted"] if i in base.docstore._dict]
+    if removed:
+        base.delete(removed)
+
+    name = _allocate(index_path, "base")
+    base.save_local(str(Path(index_path) / name))
+    with _path_lock(index_path):
+        manifest = read_manifest(index_path)
+        if manifest["base"] != parts[0] and manifest["base"] is not None:
+            # A rebuild replaced the base while we were merging.
+            manifest["retired"].append({"name": name, "at": 0})
+            _write_manifest(index_path, manifest)
+            return False
+        manifest["retired"] += [{"name": old, "at": time.time()} for old in parts]
+        manifest["base"] = name
+        manifest["segments"] = [s for s in manifest["segments"] if s not in merged]
+        dropped = set(removed)
+        manifest["deleted"] = [i for i in manifest["deleted"] if i not in dropped]
+        _write_manifest(index_path, manifest)
+    logging.info(
+        f"Compacted {len(merged)} segments of {index_path} into {name} "
+        f"({base.index.ntotal} vectors, {len(removed)} deleted)"
+    )
+    return True
+
+
+class SegmentedFAISS(VectorStore):
+    """
+    Read view over the base and delta segments of an index directory.
+    """
+
+    def __init__(
+        self,
+        index_path: str,
+        embedding: Embeddings,
+        stores: dict[str, FAISS],
+        order: list[str],
+        deleted: Iterable[str] = (),
+    ) -> None:
+        """
+        Initialize segmented view; use ``open`` to load from disk.
+
+        Parameters
+        ----------
+        index_path : str
+            Index directory
+        embedding : Embeddings
+            Embeddings used for queries and additions
+        stores : dict[str, FAISS]
+            Loaded stores keyed by base or segment directory name
+        order : list[str]
+            Names in search order, base first
+        deleted : Iterable[str], default ()
+            Tombstoned docstore ids hidden from searches
+        """
+        self.index_path = index_path
+        self.embedding = embedding
+        self.stores = stores
+        self.order = order
+        self._positions: dict[str, dict[str, int]] = {}
+        deleted = set(deleted)
+        self.hidden: dict[str, set[str]] = {
+            name: deleted.intersection(stores[name].index_to_docstore_id.values())
+            if deleted
+            else set()
+            for name in order
+        }
+
+    @classmethod
+    def open(
+        cls,
+        index_path: str,
+        embedding: Embeddings,
+        previous: Optional["SegmentedFAISS"] = None,
+    ) -> "SegmentedFAISS":
+        """
+        Load an index directory, reusing stores already loaded by ``previous``.
+
+        Segments are immutable, so only directories that ``previous`` did
+        not hold are read from disk.
+
+        Parameters
+        ----------
+        index_path : str
+            Index directory
+        embedding : Embeddings
+            Embeddings used for queries and additions
+        previous : SegmentedFAISS, optional
+            Earlier view of the same directory
+
+        Returns
+        -------
+        SegmentedFAISS
+            Current view
+
+        Raises
+        ------
+        FileNotFoundError
+            If the directory holds no index
+        """
+        manifest = read_manifest(index_path)
+        order = ([manifest["base"]] if manifest["base"] else []) + manifest["segments"]
+        if not order:
+            raise FileNotFoundError(f"No FAISS index at {index_path}")
+        loaded = previous.stores if previous is not None else {}
+        stores = {
+            name: loaded.get(name) or _load_segment(index_path, name, embedding)
+            for name in order
+        }
+        return cls(index_path, embedding, stores, order, manifest["deleted"])
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self.embedding
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[list[dict]] = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Add texts as a new delta segment on disk."""
+        texts = list(texts)
+        ids = kwargs.get("ids") or [str(uuid.uuid4()) for _ in texts]
+        store = FAISS.from_texts(texts, self.embedding, metadatas=metadatas, ids=ids)
+        add_segment(self.index_path, store)
+        return ids
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: list[str],
+        embedding: Embeddings,
+        metadatas: Optional[list[dict]] = None,
+        index_path: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "SegmentedFAISS":
+        """Build a new base at ``index_path`` and open it."""
+        if index_path is None:
+            raise ValueError("index_path is required for SegmentedFAISS")
+        store = FAISS.from_texts(list(texts), embedding, metadatas=metadatas)
+        write_base(index_path, store)
+        return cls.open(index_path, embedding)
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: list[float], k: int = 4, **kwargs: Any
+    ) -> list[tuple[Document, float]]:
+        """
+        Search every segment and merge the top-k results by distance.
+
+        Parameters
+        ----------
+        embedding : list[float]
+            Query vector
+        k : int, default 4
+            Number of results
+        **kwargs
+            Passed to each segment's FAISS search (e.g. filter, fetch_k)
+
+        Returns
+        -------
+        list[tuple[Document, float]]
+            Best matches across all segments with their scores
+        """
+        results = []
+        for name in self.order:
+            hidden = self.hidden[name]
+            found = self.stores[name].similarity_search_with_score_by_vector(
+                embedding, k=k + len(hidden), **kwargs
+            )
+            results += [pair for pair in found if pair[0].id not in hidden]
+        first = self.stores[self.order[0]]
+        higher_is_better = first.distance_strategy in (
+            DistanceStrategy.MAX_INNER_PRODUCT,
+            DistanceStrategy.JACCARD,
+        )
+        results.sort(key=lambda pair: pair[1], reverse=higher_is_better)
+        return results[:k]
+
+    def similarity_search_with_score(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> list[tuple[Document, float]]:
+        """Embed the query once and search all segments."""
+        vector = self.embedding.embed_query(query)
+        return self.similarity_search_with_score_by_vector(vector, k=k, **kwargs)
+
+    def similarity_search_by_vector(
+        self, embedding: list[float], k: int = 4, **kwargs: Any
+    ) -> list[Document]:
+        """Return the best documents across all segments for a vector."""
+        return [
+            doc
+            for doc, _ in self.similarity_search_with_score_by_vector(
+                embedding, k=k, **kwargs
+            )
+        ]
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> list[Document]:
+        """Return the best documents across all segments for a query."""
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, **kwargs)]
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        return self.stores[self.order[0]]._select_relevance_score_fn()
+
+    def get_vectors(self, ids: Iterable[str]) -> dict[str, list[float]]:
+        """
+        Read stored vectors back by docstore id.
+
+        Parameters
+        ----------
+        ids : Iterable[str]
+            Docstore ids to look up
+
+        Returns
+        -------
+        dict[str, list[float]]
+            Vectors of the ids found in any segment
+        """
+        wanted = set(ids)
+        vectors = {}
+        for name in self.order:
+            store = self.stores[name]
+            positions = self._positions.get(name)
+            if positions is None:
+                positions = {i: p for p, i in store.index_to_docstore_id.items()}
+                self._positions[name] = positions
+            for doc_id in wanted.intersection(positions).difference(vectors):
+                vectors[doc_id] = store.index.reconstruct(positions[doc_id]).tolist()
+        return vectors
+
+    @property
+    def ntotal(self) -> int:
+        """Number of live vectors across base and segments."""
+        hidden = sum(len(ids) for ids in self.hidden.values())
+        return sum(store.index.ntotal for store in self.stores.values()) - hidden
+
+
+class IndexCompactor:
+    """
+    Background thread that compacts index directories on request.
+    """
+
+    def __init__(
+        self,
+        embeddings_factory: Callable[[], Embeddings],
+        on_compacted: Optional[Callable[[str], None]] = None,
+        min_segments: int = COMPACT_SEGMENTS,
+        max_deleted: int = COMPACT_DELETED,
+    ) -> None:
+        """
+        Initialize index compactor.
+
+        Parameters
+        ----------
+        embeddings_factory : Callable[[], Embeddings]
+            Returns the embeddings used to load segments
+        on_compacted : Callable[[str], None], optional
+            Called with the index path after a new base was published,
+            e.g. to reload the index in the vector store registry
+        min_segments : int, default 8
+            Segment count at which a requested compaction runs
+        max_deleted : int, default 2000
+            Tombstone count at which a requested compaction runs
+        """
+        self.embeddings_factory = embeddings_factory
+        self.on_compacted = on_compacted
+        self.min_segments = min_segments
+        self.max_deleted = max_deleted
+        self.compactions = 0
+        self._queue: queue.Queue[tuple[str, bool]] = queue.Queue()
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="index-compactor", daemon=True
+        )
+        self._thread.start()
+
+    def request(self, index_path: str, force: bool = False) -> bool:
+        """
+        Queue a compaction if the index has enough segments or tombstones.
+
+        Parameters
+        ----------
+        index_path : str
+            Index directory
+        force : bool, default False
+            Compact even below ``min_segments`` and ``max_deleted``
+
+        Returns
+        -------
+        bool
+            True if a compaction was queued
+        """
+        key = os.path.abspath(index_path)
+        manifest = read_manifest(key)
+        due = (
+            len(manifest["segments"]) >= self.min_segments
+            or len(manifest["deleted"]) >= self.max_deleted
+        )
+        if not force and not due:
+            return False
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+        self._queue.put((key, force))
+        return True
+
+    def _run(self) -> None:
+        while True:
+            key, _ = self._queue.get()
+            try:
+                if compact_index(key, self.embeddings_factory()):
+                    self.compactions += 1
+                    if self.on_compacted is not None:
+                        self.on_compacted(key)
+            except Exception as e:
+                logging.error(f"Compaction of {key} failed: {e}")
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                self._queue.task_done()
+
+    def wait(self) -> None:
+        """Block until all queued compactions have finished."""
+        self._queue.join()
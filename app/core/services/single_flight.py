@@ -0,0 +1,91 @@
+"""
+Single-flight coalescing of concurrent identical calls.
+
+When several Streamlit sessions miss the cache for the same key at the
+same moment, only the first caller runs the underlying fetch; the others
+wait on the same future and receive its result or exception. This keeps a
+cache expiry from turning into a burst of identical Yahoo or FRED requests.
+
+Coalescing is per process. Different processes sharing the SQLite cache
+backend still perform one fetch each.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls that share a key.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty in-flight table and counters."""
+        self._calls: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable, *args, **kwargs) -> tuple[Any, bool]:
+        """
+        Run ``fn`` once for all concurrent callers with the same key.
+
+        Parameters
+        ----------
+        key : str
+            Identity of the call; callers with equal keys share one execution
+        fn : Callable
+            Function to execute
+        *args, **kwargs
+            Arguments passed to ``fn`` by the executing caller
+
+        Returns
+        -------
+        tuple[Any, bool]
+            The result, and whether it was shared from another caller's
+            execution
+
+        Raises
+        ------
+        Exception
+            Whatever ``fn`` raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            value = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value, False
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        """Return the number of keys currently executing."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> dict:
+        """Return execution and coalescing counters."""
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
@@ -0,0 +1,454 @@
+"""
+US equity trading calendar with constant-time session arithmetic.
+
+This module builds a NumPy business-day calendar from the holiday and
+early-close rules in knowledge_base/semistatic/us_market_holidays.json.
+Session checks and N-sessions-back offsets are then answered by
+np.is_busday and np.busday_offset instead of parsing holiday strings on
+every call.
+
+Key capabilities:
+- Trading-day, holiday and early-close lookups for any date
+- Next/previous session and N-sessions-back offsets
+- Session counts for Yahoo-style analysis periods (1wk ... 1y), counted on
+  the calendar between the period start and the anchor date
+- Per-year holiday listings for the market holiday tool
+- Session open/close times and the moment a session's bars are final
+
+Holidays are generated per year from their rules (fixed dates with
+weekend observance, nth weekdays, Easter offsets). The calendar starts
+with the years around today and is extended on demand whenever a lookup
+reaches outside the covered years.
+"""
+
+import json
+import logging
+import re
+import threading
+from datetime import date, datetime, timedelta
+from datetime import time as clock
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from core.analyzers.horizons import period_start
+
+HOLIDAYS_PATH = (
+    Path(__file__).parent.parent.parent
+    / "knowledge_base"
+    / "semistatic"
+    / "us_market_holidays.json"
+)
+INITIAL_YEARS_BACK = 5
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = clock(9, 30)
+MARKET_CLOSE = clock(16, 0)
+POST_CLOSE = timedelta(minutes=30)
+
+MONTHS = {
+    name: number
+    for number, name in enumerate(
+        "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split(), start=1
+    )
+}
+WEEKDAYS = {name: number for number, name in enumerate("Mon Tue Wed Thu Fri".split())}
+ORDINALS = {"1st": 1, "2nd": 2, "3rd": 3, "4th": 4, "5th": 5, "last": -1}
+
+
+def _to_day(value) -> np.datetime64:
+    return np.datetime64(value, "D")
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (Meeus/Jones/Butcher algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    g = (b - (b + 8) // 25 + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    weekday_shift = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * weekday_shift) // 451
+    month, day = divmod(h + weekday_shift - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, nth: int) -> date:
+    if nth > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (nth - 1))
+    following = date(year + month // 12, month % 12 + 1, 1)
+    last = following - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def rule_date(year: int, rule: str) -> date:
+    """
+    Resolve a holiday rule to its date in a year, before weekend observance.
+
+    Parameters
+    ----------
+    year : int
+        Calendar year
+    rule : str
+        "Jan 1", "3rd Mon Jan", "last Mon May" or "Easter -2", optionally
+        followed by a day offset such as "+1"
+
+    Returns
+    -------
+    date
+        Date the rule falls on
+
+    Raises
+    ------
+    ValueError
+        If the rule cannot be parsed
+    """
+    parts = rule.split()
+    offset = 0
+    if len(parts) > 1 and re.fullmatch(r"[+-]\d+", parts[-1]):
+        offset = int(parts.pop())
+    if parts == ["Easter"]:
+        day = _easter(year)
+    elif len(parts) == 3 and parts[0] in ORDINALS:
+        ordinal, weekday, month = parts
+        day = _nth_weekday(year, MONTHS[month], WEEKDAYS[weekday], ORDINALS[ordinal])
+    elif len(parts) == 2 and parts[0] in MONTHS:
+        day = date(year, MONTHS[parts[0]], int(parts[1]))
+    else:
+        raise ValueError(f"Unsupported holiday rule: {rule}")
+    return day + timedelta(days=offset)
+
+
+class TradingCalendar:
+    """
+    NYSE-style session calendar generated from holiday rules.
+    """
+
+    def __init__(self, holiday_data: dict, years: Optional[range] = None) -> None:
+        """
+        Initialize trading calendar.
+
+        Parameters
+        ----------
+        holiday_data : dict
+            Parsed holiday file with "holidays", "early_closes" and optional
+            "special_closures" lists
+        years : range, optional
+            Years generated up front, defaults to the last INITIAL_YEARS_BACK
+            years through next year; other years are added on demand
+        """
+        self.holiday_data = holiday_data
+        self.holidays: dict[np.datetime64, str] = {}
+        self.early_closes: dict[np.datetime64, tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        self._years = range(0)
+        if years is None:
+            this_year = date.today().year
+            years = range(this_year - INITIAL_YEARS_BACK, this_year + 2)
+        self._ensure_years(years.start, years.stop - 1)
+
+    def _year_holidays(self, year: int) -> dict[np.datetime64, str]:
+        holidays = {}
+        for holiday in self.holiday_data.get("holidays", []):
+            if year < holiday.get("since", year):
+                continue
+            try:
+                day = rule_date(year, holiday["rule"])
+            except (KeyError, ValueError) as e:
+                logging.error(f"Holiday rule error for {holiday.get('name')}: {e}")
+                continue
+            name = holiday["name"]
+            if day.weekday() == 5:
+                if not holiday.get("observe_saturday", True):
+                    continue
+                day, name = day - timedelta(days=1), f"{name} (observed)"
+            elif day.weekday() == 6:
+                day, name = day + timedelta(days=1), f"{name} (observed)"
+            holidays[_to_day(day)] = name
+        for closure in self.holiday_data.get("special_closures", []):
+            if closure["date"].startswith(str(year)):
+                holidays[_to_day(closure["date"])] = closure["name"]
+        return holidays
+
+    def _year_early_closes(
+        self, year: int, holidays: dict[np.datetime64, str]
+    ) -> dict[np.datetime64, tuple[str, str]]:
+        early_closes = {}
+        for early_close in self.holiday_data.get("early_closes", []):
+            try:
+                day = _to_day(rule_date(year, early_close["rule"]))
+            except (KeyError, ValueError) as e:
+                logging.error(
+                    f"Early close rule error for {early_close.get('name')}: {e}"
+                )
+                continue
+            if np.is_busday(day) and day not in holidays:
+                early_closes[day] = (early_close["name"], early_close["close_time"])
+        return early_closes
+
+    def _ensure_years(self, first: int, last: int) -> None:
+        if first in self._years and last in self._years:
+            return
+        with self._lock:
+            start = min(first, self._years.start) if self._years else first
+            stop = max(last + 1, self._years.stop) if self._years else last + 1
+            holidays, early_closes = dict(self.holidays), dict(self.early_closes)
+            for year in range(start, stop):
+                if year in self._years:
+                    continue
+                year_holidays = self._year_holidays(year)
+                holidays.update(year_holidays)
+                early_closes.update(self._year_early_closes(year, year_holidays))
+            busdaycal = np.busdaycalendar(weekmask="1111100", holidays=sorted(holidays))
+            self.holidays, self.early_closes = holidays, early_closes
+            self._busdaycal = busdaycal
+            self._years = range(start, stop)
+
+    def _covering(self, *days: np.datetime64, sessions: int = 0) -> np.busdaycalendar:
+        """Busday calendar covering ``days`` and ``sessions`` around them."""
+        years = [day.astype(object).year for day in days]
+        # One year of slack covers offsets that cross a year boundary.
+        span = sessions // 240 + 1
+        self._ensure_years(min(years) - span, max(years) + span)
+        return self._busdaycal
+
+    def is_trading_day(self, day) -> bool:
+        """Return True if markets are open (fully or early close) on a date."""
+        day = _to_day(day)
+        return bool(np.is_busday(day, busdaycal=self._covering(day)))
+
+    def holiday_name(self, day) -> Optional[str]:
+        """Return the holiday name for a date, or None."""
+        day = _to_day(day)
+        self._covering(day)
+        return self.holidays.get(day)
+
+    def early_close(self, day) -> Optional[tuple[str, str]]:
+        """Return (name, close_time) for an early-close date, or None."""
+        day = _to_day(day)
+        self._covering(day)
+        return self.early_closes.get(day)
+
+    def next_session(self, day, inclusive: bool = False) -> date:
+        """
+        Get the first trading session after a date.
+
+        Parameters
+        ----------
+        day : date-like
+            Reference date
+        inclusive : bool, default False
+            Return ``day`` itself when it is a trading day
+
+        Returns
+        -------
+        date
+            Next trading session
+        """
+        offset = 0 if inclusive else 1
+        day = _to_day(day)
+        if not inclusive and not self.is_trading_day(day):
+            offset = 0
+        return np.busday_offset(
+            day, offset, roll="forward", busdaycal=self._covering(day)
+        ).astype(date)
+
+    def previous_session(self, day, inclusive: bool = False) -> date:
+        """
+        Get the last trading session before a date.
+
+        Parameters
+        ----------
+        day : date-like
+            Reference date
+        inclusive : bool, default False
+            Return ``day`` itself when it is a trading day
+
+        Returns
+        -------
+        date
+            Previous trading session
+        """
+        offset = 0 if inclusive else -1
+        day = _to_day(day)
+        if not inclusive and not self.is_trading_day(day):
+            offset = 0
+        return np.busday_offset(
+            day, offset, roll="backward", busdaycal=self._covering(day)
+        ).astype(date)
+
+    def session_hours(self, day) -> tuple[datetime, datetime]:
+        """
+        Get the open and close of a session in US/Eastern time.
+
+        Parameters
+        ----------
+        day : date-like
+            Trading day
+
+        Returns
+        -------
+        tuple[datetime, datetime]
+            Timezone-aware open and (possibly early) close
+        """
+        day = _to_day(day).astype(date)
+        close = MARKET_CLOSE
+        early_close = self.early_close(day)
+        if early_close:
+            close = datetime.strptime(
+                early_close[1].removesuffix(" ET"), "%I:%M %p"
+            ).time()
+        return (
+            datetime.combine(day, MARKET_OPEN, MARKET_TZ),
+            datetime.combine(day, close, MARKET_TZ),
+        )
+
+    def is_open(self, now: datetime) -> bool:
+        """
+        Check whether a session is running, including the POST_CLOSE window.
+
+        Parameters
+        ----------
+        now : datetime
+            Timezone-aware moment
+
+        Returns
+        -------
+        bool
+            True between the open and POST_CLOSE after the close of a session
+        """
+        local = now.astimezone(MARKET_TZ)
+        if not self.is_trading_day(local.date()):
+            return False
+        open_at, close_at = self.session_hours(local.date())
+        return open_at <= local < close_at + POST_CLOSE
+
+    def last_settled(self, now: datetime) -> datetime:
+        """
+        Get the moment the most recent completed session's bars became final.
+
+        Bars fetched after this moment and before the next open do not
+        change until that open.
+
+        Parameters
+        ----------
+        now : datetime
+            Timezone-aware moment
+
+        Returns
+        -------
+        datetime
+            POST_CLOSE after the close of the last session that ended
+            before ``now``
+        """
+        local = now.astimezone(MARKET_TZ)
+        day = self.previous_session(local.date(), inclusive=True)
+        settled = self.session_hours(day)[1] + POST_CLOSE
+        if settled > local:
+            settled = self.session_hours(self.previous_session(day))[1] + POST_CLOSE
+        return settled
+
+    def sessions_back(self, n: int, end=None) -> date:
+        """
+        Get the session ``n`` trading days before ``end``.
+
+        Parameters
+        ----------
+        n : int
+            Number of sessions to step back
+        end : date-like, optional
+            Anchor date, defaults to today; rolled back to a session first
+
+        Returns
+        -------
+        date
+            Trading session n sessions before the anchor
+        """
+        end = _to_day(end if end is not None else date.today())
+        return np.busday_offset(
+            end, -n, roll="backward", busdaycal=self._covering(end, sessions=n)
+        ).astype(date)
+
+    def sessions_between(self, start, end) -> int:
+        """Count trading sessions in [start, end)."""
+        start, end = _to_day(start), _to_day(end)
+        return int(
+            np.busday_count(start, end, busdaycal=self._covering(start, end))
+        )
+
+    def holidays_between(self, start, end) -> list[date]:
+        """List full-day closures in [start, end], generating years as needed."""
+        start, end = _to_day(start), _to_day(end)
+        self._covering(start, end)
+        return sorted(
+            day.astype(date) for day in self.holidays if start <= day <= end
+        )
+
+    def period_sessions(self, period: str, end=None) -> int:
+        """
+        Count the sessions a Yahoo-style period spans on the calendar.
+
+        Parameters
+        ----------
+        period : str
+            Period such as "1wk" or "1y"; unbounded or unknown periods
+            count as "1y"
+        end : date-like, optional
+            Anchor date, defaults to today
+
+        Returns
+        -------
+        int
+            Sessions in [period start, end)
+        """
+        end = pd.Timestamp(end if end is not None else date.today()).normalize()
+        start = period_start(period, end)
+        if start is None:
+            start = period_start("1y", end)
+        return self.sessions_between(start, end)
+
+    def year_events(self, year: int) -> list[tuple[date, str, str]]:
+        """
+        List closures and early closes in a year.
+
+        Parameters
+        ----------
+        year : int
+            Calendar year
+
+        Returns
+        -------
+        list[tuple[date, str, str]]
+            (date, name, status) tuples sorted by date, where status is
+            "Market Closed" or "Early Close (<time>)"
+        """
+        self._ensure_years(year, year)
+        events = [
+            (day.astype(date), name, "Market Closed")
+            for day, name in self.holidays.items()
+            if day.astype(date).year == year
+        ]
+        events += [
+            (day.astype(date), name, f"Early Close ({close_time})")
+            for day, (name, close_time) in self.early_closes.items()
+            if day.astype(date).year == year
+        ]
+        return sorted(events, key=lambda event: event[0])
+
+
+@lru_cache(maxsize=1)
+def get_trading_calendar() -> TradingCalendar:
+    """
+    Get the process-wide trading calendar built from the holiday file.
+
+    Returns
+    -------
+    TradingCalendar
+        Shared calendar instance
+    """
+    return TradingCalendar(json.loads(HOLIDAYS_PATH.read_text(encoding="utf-8")))
@@ -2,7 +2,8 @@
 US market holiday checker tool for trading schedule analysis.
 
 This module provides functionality to check US market holidays and trading
-schedules using a comprehensive holiday database. It supports various query
+schedules using the shared trading calendar, which is built once from the
+holiday database. It supports various query
 types including specific date checks, yearly holiday listings, and finding
 remaining holidays in the current year.
 
@@ -17,14 +18,15 @@ Key features:
 - NYSE and NASDAQ holiday coverage
 """
 
-import json
 import logging
+import re
 from typing import Optional
-from pathlib import Path
 from datetime import datetime
 from pydantic import BaseModel, Field
 from langchain_core.tools import tool
 
+from core.services.trading_calendar import TradingCalendar, get_trading_calendar
+
 
 class HolidayInput(BaseModel):
     """Input for market holiday checker tool."""
@@ -52,35 +54,26 @@ def market_holiday_checker(query: str = None) -> str:
     • Finding remaining holidays in the current year
     • Planning around market closures and trading schedules
     """
-    app_dir = Path(__file__).parent.parent.parent
-    holidays_path = app_dir / "knowledge_base/semistatic/us_market_holidays.json"
-
     try:
-        holiday_data = json.loads(holidays_path.read_text())
+        calendar = get_trading_calendar()
         today = datetime.now()
         current_year = today.year
         if query is None:
             date_str = today.strftime("%Y-%m-%d")
-            return _check_single_date(date_str, holiday_data, current_year)
+            return _check_single_date(date_str, calendar)
 
         query_lower = query.lower()
-        year_match = None
-        for year in range(2020, 2030):
-            if str(year) in query:
-                year_match = year
-                break
-
-        if year_match is None:
-            year_match = current_year
+        year_found = re.search(r"(?<!\d)\d{4}(?!\d)", query)
+        year_match = int(year_found.group()) if year_found else current_year
 
         if any(word in query_lower for word in ["all", "list", "holidays"]):
-            return _list_all_holidays(year_match, holiday_data)
+            return _list_all_holidays(year_match, calendar)
         elif any(word in query_lower for word in ["remaining", "left", "upcoming"]):
-            return _list_remaining_holidays(year_match, holiday_data, today)
+            return _list_remaining_holidays(year_match, calendar, today)
         elif _is_date_format(query):
-            return _check_single_date(query, holiday_data, year_match)
+            return _check_single_date(query, calendar)
         else:
-            return _list_all_holidays(year_match, holiday_data)
+            return _list_all_holidays(year_match, calendar)
 
     except Exception as e:
         logging.error(f"Error in market_holiday_checker: {str(e)}")
@@ -97,72 +90,46 @@ def _is_date_format(date_str: str) -> bool:
         return False
 
 
-def _check_single_date(date_str: str, holiday_data: dict, year: int) -> str:
+def _check_single_date(date_str: str, calendar: TradingCalendar) -> str:
     """Check if a specific date is a holiday."""
     try:
-        check_date = datetime.strptime(date_str, "%Y-%m-%d")
-        for holiday in holiday_data.get("holidays", []):
-            holiday_date_str = f"{year} {holiday['date']}"
-            try:
-                holiday_date = datetime.strptime(holiday_date_str, "%Y %b %d")
-                if check_date.date() == holiday_date.date():
-                    return (
-                        f"**{date_str}** is a US market holiday: **{holiday['name']}**. "
-                        f"Markets are closed."
-                    )
-            except ValueError:
-                logging.error(f"Date parsing error for holiday: {holiday_date_str}")
-                continue
-        for early_close in holiday_data.get("early_closes", []):
-            early_close_date_str = f"{year} {early_close['date']}"
-            try:
-                early_close_date = datetime.strptime(early_close_date_str, "%Y %b %d")
-                if check_date.date() == early_close_date.date():
-                    return (
-                        f"**{date_str}** is an early close day: "
-                        f"**{early_close['name']}**. "
-                        f"Markets close at {early_close['close_time']}."
-                    )
-            except ValueError:
-                logging.error(
-                    f"Date parsing error for early close: {early_close_date_str}"
-                )
-                continue
-
-        return f"**{date_str}** is a regular trading day. US markets are open."
-
+        check_date = datetime.strptime(date_str, "%Y-%m-%d").date()
     except ValueError:
         logging.error(f"Invalid date format provided: {date_str}")
         return f"Invalid date format: {date_str}. Please use YYYY-MM-DD format."
 
+    holiday_name = calendar.holiday_name(check_date)
+    if holiday_name is not None:
+        return (
+            f"**{date_str}** is a US market holiday: **{holiday_name}**. "
+            f"Markets are closed."
+        )
 
-def _list_all_holidays(year: int, holiday_data: dict) -> str:
-    """List all holidays for a specific year."""
-    year_holidays = []
-    for holiday in holiday_data.get("holidays", []):
-        holiday_date_str = f"{year} {holiday['date']}"
-        try:
-            date_obj = datetime.strptime(holiday_date_str, "%Y %b %d")
-            year_holidays.append((date_obj, holiday["name"], "Market Closed"))
-        except ValueError:
-            logging.error(f"Date parsing error for holiday: {holiday_date_str}")
-            continue
-
-    for early_close in holiday_data.get("early_closes", []):
-        early_close_date_str = f"{year} {early_close['date']}"
-        try:
-            date_obj = datetime.strptime(early_close_date_str, "%Y %b %d")
-            close_info = f"Early Close ({early_close['close_time']})"
-            year_holidays.append((date_obj, early_close["name"], close_info))
-        except ValueError:
-            logging.error(f"Date parsing error for early close: {early_close_date_str}")
-            continue
+    early_close = calendar.early_close(check_date)
+    if early_close is not None:
+        name, close_time = early_close
+        return (
+            f"**{date_str}** is an early close day: "
+            f"**{name}**. "
+            f"Markets close at {close_time}."
+        )
 
+    if not calendar.is_trading_day(check_date):
+        next_session = calendar.next_session(check_date)
+        return (
+            f"**{date_str}** is a weekend. US markets are closed; "
+            f"the next session is {next_session:%A, %B %d}."
+        )
+
+    return f"**{date_str}** is a regular trading day. US markets are open."
+
+
+def _list_all_holidays(year: int, calendar: TradingCalendar) -> str:
+    """List all holidays for a specific year."""
+    year_holidays = calendar.year_events(year)
     if not year_holidays:
         return f"No market holidays found for {year}."
 
-    year_holidays.sort(key=lambda x: x[0])
-
     result = [f"**US Market Holidays for {year}:**\n"]
 
     for i, (date_obj, holiday_name, status) in enumerate(year_holidays, 1):
@@ -182,42 +149,23 @@ def _list_all_holidays(year: int, holiday_data: dict) -> str:
     return "\n".join(result)
 
 
-def _list_remaining_holidays(year: int, holiday_data: dict, today: datetime) -> str:
+def _list_remaining_holidays(
+    year: int, calendar: TradingCalendar, today: datetime
+) -> str:
     """List remaining holidays for the year."""
-    remaining_holidays = []
-
-    for holiday in holiday_data.get("holidays", []):
-        holiday_date_str = f"{year} {holiday['date']}"
-        try:
-            date_obj = datetime.strptime(holiday_date_str, "%Y %b %d")
-            if date_obj.date() >= today.date():
-                remaining_holidays.append((date_obj, holiday["name"], "Market Closed"))
-        except ValueError:
-            logging.error(f"Date parsing error for holiday: {holiday_date_str}")
-            continue
-
-    for early_close in holiday_data.get("early_closes", []):
-        early_close_date_str = f"{year} {early_close['date']}"
-        try:
-            date_obj = datetime.strptime(early_close_date_str, "%Y %b %d")
-            if date_obj.date() >= today.date():
-                close_info = f"Early Close ({early_close['close_time']})"
-                remaining_holidays.append((date_obj, early_close["name"], close_info))
-        except ValueError:
-            logging.error(f"Date parsing error for early close: {early_close_date_str}")
-            continue
+    remaining_holidays = [
+        event for event in calendar.year_events(year) if event[0] >= today.date()
+    ]
 
     if not remaining_holidays:
         return f"No remaining market holidays for {year}."
 
-    remaining_holidays.sort(key=lambda x: x[0])
-
     result = [f"**Remaining US Market Holidays for {year}:**\n"]
 
     for i, (date_obj, holiday_name, status) in enumerate(remaining_holidays, 1):
         day_name = date_obj.strftime("%A")
         date_formatted = date_obj.strftime("%B %d")
-        days_until = (date_obj.date() - today.date()).days
+        days_until = (date_obj - today.date()).days
         if days_until == 0:
             time_info = "Today"
         elif days_until == 1:
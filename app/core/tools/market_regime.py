@@ -13,22 +13,32 @@ periods and includes top-performing sector identification.
 Key capabilities:
 - Market regime classification (risk-on/risk-off)
 - Multi-indicator analysis (SPX, VIX, DXY, 10Y yields)
+- Short/medium rolling-window regime confirmation
+- Market breadth across the constituent universe
 - Sector performance ranking and analysis
+- Leading constituents per sector from the constituent scan
 - Configurable time periods and sector counts
 - Structured market intelligence output
 """
 
+import logging
 from typing import Optional, Literal
 from pydantic import BaseModel, Field
 from langchain_core.tools import tool
 
 from core.services.market_data import (
+    get_market_breadth,
+    get_market_signals,
     get_market_snapshot,
+    get_sector_leaders,
     get_sector_perf,
     get_ticker_samples,
+    load_market_indicators,
     load_sector_data,
 )
-from core.analyzers.regime import load_regime_config, classify_regime
+from core.analyzers.regime import load_regime_rules, classify_regime
+from core.analyzers.signals import confirm_regime, latest_signals
+from core.analyzers.breadth import describe_breadth
 
 
 class MarketRegimeInput(BaseModel):
@@ -62,24 +72,30 @@ def market_regime_analyzer(period: str = "1wk", top_n_sectors: int = 3) -> str:
     • Volatility and risk sentiment (VIX)
     • Interest rate environment (10Y Treasury)
     • Sector rotation and leadership trends
+    • Market breadth: % of stocks above 50/200-day MAs, A/D line, new highs/lows
 
     **Use this as your primary market analysis tool** - no need to call others.
     """
     snapshot = get_market_snapshot(period)
-    cfg = load_regime_config()
+    cfg = load_regime_rules()
 
     deltas = snapshot["deltas"]
-    regime = classify_regime(
-        spx_pct=deltas["spx_pct"],
-        vix_pct=deltas["vix_pct"],
-        dxy_pct=deltas["dxy_pct"],
-        ust10y_bp=deltas["ust10y_bp"],
-        cfg=cfg,
-    )
+    try:
+        breadth = get_market_breadth()
+    except Exception as e:
+        logging.error(f"Market breadth unavailable: {e}")
+        breadth = None
+    breadth_signals = breadth["signals"] if breadth else {}
+    regime = classify_regime(**deltas, cfg=cfg, **breadth_signals)
 
     sectors_df = get_sector_perf(period=period)
     top_sectors = sectors_df.head(top_n_sectors).to_dict(orient="records")
     samples = get_ticker_samples()
+    try:
+        leaders = get_sector_leaders(period=period)
+    except Exception as e:
+        logging.error(f"Sector leaders unavailable: {e}")
+        leaders = {}
 
     analysis = []
     date_info = ""
@@ -104,6 +120,24 @@ def market_regime_analyzer(period: str = "1wk", top_n_sectors: int = 3) -> str:
     analysis.append(f"\n**Current Regime: {regime_name.upper()}**")
     if regime_note:
         analysis.append(f"*{regime_note}*")
+    active_flags = [name for name, on in regime.get("flags", {}).items() if on]
+    if active_flags:
+        analysis.append(f"Active regime flags: {', '.join(active_flags)}")
+
+    try:
+        confirmation = confirm_regime(
+            latest_signals(get_market_signals()), cfg, load_market_indicators()
+        )
+        analysis.append(f"Rolling-window check: {confirmation['summary']}")
+    except Exception as e:
+        logging.error(f"Rolling signals unavailable: {e}")
+    if breadth:
+        breadth_date = breadth["summary"].get("as_of")
+        breadth_date_info = f" (as of {breadth_date})" if breadth_date else ""
+        analysis.append(
+            f"Market breadth{breadth_date_info}: "
+            f"{describe_breadth(breadth['summary'])}"
+        )
 
     if "deltas" in snapshot:
         deltas = snapshot["deltas"]
@@ -186,8 +220,16 @@ def market_regime_analyzer(period: str = "1wk", top_n_sectors: int = 3) -> str:
         sector_info = sector_data_json.get(etf_symbol, {})
         sector_name = sector_info.get("sector_name", etf_symbol)
 
-        ticker_list = ", ".join(sector_tickers[:3]) if sector_tickers else "N/A"
-        examples = f"(Examples: {ticker_list})"
+        sector_leaders = leaders.get(etf_symbol)
+        if sector_leaders:
+            leader_list = ", ".join(
+                f"{leader['ticker']} {leader['return'] * 100:+.1f}%"
+                for leader in sector_leaders
+            )
+            examples = f"(Leaders: {leader_list})"
+        else:
+            ticker_list = ", ".join(sector_tickers[:3]) if sector_tickers else "N/A"
+            examples = f"(Examples: {ticker_list})"
         if start_price and end_price:
             sector_line = (
                 f"{i}. **{sector_name}**: {sector_return:+.2f}% "
@@ -0,0 +1,128 @@
+"""
+Regression check for the number of LLM requests made by a market pulse.
+
+Runs ``run_market_pulse`` offline: market data and retrieval stages are
+replaced by fixed inputs and the controller's ChatOpenAI client talks to a
+stub HTTP transport that answers with a valid MarketPulse and counts the
+chat completion requests it receives. The check fails when a pulse sends
+more than EXPECTED_LLM_CALLS requests upstream.
+
+Usage (from the app directory):
+    python scripts/check_pulse_llm_calls.py
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import httpx
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("OPENAI_API_KEY", "sk-stub")
+
+from langchain_openai import ChatOpenAI  # noqa: E402
+
+from core import controller  # noqa: E402
+
+EXPECTED_LLM_CALLS = 1
+STUB_PULSE = {
+    "as_of": "2025-01-02",
+    "detected_regime": "Risk-On",
+    "sectors": [],
+    "global_summary": "Stub summary.",
+    "citations": [],
+}
+STUB_STAGES = {
+    "get_sector_perf": lambda period: pd.DataFrame(
+        {"sector": ["Technology", "Energy", "Utilities"], "return": [0.02, 0.01, 0.0]}
+    ),
+    "get_market_snapshot": lambda period: {
+        "deltas": {
+            "spx_pct": 1.0,
+            "vix_pct": -5.0,
+            "dxy_pct": 0.1,
+            "gold_pct": 0.2,
+            "ust10y_bp": 2.0,
+        }
+    },
+    "get_market_signals": lambda: None,
+    "retrieve_semantic": lambda index_path, query, k: [],
+    "get_ticker_samples": lambda: {},
+    "get_sector_leaders": lambda period: {},
+    "get_market_breadth": lambda: None,
+}
+
+
+def _stub_reply(request: httpx.Request) -> httpx.Response:
+    """Answer a chat completion request with a MarketPulse payload."""
+    body = json.loads(request.content)
+    message = {"role": "assistant", "content": json.dumps(STUB_PULSE)}
+    if body.get("tools"):
+        name = body["tools"][0]["function"]["name"]
+        message = {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {
+                    "id": "call_stub",
+                    "type": "function",
+                    "function": {"name": name, "arguments": json.dumps(STUB_PULSE)},
+                }
+            ],
+        }
+    return httpx.Response(
+        200,
+        json={
+            "id": "stub",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        },
+    )
+
+
+def count_pulse_llm_calls(period: str = "1mo") -> int:
+    """
+    Run one market pulse against the stub transport.
+
+    Parameters
+    ----------
+    period : str, default "1mo"
+        Analysis period passed to the pulse
+
+    Returns
+    -------
+    int
+        Chat completion requests sent during the pulse
+    """
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return _stub_reply(request)
+
+    for name, stub in STUB_STAGES.items():
+        setattr(controller, name, stub)
+    session = controller.MarketIntelligenceSessionController(ops_per_min=60)
+    llm = session.llm_client._default_llm
+    session.llm_client._default_llm = ChatOpenAI(
+        model=llm.model_name,
+        api_key="sk-stub",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    session.run_market_pulse(index_path="", period=period)
+    return len(requests)
+
+
+if __name__ == "__main__":
+    calls = count_pulse_llm_calls()
+    if calls != EXPECTED_LLM_CALLS:
+        sys.exit(
+            f"run_market_pulse sent {calls} LLM requests, "
+            f"expected {EXPECTED_LLM_CALLS}"
+        )
+    print(f"run_market_pulse sent {calls} LLM request")
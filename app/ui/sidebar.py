@@ -136,8 +136,7 @@ def render_sidebar(index_path: str) -> None:
                     os.environ["FRED_API_KEY"] = ui_state.fred_key
 
                 os.makedirs("var", exist_ok=True)
-                if not os.path.exists(index_path):
-                    build_faiss_from_documents(DEFAULT_KB, index_path)
+                build_faiss_from_documents(DEFAULT_KB, index_path)
 
                 if ui_state.langsmith_key and ui_state.langsmith_key.strip():
                     os.environ["LANGSMITH_API_KEY"] = ui_state.langsmith_key
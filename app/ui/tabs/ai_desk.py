@@ -101,28 +101,37 @@ def render(index_path: str) -> None:
 
     user_text = st.chat_input("Type your query…")
     if user_text and user_text.strip():
-        with st.spinner("Thinking..."):
-            try:
-                reply, meta = ctrl.ai_desk_chat(
-                    settings=make_llm_settings(
-                        model=ui_state.model,
-                        temperature=ui_state.temperature,
-                        top_p=ui_state.top_p,
-                        max_tokens=2048,
-                    ),
-                    language=RespondLanguage(ui_state.language),
-                    style=RespondStyle(ui_state.style),
-                    user_text=user_text.strip(),
-                    use_web_search=ui_state.enable_web_search,
-                )
-                ui_state.last_tools_used = meta.get("tools_used", [])
-            except Exception as e:
-                error_str = str(e)
-                st.error(f"Error processing your request: {error_str}")
-                error_msg = f"Sorry, I encountered an error: {error_str}"
-                ctrl.llm_client.add_user_message_to_session(
-                    ctrl.session_id, user_text.strip()
-                )
-                ctrl.llm_client.add_ai_message_to_session(ctrl.session_id, error_msg)
+        with transcript:
+            with st.chat_message("user"):
+                st.markdown(user_text.strip())
+            with st.chat_message("assistant"):
+                try:
+                    stream = ctrl.ai_desk_chat_stream(
+                        settings=make_llm_settings(
+                            model=ui_state.model,
+                            temperature=ui_state.temperature,
+                            top_p=ui_state.top_p,
+                            max_tokens=2048,
+                        ),
+                        language=RespondLanguage(ui_state.language),
+                        style=RespondStyle(ui_state.style),
+                        user_text=user_text.strip(),
+                        use_web_search=ui_state.enable_web_search,
+                    )
+                    with st.spinner("Thinking..."):
+                        st.write_stream(
+                            chunk.replace("$", "\\$") for chunk in stream
+                        )
+                    ui_state.last_tools_used = stream.meta.get("tools_used", [])
+                except Exception as e:
+                    error_str = str(e)
+                    st.error(f"Error processing your request: {error_str}")
+                    error_msg = f"Sorry, I encountered an error: {error_str}"
+                    ctrl.llm_client.add_user_message_to_session(
+                        ctrl.session_id, user_text.strip()
+                    )
+                    ctrl.llm_client.add_ai_message_to_session(
+                        ctrl.session_id, error_msg
+                    )
 
         st.rerun()
@@ -12,21 +12,31 @@ down into specific sectors and individual securities.
 
 Key features:
 - Real-time market regime visualization
+- Market breadth across the constituent universe
 - Interactive sector performance charts
 - Individual ticker analysis and comparison
 - Multi-timeframe analysis capabilities
 - Professional market dashboard interface
 """
 
+import logging
+
 import streamlit as st
 
 from core.services.market_data import (
     get_index_snap,
+    get_market_breadth,
     get_sector_perf,
+    get_sector_horizons,
     get_ticker_samples,
     load_sector_data,
 )
-from ui.widgets.charts import market_regime_chart, sector_bar, ticker_comparison_chart
+from ui.widgets.charts import (
+    breadth_chart,
+    market_regime_chart,
+    sector_bar,
+    ticker_comparison_chart,
+)
 from ui.state import ui_session_state
 
 
@@ -156,6 +166,8 @@ def render(index_path: str) -> None:
                 width="stretch",
             )
 
+        _render_breadth()
+
         st.divider()
 
         st.subheader("Sector Strength")
@@ -190,6 +202,18 @@ def render(index_path: str) -> None:
                     f"**{display_name}** ({r['return']:.1%}): "
                     f"{', '.join(tickers) if tickers else 'N/A'}"
                 )
+        with st.expander("🗓️ Sector Returns Across Horizons"):
+            horizon_df = get_sector_horizons()["returns"].mul(100)
+            horizon_df.index = [
+                f"{etf} ({sector_data.get(etf, {}).get('sector_name', etf)})"
+                for etf in horizon_df.index
+            ]
+            st.dataframe(
+                horizon_df.sort_values(analysis_period, ascending=False).style.format(
+                    "{:+.2f}%"
+                ),
+                width="stretch",
+            )
         with st.expander("📚 Sources & Citations"):
             for c in result.citations:
                 st.write(f"- {c}")
@@ -206,39 +230,43 @@ def render(index_path: str) -> None:
             st.subheader("🔍 Ticker Deep Dive")
             st.caption(
                 f"Analyze individual stock performance over the last "
-                f"{analysis_period_name_alt}. More than one ticker supported. "
-                f"Add and analyze one by one."
+                f"{analysis_period_name_alt}. Enter one ticker or a "
+                f"comma-separated watchlist."
             )
 
             ticker_col1, ticker_col2 = st.columns([3, 1])
             with ticker_col1:
-                ticker = (
-                    st.text_input(
-                        "Enter ticker symbol",
+                tickers = [
+                    t.strip().upper()
+                    for t in st.text_input(
+                        "Enter ticker symbols",
                         value="AAPL",
                         key="ticker_input",
-                    )
-                    .strip()
-                    .upper()
-                )
+                    ).split(",")
+                    if t.strip()
+                ]
 
             with ticker_col2:
                 st.write("")
                 st.write("")
                 analyze_ticker = st.button("Analyze", type="primary", width="stretch")
 
-            if analyze_ticker and ticker:
-                with st.spinner(f"Analyzing {ticker}..."):
+            if analyze_ticker and tickers:
+                with st.spinner(f"Analyzing {', '.join(tickers)}..."):
                     ctrl = ui_state.controller
-                    ticker_info = ctrl.run_ticker_deep_dive(
-                        index_path=index_path, ticker=ticker, period=analysis_period
+                    results = ctrl.run_watchlist_deep_dive(
+                        index_path=index_path, tickers=tickers, period=analysis_period
                     )
-                    if ticker_info.analysis.startswith("Error:"):
-                        st.error(f"⚠️ {ticker_info.analysis}")
-                    else:
-                        ui_state.ticker_analyses.append(
-                            {"ticker": ticker, "info": ticker_info}
-                        )
+                    failed = False
+                    for ticker_info in results:
+                        if ticker_info.analysis.startswith("Error:"):
+                            st.error(f"⚠️ {ticker_info.analysis}")
+                            failed = True
+                        else:
+                            ui_state.ticker_analyses.append(
+                                {"ticker": ticker_info.ticker, "info": ticker_info}
+                            )
+                    if not failed:
                         st.rerun()
 
             if ui_state.ticker_analyses:
@@ -318,3 +346,42 @@ def render(index_path: str) -> None:
 
     else:
         st.info("👆 Click **Run Analysis** to generate market insights")
+
+
+def _render_breadth() -> None:
+    """Render breadth metrics and history; omitted when breadth is unavailable."""
+    try:
+        breadth = get_market_breadth()
+    except Exception as e:
+        logging.error(f"Market breadth unavailable: {e}")
+        return
+    summary = breadth["summary"]
+    if not summary.get("as_of"):
+        return
+
+    st.markdown(
+        f"**Market Breadth** ({summary['universe']} stocks, "
+        f"as of {summary['as_of']})"
+    )
+    lookback = summary["lookback"]
+    columns = st.columns(4)
+    for column, window in zip(columns, ("50", "200")):
+        value = summary.get(f"pct_above_{window}")
+        change = summary.get(f"pct_above_{window}_change")
+        column.metric(
+            f"Above {window}-day MA",
+            "N/A" if value is None else f"{value:.0f}%",
+            None if change is None else f"{change:+.1f} pts ({lookback}d)",
+        )
+    columns[2].metric(
+        "A/D Line",
+        f"{summary['ad_line']:,}",
+        f"{summary['ad_line_change']:+,} ({lookback}d)",
+    )
+    columns[3].metric(
+        "New Highs / Lows",
+        f"{summary['new_highs']} / {summary['new_lows']}",
+        f"{summary['net_new_highs']:+d} net",
+    )
+    with st.expander("📊 Breadth History"):
+        st.plotly_chart(breadth_chart(breadth["history"].tail(252)), width="stretch")
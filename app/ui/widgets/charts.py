@@ -382,3 +382,62 @@ def ticker_comparison_chart(
     fig.update_layout(hovermode="x unified")
 
     return fig
+
+
+def breadth_chart(
+    history: pd.DataFrame,
+    title: str = "Market Breadth",
+    subtitle: str = "share of stocks above moving averages and advance/decline line",
+) -> go.Figure:
+    """
+    Create market breadth chart with percent-above lines and the A/D line.
+
+    Parameters
+    ----------
+    history : pd.DataFrame
+        Breadth history with pct_above_<n> and ad_line columns, indexed by date
+    title : str
+        Chart title
+    subtitle : str
+        Chart subtitle
+
+    Returns
+    -------
+    go.Figure
+        Styled Plotly figure with the A/D line on a secondary axis
+    """
+    fig = go.Figure()
+    pct_columns = [c for c in history.columns if c.startswith("pct_above_")]
+    for i, col in enumerate(pct_columns):
+        name = f"% above {col.removeprefix('pct_above_')}-day MA"
+        fig.add_trace(
+            go.Scatter(
+                x=history.index,
+                y=history[col],
+                mode="lines",
+                name=name,
+                line=dict(width=2.5, color=pastel_colors[i % len(pastel_colors)]),
+                hovertemplate=f"%{{y:.1f}}%<br>{name}<br>%{{x}}<extra></extra>",
+            )
+        )
+    if "ad_line" in history.columns:
+        fig.add_trace(
+            go.Scatter(
+                x=history.index,
+                y=history["ad_line"],
+                mode="lines",
+                name="A/D line",
+                yaxis="y2",
+                line=dict(width=2, color=PASTEL_COLORS_RGB["neutral_grey"]),
+                hovertemplate="%{y:,.0f}<br>A/D line<br>%{x}<extra></extra>",
+            )
+        )
+
+    _apply_standard_layout(fig, title, subtitle)
+    fig.update_layout(
+        yaxis=dict(title_text="Stocks above MA (%)", range=[0, 100]),
+        yaxis2=dict(title_text="A/D line", overlaying="y", side="right"),
+    )
+    fig.update_xaxes(tickformat="%Y-%m-%d")
+
+    return fig